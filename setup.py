@@ -85,7 +85,7 @@ setup(
         # not have all of the typing features we use
         'typing_extensions>=4.0;python_version<"3.10"',
     ],
-    extras_require={"dev": DEV_REQUIREMENTS},
+    extras_require={"dev": DEV_REQUIREMENTS, "orjson": ["orjson>=3.0"]},
     keywords=["globus"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
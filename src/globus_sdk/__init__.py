@@ -32,8 +32,10 @@ _LAZY_IMPORT_TABLE = {
     },
     "exc": {
         "GlobusAPIError",
+        "GlobusCircuitOpenError",
         "GlobusConnectionError",
         "GlobusConnectionTimeoutError",
+        "GlobusDeadlineExceededError",
         "GlobusError",
         "GlobusSDKUsageError",
         "GlobusTimeoutError",
@@ -50,10 +52,12 @@ _LAZY_IMPORT_TABLE = {
         "AuthAPIError",
         "AuthClient",
         "ConfidentialAppAuthClient",
+        "DependentTokenCache",
         "IdentityMap",
         "NativeAppAuthClient",
         "OAuthDependentTokenResponse",
         "OAuthTokenResponse",
+        "TokenIntrospectionCache",
     },
     "services.gcs": {
         "CollectionDocument",
@@ -119,8 +123,10 @@ if typing.TYPE_CHECKING or sys.version_info < (3, 7):
     from .authorizers import RefreshTokenAuthorizer
     from .client import BaseClient
     from .exc import GlobusAPIError
+    from .exc import GlobusCircuitOpenError
     from .exc import GlobusConnectionError
     from .exc import GlobusConnectionTimeoutError
+    from .exc import GlobusDeadlineExceededError
     from .exc import GlobusError
     from .exc import GlobusSDKUsageError
     from .exc import GlobusTimeoutError
@@ -131,10 +137,12 @@ if typing.TYPE_CHECKING or sys.version_info < (3, 7):
     from .services.auth import AuthAPIError
     from .services.auth import AuthClient
     from .services.auth import ConfidentialAppAuthClient
+    from .services.auth import DependentTokenCache
     from .services.auth import IdentityMap
     from .services.auth import NativeAppAuthClient
     from .services.auth import OAuthDependentTokenResponse
     from .services.auth import OAuthTokenResponse
+    from .services.auth import TokenIntrospectionCache
     from .services.gcs import CollectionDocument
     from .services.gcs import GCSAPIError
     from .services.gcs import GCSClient
@@ -201,8 +209,10 @@ __all__ = (
     "RefreshTokenAuthorizer",
     "BaseClient",
     "GlobusAPIError",
+    "GlobusCircuitOpenError",
     "GlobusConnectionError",
     "GlobusConnectionTimeoutError",
+    "GlobusDeadlineExceededError",
     "GlobusError",
     "GlobusSDKUsageError",
     "GlobusTimeoutError",
@@ -213,10 +223,12 @@ __all__ = (
     "AuthAPIError",
     "AuthClient",
     "ConfidentialAppAuthClient",
+    "DependentTokenCache",
     "IdentityMap",
     "NativeAppAuthClient",
     "OAuthDependentTokenResponse",
     "OAuthTokenResponse",
+    "TokenIntrospectionCache",
     "CollectionDocument",
     "GCSAPIError",
     "GCSClient",
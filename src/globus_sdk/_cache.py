@@ -0,0 +1,130 @@
+import collections
+import threading
+import time
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats:
+    """
+    Counters describing the use of a cache.
+
+    :ivar hits: The number of lookups which found a live entry
+    :ivar misses: The number of lookups which did not find a live entry
+    :ivar evictions: The number of entries dropped to stay within the maximum size
+    :ivar expirations: The number of entries dropped because they expired
+    :ivar invalidations: The number of entries dropped by explicit invalidation
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups which were hits, or 0 if there were none"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, expirations={self.expirations}, "
+            f"invalidations={self.invalidations})"
+        )
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A mapping from keys to values which expire after a time to live, holding at most
+    ``maxsize`` entries. When full, the least recently used entry is evicted.
+
+    Times are measured with ``time.monotonic``.
+
+    :param maxsize: The maximum number of entries
+    :param ttl: The default number of seconds for which an entry lives, or None for
+        entries which only leave the cache by eviction or invalidation
+    """
+
+    def __init__(self, *, maxsize: int, ttl: Optional[float] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("cache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # key -> (expiry time or None, value), ordered from least to most recently used
+        self._data: "collections.OrderedDict[K, Tuple[Optional[float], V]]" = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get the value for a key, or None if it is missing or has expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._data[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: K, value: V, *, ttl: Optional[float] = None) -> None:
+        """
+        Store a value. ``ttl`` overrides the default time to live for this entry.
+        An entry whose time to live is not positive is not stored.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        """
+        Drop the entry for a key. Returns True if there was one.
+        """
+        with self._lock:
+            if self._data.pop(key, None) is None:
+                return False
+            self.stats.invalidations += 1
+            return True
+
+    def invalidate_matching(self, predicate: Callable[[K], bool]) -> int:
+        """
+        Drop all entries whose keys match a predicate. Returns the number dropped.
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop all entries. Statistics are not reset.
+        """
+        with self._lock:
+            self.stats.invalidations += len(self._data)
+            self._data.clear()
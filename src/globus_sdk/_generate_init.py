@@ -51,8 +51,10 @@ _LAZY_IMPORT_TABLE: List[Tuple[str, Tuple[str, ...]]] = [
         "exc",
         (
             "GlobusAPIError",
+            "GlobusCircuitOpenError",
             "GlobusConnectionError",
             "GlobusConnectionTimeoutError",
+            "GlobusDeadlineExceededError",
             "GlobusError",
             "GlobusSDKUsageError",
             "GlobusTimeoutError",
@@ -73,10 +75,12 @@ _LAZY_IMPORT_TABLE: List[Tuple[str, Tuple[str, ...]]] = [
             "AuthAPIError",
             "AuthClient",
             "ConfidentialAppAuthClient",
+            "DependentTokenCache",
             "IdentityMap",
             "NativeAppAuthClient",
             "OAuthDependentTokenResponse",
             "OAuthTokenResponse",
+            "TokenIntrospectionCache",
         ),
     ),
     (
@@ -0,0 +1,26 @@
+from .client import AsyncBaseClient, blocking_method
+from .paging import AsyncPaginator
+from .services import (
+    AsyncAuthClient,
+    AsyncConfidentialAppAuthClient,
+    AsyncGCSClient,
+    AsyncGroupsClient,
+    AsyncNativeAppAuthClient,
+    AsyncSearchClient,
+    AsyncTimerClient,
+    AsyncTransferClient,
+)
+
+__all__ = (
+    "AsyncBaseClient",
+    "blocking_method",
+    "AsyncPaginator",
+    "AsyncAuthClient",
+    "AsyncNativeAppAuthClient",
+    "AsyncConfidentialAppAuthClient",
+    "AsyncGCSClient",
+    "AsyncGroupsClient",
+    "AsyncSearchClient",
+    "AsyncTimerClient",
+    "AsyncTransferClient",
+)
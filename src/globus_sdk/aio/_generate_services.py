@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""
+Generate ``services.py``, which declares an async client for each service client,
+with a coroutine method for each of its methods which sends a request.
+
+A method sends a request if it is annotated to return a ``GlobusHTTPResponse`` (alone
+or in a union), or if it is named in ``BLOCKING_METHODS``.
+"""
+import importlib
+import inspect
+import pathlib
+import sys
+import typing
+from typing import Dict, Iterator, List, Tuple, Type
+
+HERE = pathlib.Path(__file__).parent
+
+MAX_LINE_LENGTH = 88
+
+FIXED_PREAMBLE = """\
+# isort:skip_file
+# fmt:off
+#
+# this services.py file is generated by _generate_services.py
+# do not edit it directly or testing will fail"""
+
+# the service clients which have async variants, by module
+_CLIENTS: List[Tuple[str, Tuple[str, ...]]] = [
+    (
+        "globus_sdk.services.auth",
+        ("AuthClient", "NativeAppAuthClient", "ConfidentialAppAuthClient"),
+    ),
+    ("globus_sdk.services.gcs", ("GCSClient",)),
+    ("globus_sdk.services.groups", ("GroupsClient",)),
+    ("globus_sdk.services.search", ("SearchClient",)),
+    ("globus_sdk.services.timer", ("TimerClient",)),
+    ("globus_sdk.services.transfer", ("TransferClient",)),
+]
+
+# the names of methods which send requests, but do not return a GlobusHTTPResponse
+BLOCKING_METHODS = frozenset({"get_jwk", "task_wait"})
+
+
+def _sends_request(client_class: type, name: str) -> bool:
+    if name in BLOCKING_METHODS:
+        return True
+    hints = typing.get_type_hints(getattr(client_class, name))
+    annotation = hints.get("return")
+    candidates = getattr(annotation, "__args__", None) or (annotation,)
+
+    from globus_sdk.response import GlobusHTTPResponse
+
+    return any(
+        isinstance(candidate, type) and issubclass(candidate, GlobusHTTPResponse)
+        for candidate in candidates
+    )
+
+
+def _own_method_names(client_class: type, base: type) -> Iterator[str]:
+    """
+    The names of the public methods of a class which are not inherited from ``base``,
+    in the order in which they are defined.
+    """
+    seen = set()
+    for cls in reversed(client_class.__mro__):
+        if issubclass(base, cls):
+            continue
+        for name, value in vars(cls).items():
+            if name not in seen and not name.startswith("_"):
+                if inspect.isfunction(value):
+                    seen.add(name)
+                    yield name
+
+
+def _wrap_line(prefix: str, inner: str, suffix: str, indent: int) -> Iterator[str]:
+    # format a call as black would, splitting it if it is too long
+    pad = " " * indent
+    line = f"{pad}{prefix}{inner}{suffix}"
+    if len(line) <= MAX_LINE_LENGTH:
+        yield line
+    else:
+        yield f"{pad}{prefix}"
+        yield f"{pad}    {inner}"
+        yield f"{pad}{suffix}"
+
+
+def _generate_imports() -> Iterator[str]:
+    yield "from typing import Type"
+    yield ""
+    yield "from globus_sdk.client import BaseClient"
+    for modname, names in _CLIENTS:
+        inner = ", ".join(names)
+        line = f"from {modname} import {inner}"
+        if len(line) <= MAX_LINE_LENGTH:
+            yield line
+        else:
+            yield f"from {modname} import ("
+            for name in names:
+                yield f"    {name},"
+            yield ")"
+    yield ""
+    yield "from .client import AsyncBaseClient, blocking_method"
+
+
+def _generate_class(name: str, client_classes: Dict[str, type]) -> Iterator[str]:
+    from globus_sdk.client import BaseClient
+
+    client_class = client_classes[name]
+    # an async client inherits from the async variant of the parent of its client
+    # class, if there is one, and only declares the methods which differ from it
+    parent = client_class.__bases__[0]
+    if parent.__name__ in client_classes and parent is not BaseClient:
+        async_parent = f"Async{parent.__name__}"
+    else:
+        parent, async_parent = BaseClient, "AsyncBaseClient"
+
+    yield ""
+    yield ""
+    yield f"class Async{name}({async_parent}):"
+    yield '    """'
+    ref = f":class:`{name} <globus_sdk.{name}>`."
+    line = f"    An ``asyncio`` variant of {ref}"
+    if len(line) <= MAX_LINE_LENGTH:
+        yield line
+    else:
+        yield f"    An ``asyncio`` variant of :class:`{name} \\"
+        yield f"    <globus_sdk.{name}>`."
+    yield '    """'
+    yield ""
+    # declared with the type of the base class, as the constructor of a client class
+    # may differ from that of its parent
+    yield f"    client_class: Type[BaseClient] = {name}"
+    methods = [
+        method
+        for method in _own_method_names(client_class, parent)
+        if _sends_request(client_class, method)
+    ]
+    if methods:
+        yield ""
+    for method in methods:
+        yield from _wrap_line(
+            f"{method} = blocking_method(", f"{name}.{method}", ")", indent=4
+        )
+
+
+def _services_pieces() -> Iterator[str]:
+    client_classes: Dict[str, Type[typing.Any]] = {}
+    for modname, names in _CLIENTS:
+        module = importlib.import_module(modname)
+        for name in names:
+            client_classes[name] = getattr(module, name)
+
+    yield FIXED_PREAMBLE
+    yield from _generate_imports()
+    for name in client_classes:
+        yield from _generate_class(name, client_classes)
+
+
+def generate_services() -> str:
+    return "\n".join(_services_pieces()) + "\n"
+
+
+def main() -> None:
+    with open(HERE / "services.py", "w", encoding="utf-8") as fp:
+        fp.write(generate_services())
+
+
+if __name__ == "__main__":
+    # the generator imports the SDK to inspect the client classes
+    sys.path.insert(0, str(HERE.parent.parent))
+    main()
@@ -0,0 +1,332 @@
+import concurrent.futures
+import functools
+import logging
+import sys
+from typing import Any, Callable, Coroutine, Dict, Optional, Type, TypeVar, cast
+
+from globus_sdk import utils
+from globus_sdk.client import BaseClient, DataParamType
+from globus_sdk.response import GlobusHTTPResponse
+from globus_sdk.transport import AsyncTransport
+
+from .paging import AsyncPaginatorTable
+
+if sys.version_info >= (3, 10):
+    from typing import Concatenate, ParamSpec
+else:
+    from typing_extensions import Concatenate, ParamSpec
+
+log = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def blocking_method(
+    method: Callable[Concatenate[Any, P], R]
+) -> Callable[Concatenate["AsyncBaseClient", P], Coroutine[Any, Any, R]]:
+    """
+    Make a coroutine function from a method of a synchronous client, which runs the
+    method of the wrapped client in the thread pool of the ``AsyncTransport``. The
+    coroutine function has the same parameters and result type as the method.
+
+    The method holds a thread of the pool until it returns, including while it waits
+    between retries, as it runs the synchronous transport.
+
+    The method is looked up on the wrapped client by name when it is called, so that
+    overrides in subclasses of the ``client_class`` are used.
+
+    :param method: The method of the synchronous client class, e.g.
+        ``TransferClient.get_task``
+    :type method: callable
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapped(self: "AsyncBaseClient", *args: P.args, **kwargs: P.kwargs) -> R:
+        result = await self.async_transport.run_in_executor(
+            getattr(self.client, name), *args, **kwargs
+        )
+        return cast(R, result)
+
+    # `self` is named here, but positional-only in the declared type
+    return cast(
+        Callable[Concatenate["AsyncBaseClient", P], Coroutine[Any, Any, R]], wrapped
+    )
+
+
+class AsyncBaseClient:
+    r"""
+    Abstract base class for ``asyncio`` clients for Globus APIs.
+
+    An async client wraps an instance of a synchronous client class, its
+    ``client_class``, which is constructed from the same arguments as the async client.
+    The async client then provides two kinds of methods:
+
+    - the low level interface, ``get``, ``put``, ``post``, ``patch``, ``delete``, and
+      ``request``, is implemented with an
+      :class:`AsyncTransport <globus_sdk.transport.AsyncTransport>` over the wrapped
+      client's transport, so retries and backoff are handled on the event loop
+
+    - the methods of the wrapped client which send requests are available as
+      coroutine functions of the same name, with the same parameters and result
+      types. Each service client declares them with :func:`blocking_method`
+
+    Paginated methods are available under ``paginated``, as for synchronous clients,
+    and return an :class:`AsyncPaginator <globus_sdk.aio.AsyncPaginator>`, whose
+    pages and items are iterated with ``async for``.
+
+    Other attributes of the wrapped client, such as ``base_url``, ``authorizer``,
+    ``transport``, or methods which do not send requests (e.g.
+    ``oauth2_get_authorize_url``), are read from the wrapped client as they are.
+
+    .. warning::
+
+        Only the low level interface waits between retries on the event loop. The
+        service methods, e.g. ``get_task``, run the whole synchronous method in the
+        thread pool of the ``AsyncTransport``, so each call holds a thread until it
+        returns, including while it waits to retry or for a rate limit. Running many
+        of them at once is limited by ``max_workers``, not by the event loop. Each
+        page of a paginated method is fetched in the same way
+
+    Requests are sent with ``requests`` in a pool of threads, rather than with event
+    loop I/O, so at most ``max_workers`` requests are in flight at once. Unless a
+    ``session`` or ``pool_maxsize`` is given in the ``transport_params``, the
+    connection pool of the wrapped client's transport is sized to match.
+
+    :param executor: The executor used to run blocking calls. By default, the
+        ``AsyncTransport`` creates its own pool of threads
+    :type executor: concurrent.futures.Executor, optional
+    :param max_workers: The number of threads used to run blocking calls, when no
+        ``executor`` is given. Defaults to
+        :attr:`AsyncTransport.DEFAULT_MAX_WORKERS \
+        <globus_sdk.transport.AsyncTransport.DEFAULT_MAX_WORKERS>`
+    :type max_workers: int, optional
+
+    All other parameters are passed to the ``client_class``.
+    """
+
+    #: the class of the synchronous client which this async client wraps
+    client_class: Type[BaseClient] = BaseClient
+
+    def __init__(
+        self,
+        *args: Any,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        if executor is None:
+            # allow a connection for each thread, rather than opening and discarding
+            # connections beyond the default pool size
+            transport_params = dict(kwargs.get("transport_params") or {})
+            if "session" not in transport_params:
+                transport_params.setdefault(
+                    "pool_maxsize",
+                    max_workers or AsyncTransport.DEFAULT_MAX_WORKERS,
+                )
+                kwargs["transport_params"] = transport_params
+        self.client = self.client_class(*args, **kwargs)
+        self.async_transport = AsyncTransport(
+            self.client.transport, executor=executor, max_workers=max_workers
+        )
+        # setup paginated methods
+        self.paginated = AsyncPaginatorTable(self)
+        log.debug(f"initialized async client wrapping {type(self.client)}")
+
+    def __getattr__(self, name: str) -> Any:
+        # guard against lookups before `client` is set, e.g. during unpickling
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    async def get(
+        self,
+        path: str,
+        *,
+        query_params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        use_response_cache: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a GET request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+
+        :return: :class:`GlobusHTTPResponse \
+        <globus_sdk.response.GlobusHTTPResponse>` object
+        """
+        log.debug(f"GET to {path} with query_params {query_params}")
+        return await self.request(
+            "GET",
+            path,
+            query_params=query_params,
+            headers=headers,
+            use_response_cache=use_response_cache,
+            deadline=deadline,
+        )
+
+    async def post(
+        self,
+        path: str,
+        *,
+        query_params: Optional[Dict[str, Any]] = None,
+        data: DataParamType = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a POST request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+
+        :return: :class:`GlobusHTTPResponse \
+        <globus_sdk.response.GlobusHTTPResponse>` object
+        """
+        log.debug(f"POST to {path} with query_params {query_params}")
+        return await self.request(
+            "POST",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+            deadline=deadline,
+        )
+
+    async def delete(
+        self,
+        path: str,
+        *,
+        query_params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a DELETE request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+
+        :return: :class:`GlobusHTTPResponse \
+        <globus_sdk.response.GlobusHTTPResponse>` object
+        """
+        log.debug(f"DELETE to {path} with query_params {query_params}")
+        return await self.request(
+            "DELETE",
+            path,
+            query_params=query_params,
+            headers=headers,
+            deadline=deadline,
+        )
+
+    async def put(
+        self,
+        path: str,
+        *,
+        query_params: Optional[Dict[str, Any]] = None,
+        data: DataParamType = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a PUT request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+
+        :return: :class:`GlobusHTTPResponse \
+        <globus_sdk.response.GlobusHTTPResponse>` object
+        """
+        log.debug(f"PUT to {path} with query_params {query_params}")
+        return await self.request(
+            "PUT",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+            deadline=deadline,
+        )
+
+    async def patch(
+        self,
+        path: str,
+        *,
+        query_params: Optional[Dict[str, Any]] = None,
+        data: DataParamType = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Make a PATCH request to the specified path.
+
+        See :py:meth:`~.AsyncBaseClient.request` for details on the various parameters.
+
+        :return: :class:`GlobusHTTPResponse \
+        <globus_sdk.response.GlobusHTTPResponse>` object
+        """
+        log.debug(f"PATCH to {path} with query_params {query_params}")
+        return await self.request(
+            "PATCH",
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            encoding=encoding,
+            deadline=deadline,
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query_params: Optional[Dict[str, Any]] = None,
+        data: DataParamType = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        deadline: Optional[float] = None,
+        use_response_cache: Optional[bool] = None,
+    ) -> GlobusHTTPResponse:
+        """
+        Send an HTTP request
+
+        The parameters are the same as those of
+        :py:meth:`BaseClient.request <globus_sdk.BaseClient.request>`.
+
+        :return: :class:`GlobusHTTPResponse \
+        <globus_sdk.response.GlobusHTTPResponse>` object
+
+        :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
+            request is received and has a status code in the 4xx or 5xx categories
+        """
+        rheaders = {**headers} if headers else {}
+        url = self.client._resolve_url(path)
+
+        log.debug("async request will hit URL: %s", url)
+        r = await self.async_transport.request(
+            method=method,
+            url=url,
+            data=data.data if isinstance(data, utils.PayloadWrapper) else data,
+            query_params=query_params,
+            headers=rheaders,
+            encoding=encoding,
+            authorizer=self.client.authorizer,
+            allow_redirects=allow_redirects,
+            stream=stream,
+            deadline=deadline,
+            use_response_cache=use_response_cache,
+        )
+        log.debug("async request made to URL: %s", r.url)
+
+        if 200 <= r.status_code < 400:
+            log.debug(f"request completed with response code: {r.status_code}")
+            return GlobusHTTPResponse(r, self.client)
+
+        log.debug(f"request completed with (error) response code: {r.status_code}")
+        raise self.client._make_error(r)
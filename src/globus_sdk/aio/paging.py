@@ -0,0 +1,122 @@
+import functools
+import inspect
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generic
+
+from globus_sdk.paging import Paginator
+from globus_sdk.paging.base import PageT
+from globus_sdk.transport import AsyncTransport
+
+if TYPE_CHECKING:
+    from .client import AsyncBaseClient
+
+# returned by `next()` in the executor when a paginator has no more pages, as
+# StopIteration cannot be raised through a Future
+_NO_MORE_PAGES: Any = object()
+
+
+class AsyncPaginator(Generic[PageT]):
+    """
+    An async iterable of the pages produced by a synchronous :class:`Paginator
+    <globus_sdk.paging.Paginator>`.
+
+    Each page is fetched in the thread pool of the ``AsyncTransport``, so a thread is
+    held while a page is fetched, but not while the consumer handles it.
+
+    Iterating on an ``AsyncPaginator`` with ``async for`` is equivalent to iterating on
+    its ``pages``.
+
+    :param paginator: The synchronous paginator
+    :type paginator: :class:`Paginator <globus_sdk.paging.Paginator>`
+    :param async_transport: The transport whose thread pool fetches the pages
+    :type async_transport: :class:`AsyncTransport \
+        <globus_sdk.transport.AsyncTransport>`
+    """
+
+    def __init__(
+        self, paginator: Paginator[PageT], async_transport: AsyncTransport
+    ) -> None:
+        self.paginator = paginator
+        self.async_transport = async_transport
+
+    def __aiter__(self) -> AsyncIterator[PageT]:
+        return self.pages()
+
+    async def pages(self) -> AsyncIterator[PageT]:
+        """``pages()`` yields GlobusHTTPResponse objects, each one representing a page
+        of results."""
+        pages = self.paginator.pages()
+        try:
+            while True:
+                page = await self.async_transport.run_in_executor(
+                    next, pages, _NO_MORE_PAGES
+                )
+                if page is _NO_MORE_PAGES:
+                    return
+                yield page
+        finally:
+            # stop a paginator which is a generator, unless it is still fetching a
+            # page on another thread, e.g. because the consumer was cancelled
+            if (
+                inspect.isgenerator(pages)
+                and inspect.getgeneratorstate(pages) != inspect.GEN_RUNNING
+            ):
+                pages.close()
+
+    async def items(self) -> AsyncIterator[Any]:
+        """
+        ``items()`` yields each item in each page of results.
+
+        ``items()`` may raise a ``ValueError`` if the paginator was constructed without
+        identifying a key for use within each page of results.
+
+        **Examples**
+
+        >>> tc = AsyncTransferClient(...)
+        >>> async for task in tc.paginated.task_list().items():
+        >>>     print(task["task_id"])
+        """
+        items_key = self.paginator.items_key
+        if items_key is None:
+            raise ValueError(
+                "Cannot provide items() iteration on a paginator where 'items_key' "
+                "is not set."
+            )
+        async for page in self.pages():
+            for item in page[items_key]:
+                yield item
+
+
+class AsyncPaginatorTable:
+    """
+    The paginated methods of an async client, under its ``paginated`` attribute.
+
+    Given a paginated method ``foo`` of the wrapped client,
+    ``async_client.paginated.foo(...)`` takes the same arguments as
+    ``client.paginated.foo(...)`` and returns an :class:`AsyncPaginator`.
+
+    >>> async for page in async_client.paginated.foo():
+    >>>     print(page.data)
+
+    An ``AsyncPaginatorTable`` is built automatically when an async client is
+    created. Creation of ``AsyncPaginatorTable`` objects is considered a private API.
+    """
+
+    def __init__(self, client: "AsyncBaseClient"):
+        self._client = client
+
+    def __getattr__(self, attrname: str) -> Callable[..., AsyncPaginator[Any]]:
+        # guard against lookups before `_client` is set, e.g. during unpickling
+        if attrname == "_client":
+            raise AttributeError(attrname)
+        # this raises AttributeError if the method is not paginated
+        paginated_method: Callable[..., Paginator[Any]] = getattr(
+            self._client.client.paginated, attrname
+        )
+
+        @functools.wraps(paginated_method)
+        def async_paginated_method(*args: Any, **kwargs: Any) -> AsyncPaginator[Any]:
+            return AsyncPaginator(
+                paginated_method(*args, **kwargs), self._client.async_transport
+            )
+
+        return async_paginated_method
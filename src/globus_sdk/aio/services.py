@@ -0,0 +1,279 @@
+# isort:skip_file
+# fmt:off
+#
+# this services.py file is generated by _generate_services.py
+# do not edit it directly or testing will fail
+from typing import Type
+
+from globus_sdk.client import BaseClient
+from globus_sdk.services.auth import (
+    AuthClient,
+    NativeAppAuthClient,
+    ConfidentialAppAuthClient,
+)
+from globus_sdk.services.gcs import GCSClient
+from globus_sdk.services.groups import GroupsClient
+from globus_sdk.services.search import SearchClient
+from globus_sdk.services.timer import TimerClient
+from globus_sdk.services.transfer import TransferClient
+
+from .client import AsyncBaseClient, blocking_method
+
+
+class AsyncAuthClient(AsyncBaseClient):
+    """
+    An ``asyncio`` variant of :class:`AuthClient <globus_sdk.AuthClient>`.
+    """
+
+    client_class: Type[BaseClient] = AuthClient
+
+    get_identities = blocking_method(AuthClient.get_identities)
+    oauth2_exchange_code_for_tokens = blocking_method(
+        AuthClient.oauth2_exchange_code_for_tokens
+    )
+    oauth2_refresh_token = blocking_method(AuthClient.oauth2_refresh_token)
+    oauth2_validate_token = blocking_method(AuthClient.oauth2_validate_token)
+    oauth2_revoke_token = blocking_method(AuthClient.oauth2_revoke_token)
+    oauth2_token = blocking_method(AuthClient.oauth2_token)
+    oauth2_userinfo = blocking_method(AuthClient.oauth2_userinfo)
+    get_openid_configuration = blocking_method(AuthClient.get_openid_configuration)
+    get_jwk = blocking_method(AuthClient.get_jwk)
+
+
+class AsyncNativeAppAuthClient(AsyncAuthClient):
+    """
+    An ``asyncio`` variant of :class:`NativeAppAuthClient \
+    <globus_sdk.NativeAppAuthClient>`.
+    """
+
+    client_class: Type[BaseClient] = NativeAppAuthClient
+
+    oauth2_refresh_token = blocking_method(NativeAppAuthClient.oauth2_refresh_token)
+
+
+class AsyncConfidentialAppAuthClient(AsyncAuthClient):
+    """
+    An ``asyncio`` variant of :class:`ConfidentialAppAuthClient \
+    <globus_sdk.ConfidentialAppAuthClient>`.
+    """
+
+    client_class: Type[BaseClient] = ConfidentialAppAuthClient
+
+    oauth2_client_credentials_tokens = blocking_method(
+        ConfidentialAppAuthClient.oauth2_client_credentials_tokens
+    )
+    oauth2_get_dependent_tokens = blocking_method(
+        ConfidentialAppAuthClient.oauth2_get_dependent_tokens
+    )
+    oauth2_token_introspect = blocking_method(
+        ConfidentialAppAuthClient.oauth2_token_introspect
+    )
+
+
+class AsyncGCSClient(AsyncBaseClient):
+    """
+    An ``asyncio`` variant of :class:`GCSClient <globus_sdk.GCSClient>`.
+    """
+
+    client_class: Type[BaseClient] = GCSClient
+
+    get_collection_list = blocking_method(GCSClient.get_collection_list)
+    get_collection = blocking_method(GCSClient.get_collection)
+    create_collection = blocking_method(GCSClient.create_collection)
+    update_collection = blocking_method(GCSClient.update_collection)
+    delete_collection = blocking_method(GCSClient.delete_collection)
+    get_storage_gateway_list = blocking_method(GCSClient.get_storage_gateway_list)
+    create_storage_gateway = blocking_method(GCSClient.create_storage_gateway)
+    get_storage_gateway = blocking_method(GCSClient.get_storage_gateway)
+    update_storage_gateway = blocking_method(GCSClient.update_storage_gateway)
+    delete_storage_gateway = blocking_method(GCSClient.delete_storage_gateway)
+    get_role_list = blocking_method(GCSClient.get_role_list)
+    create_role = blocking_method(GCSClient.create_role)
+    get_role = blocking_method(GCSClient.get_role)
+    delete_role = blocking_method(GCSClient.delete_role)
+    get_user_credential_list = blocking_method(GCSClient.get_user_credential_list)
+    create_user_credential = blocking_method(GCSClient.create_user_credential)
+    get_user_credential = blocking_method(GCSClient.get_user_credential)
+    update_user_credential = blocking_method(GCSClient.update_user_credential)
+    delete_user_credential = blocking_method(GCSClient.delete_user_credential)
+
+
+class AsyncGroupsClient(AsyncBaseClient):
+    """
+    An ``asyncio`` variant of :class:`GroupsClient <globus_sdk.GroupsClient>`.
+    """
+
+    client_class: Type[BaseClient] = GroupsClient
+
+    get_my_groups = blocking_method(GroupsClient.get_my_groups)
+    get_group = blocking_method(GroupsClient.get_group)
+    delete_group = blocking_method(GroupsClient.delete_group)
+    create_group = blocking_method(GroupsClient.create_group)
+    update_group = blocking_method(GroupsClient.update_group)
+    get_group_policies = blocking_method(GroupsClient.get_group_policies)
+    set_group_policies = blocking_method(GroupsClient.set_group_policies)
+    get_identity_preferences = blocking_method(GroupsClient.get_identity_preferences)
+    set_identity_preferences = blocking_method(GroupsClient.set_identity_preferences)
+    get_membership_fields = blocking_method(GroupsClient.get_membership_fields)
+    set_membership_fields = blocking_method(GroupsClient.set_membership_fields)
+    batch_membership_action = blocking_method(GroupsClient.batch_membership_action)
+
+
+class AsyncSearchClient(AsyncBaseClient):
+    """
+    An ``asyncio`` variant of :class:`SearchClient <globus_sdk.SearchClient>`.
+    """
+
+    client_class: Type[BaseClient] = SearchClient
+
+    get_index = blocking_method(SearchClient.get_index)
+    search = blocking_method(SearchClient.search)
+    post_search = blocking_method(SearchClient.post_search)
+    scroll = blocking_method(SearchClient.scroll)
+    ingest = blocking_method(SearchClient.ingest)
+    delete_by_query = blocking_method(SearchClient.delete_by_query)
+    get_subject = blocking_method(SearchClient.get_subject)
+    delete_subject = blocking_method(SearchClient.delete_subject)
+    get_entry = blocking_method(SearchClient.get_entry)
+    create_entry = blocking_method(SearchClient.create_entry)
+    update_entry = blocking_method(SearchClient.update_entry)
+    delete_entry = blocking_method(SearchClient.delete_entry)
+    get_task = blocking_method(SearchClient.get_task)
+    get_task_list = blocking_method(SearchClient.get_task_list)
+    create_role = blocking_method(SearchClient.create_role)
+    get_role_list = blocking_method(SearchClient.get_role_list)
+    delete_role = blocking_method(SearchClient.delete_role)
+
+
+class AsyncTimerClient(AsyncBaseClient):
+    """
+    An ``asyncio`` variant of :class:`TimerClient <globus_sdk.TimerClient>`.
+    """
+
+    client_class: Type[BaseClient] = TimerClient
+
+    list_jobs = blocking_method(TimerClient.list_jobs)
+    get_job = blocking_method(TimerClient.get_job)
+    create_job = blocking_method(TimerClient.create_job)
+    update_job = blocking_method(TimerClient.update_job)
+    delete_job = blocking_method(TimerClient.delete_job)
+
+
+class AsyncTransferClient(AsyncBaseClient):
+    """
+    An ``asyncio`` variant of :class:`TransferClient <globus_sdk.TransferClient>`.
+    """
+
+    client_class: Type[BaseClient] = TransferClient
+
+    get_endpoint = blocking_method(TransferClient.get_endpoint)
+    update_endpoint = blocking_method(TransferClient.update_endpoint)
+    create_endpoint = blocking_method(TransferClient.create_endpoint)
+    delete_endpoint = blocking_method(TransferClient.delete_endpoint)
+    endpoint_search = blocking_method(TransferClient.endpoint_search)
+    endpoint_autoactivate = blocking_method(TransferClient.endpoint_autoactivate)
+    endpoint_deactivate = blocking_method(TransferClient.endpoint_deactivate)
+    endpoint_activate = blocking_method(TransferClient.endpoint_activate)
+    endpoint_get_activation_requirements = blocking_method(
+        TransferClient.endpoint_get_activation_requirements
+    )
+    my_effective_pause_rule_list = blocking_method(
+        TransferClient.my_effective_pause_rule_list
+    )
+    my_shared_endpoint_list = blocking_method(TransferClient.my_shared_endpoint_list)
+    get_shared_endpoint_list = blocking_method(TransferClient.get_shared_endpoint_list)
+    create_shared_endpoint = blocking_method(TransferClient.create_shared_endpoint)
+    endpoint_server_list = blocking_method(TransferClient.endpoint_server_list)
+    get_endpoint_server = blocking_method(TransferClient.get_endpoint_server)
+    add_endpoint_server = blocking_method(TransferClient.add_endpoint_server)
+    update_endpoint_server = blocking_method(TransferClient.update_endpoint_server)
+    delete_endpoint_server = blocking_method(TransferClient.delete_endpoint_server)
+    endpoint_role_list = blocking_method(TransferClient.endpoint_role_list)
+    add_endpoint_role = blocking_method(TransferClient.add_endpoint_role)
+    get_endpoint_role = blocking_method(TransferClient.get_endpoint_role)
+    delete_endpoint_role = blocking_method(TransferClient.delete_endpoint_role)
+    endpoint_acl_list = blocking_method(TransferClient.endpoint_acl_list)
+    get_endpoint_acl_rule = blocking_method(TransferClient.get_endpoint_acl_rule)
+    add_endpoint_acl_rule = blocking_method(TransferClient.add_endpoint_acl_rule)
+    update_endpoint_acl_rule = blocking_method(TransferClient.update_endpoint_acl_rule)
+    delete_endpoint_acl_rule = blocking_method(TransferClient.delete_endpoint_acl_rule)
+    bookmark_list = blocking_method(TransferClient.bookmark_list)
+    create_bookmark = blocking_method(TransferClient.create_bookmark)
+    get_bookmark = blocking_method(TransferClient.get_bookmark)
+    update_bookmark = blocking_method(TransferClient.update_bookmark)
+    delete_bookmark = blocking_method(TransferClient.delete_bookmark)
+    operation_ls = blocking_method(TransferClient.operation_ls)
+    operation_mkdir = blocking_method(TransferClient.operation_mkdir)
+    operation_rename = blocking_method(TransferClient.operation_rename)
+    operation_symlink = blocking_method(TransferClient.operation_symlink)
+    get_submission_id = blocking_method(TransferClient.get_submission_id)
+    submit_transfer = blocking_method(TransferClient.submit_transfer)
+    submit_delete = blocking_method(TransferClient.submit_delete)
+    task_list = blocking_method(TransferClient.task_list)
+    task_event_list = blocking_method(TransferClient.task_event_list)
+    get_task = blocking_method(TransferClient.get_task)
+    update_task = blocking_method(TransferClient.update_task)
+    cancel_task = blocking_method(TransferClient.cancel_task)
+    task_wait = blocking_method(TransferClient.task_wait)
+    task_pause_info = blocking_method(TransferClient.task_pause_info)
+    task_successful_transfers = blocking_method(
+        TransferClient.task_successful_transfers
+    )
+    task_skipped_errors = blocking_method(TransferClient.task_skipped_errors)
+    endpoint_manager_monitored_endpoints = blocking_method(
+        TransferClient.endpoint_manager_monitored_endpoints
+    )
+    endpoint_manager_hosted_endpoint_list = blocking_method(
+        TransferClient.endpoint_manager_hosted_endpoint_list
+    )
+    endpoint_manager_get_endpoint = blocking_method(
+        TransferClient.endpoint_manager_get_endpoint
+    )
+    endpoint_manager_acl_list = blocking_method(
+        TransferClient.endpoint_manager_acl_list
+    )
+    endpoint_manager_task_list = blocking_method(
+        TransferClient.endpoint_manager_task_list
+    )
+    endpoint_manager_get_task = blocking_method(
+        TransferClient.endpoint_manager_get_task
+    )
+    endpoint_manager_task_event_list = blocking_method(
+        TransferClient.endpoint_manager_task_event_list
+    )
+    endpoint_manager_task_pause_info = blocking_method(
+        TransferClient.endpoint_manager_task_pause_info
+    )
+    endpoint_manager_task_successful_transfers = blocking_method(
+        TransferClient.endpoint_manager_task_successful_transfers
+    )
+    endpoint_manager_task_skipped_errors = blocking_method(
+        TransferClient.endpoint_manager_task_skipped_errors
+    )
+    endpoint_manager_cancel_tasks = blocking_method(
+        TransferClient.endpoint_manager_cancel_tasks
+    )
+    endpoint_manager_cancel_status = blocking_method(
+        TransferClient.endpoint_manager_cancel_status
+    )
+    endpoint_manager_pause_tasks = blocking_method(
+        TransferClient.endpoint_manager_pause_tasks
+    )
+    endpoint_manager_resume_tasks = blocking_method(
+        TransferClient.endpoint_manager_resume_tasks
+    )
+    endpoint_manager_pause_rule_list = blocking_method(
+        TransferClient.endpoint_manager_pause_rule_list
+    )
+    endpoint_manager_create_pause_rule = blocking_method(
+        TransferClient.endpoint_manager_create_pause_rule
+    )
+    endpoint_manager_get_pause_rule = blocking_method(
+        TransferClient.endpoint_manager_get_pause_rule
+    )
+    endpoint_manager_update_pause_rule = blocking_method(
+        TransferClient.endpoint_manager_update_pause_rule
+    )
+    endpoint_manager_delete_pause_rule = blocking_method(
+        TransferClient.endpoint_manager_delete_pause_rule
+    )
@@ -32,6 +32,21 @@ class GlobusAuthorizer(metaclass=abc.ABCMeta):
         """
         return False
 
+    def handle_rejected_authorization(self, authorization: Optional[str]) -> bool:
+        """
+        This operation is called by the transport if a request made with the
+        Authorization header ``authorization`` returns a 401 (HTTP Unauthorized).
+        It is like ``handle_missing_authorization``, but is given the header which
+        was rejected, as it may run on a different thread from the one which got
+        the header.
+
+        By default, this calls ``handle_missing_authorization``.
+
+        :param authorization: The ``Authorization`` header which was sent, if any
+        :type authorization: str, optional
+        """
+        return self.handle_missing_authorization()
+
 
 class StaticGlobusAuthorizer(GlobusAuthorizer):
     """A static authorizer has some static string as its header val which it always
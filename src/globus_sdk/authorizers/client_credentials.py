@@ -5,6 +5,7 @@ from globus_sdk.scopes import MutableScope, _ScopeCollectionType
 
 if TYPE_CHECKING:
     from globus_sdk.services.auth import ConfidentialAppAuthClient, OAuthTokenResponse
+    from globus_sdk.tokenstorage import StorageAdapter
 
 from .renewing import RenewingAuthorizer
 
@@ -56,6 +57,18 @@ class ClientCredentialsAuthorizer(RenewingAuthorizer):
         ``on_refresh`` callback can be used to update the Access Tokens and
         their expiration times.
     :type on_refresh: callable, optional
+    :param background_refresh_margin: If set, get a new Access Token on a background
+        thread this many seconds before the current one expires. See
+        :class:`RenewingAuthorizer <globus_sdk.authorizers.RenewingAuthorizer>`
+    :type background_refresh_margin: float, optional
+    :param token_storage: A storage adapter used to share tokens with other processes,
+        and to make sure that only one of them refreshes the token at a time. See
+        :class:`RenewingAuthorizer <globus_sdk.authorizers.RenewingAuthorizer>`
+    :type token_storage: :class:`StorageAdapter \
+        <globus_sdk.tokenstorage.StorageAdapter>`, optional
+    :param resource_server: The resource server of the tokens in ``token_storage``.
+        Required if ``token_storage`` is used
+    :type resource_server: str, optional
     """
 
     def __init__(
@@ -66,6 +79,9 @@ class ClientCredentialsAuthorizer(RenewingAuthorizer):
         access_token: Optional[str] = None,
         expires_at: Optional[int] = None,
         on_refresh: Optional[Callable[["OAuthTokenResponse"], Any]] = None,
+        background_refresh_margin: Optional[float] = None,
+        token_storage: Optional["StorageAdapter"] = None,
+        resource_server: Optional[str] = None,
     ):
 
         # values for _get_token_data
@@ -77,7 +93,14 @@ class ClientCredentialsAuthorizer(RenewingAuthorizer):
             f"[instance:{id(confidential_client)}] and scopes={self.scopes}"
         )
 
-        super().__init__(access_token, expires_at, on_refresh)
+        super().__init__(
+            access_token,
+            expires_at,
+            on_refresh,
+            background_refresh_margin=background_refresh_margin,
+            token_storage=token_storage,
+            resource_server=resource_server,
+        )
 
     def _get_token_response(self) -> "OAuthTokenResponse":
         """
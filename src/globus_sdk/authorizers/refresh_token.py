@@ -5,6 +5,7 @@ from .renewing import RenewingAuthorizer
 
 if TYPE_CHECKING:
     from globus_sdk.services.auth import AuthClient, OAuthTokenResponse
+    from globus_sdk.tokenstorage import StorageAdapter
 
 log = logging.getLogger(__name__)
 
@@ -49,6 +50,18 @@ class RefreshTokenAuthorizer(RenewingAuthorizer):
         ``on_refresh`` callback can be used to update the Access Tokens and
         their expiration times.
     :type on_refresh: callable, optional
+    :param background_refresh_margin: If set, get a new Access Token on a background
+        thread this many seconds before the current one expires. See
+        :class:`RenewingAuthorizer <globus_sdk.authorizers.RenewingAuthorizer>`
+    :type background_refresh_margin: float, optional
+    :param token_storage: A storage adapter used to share tokens with other processes,
+        and to make sure that only one of them refreshes the token at a time. See
+        :class:`RenewingAuthorizer <globus_sdk.authorizers.RenewingAuthorizer>`
+    :type token_storage: :class:`StorageAdapter \
+        <globus_sdk.tokenstorage.StorageAdapter>`, optional
+    :param resource_server: The resource server of the tokens in ``token_storage``.
+        Required if ``token_storage`` is used
+    :type resource_server: str, optional
     """
 
     def __init__(
@@ -59,6 +72,9 @@ class RefreshTokenAuthorizer(RenewingAuthorizer):
         access_token: Optional[str] = None,
         expires_at: Optional[int] = None,
         on_refresh: Optional[Callable[["OAuthTokenResponse"], Any]] = None,
+        background_refresh_margin: Optional[float] = None,
+        token_storage: Optional["StorageAdapter"] = None,
+        resource_server: Optional[str] = None,
     ):
         log.info(
             "Setting up RefreshTokenAuthorizer with auth_client="
@@ -69,7 +85,14 @@ class RefreshTokenAuthorizer(RenewingAuthorizer):
         self.refresh_token = refresh_token
         self.auth_client = auth_client
 
-        super().__init__(access_token, expires_at, on_refresh)
+        super().__init__(
+            access_token,
+            expires_at,
+            on_refresh,
+            background_refresh_margin=background_refresh_margin,
+            token_storage=token_storage,
+            resource_server=resource_server,
+        )
 
     def _get_token_response(self) -> "OAuthTokenResponse":
         """
@@ -77,6 +100,15 @@ class RefreshTokenAuthorizer(RenewingAuthorizer):
         """
         return self.auth_client.oauth2_refresh_token(self.refresh_token)
 
+    def _use_stored_token_data(self, token_data: Dict[str, Any]) -> None:
+        """
+        Use token data from ``token_storage``, including the refresh token, in case
+        another process used a refresh token which has since been rotated.
+        """
+        if token_data.get("refresh_token"):
+            self.refresh_token = token_data["refresh_token"]
+        super()._use_stored_token_data(token_data)
+
     def _extract_token_data(self, res: "OAuthTokenResponse") -> Dict[str, Any]:
         """
         Get the tokens .by_resource_server,
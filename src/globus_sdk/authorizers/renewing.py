@@ -1,7 +1,9 @@
 import abc
 import logging
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from globus_sdk import exc, utils
 
@@ -9,6 +11,7 @@ from .base import GlobusAuthorizer
 
 if TYPE_CHECKING:
     from globus_sdk.services.auth import OAuthTokenResponse
+    from globus_sdk.tokenstorage import StorageAdapter
 
 log = logging.getLogger(__name__)
 # Provides a buffer for token expiration time to account for
@@ -16,6 +19,14 @@ log = logging.getLogger(__name__)
 EXPIRES_ADJUST_SECONDS = 60
 
 
+def _run_background_refresh(ref: "weakref.ReferenceType[RenewingAuthorizer]") -> None:
+    # the timer only holds a weak reference, so that a pending refresh does not keep
+    # an authorizer alive once it is no longer in use
+    authorizer = ref()
+    if authorizer is not None:
+        authorizer._background_refresh()
+
+
 class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
     r"""
     A ``RenewingAuthorizer`` is an abstract superclass to any authorizer
@@ -46,6 +57,25 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         ``on_refresh`` callback can be used to update the Access Tokens and
         their expiration times.
     :type on_refresh: callable, optional
+    :param background_refresh_margin: If set, the authorizer gets a new Access Token
+        on a background thread this many seconds before the current one expires, so
+        that requests do not wait for the token to be refreshed. Tokens are treated as
+        expired 60 seconds before their expiration time, so the margin should be
+        larger than this
+    :type background_refresh_margin: float, optional
+    :param token_storage: A storage adapter shared by processes using the same tokens.
+        If set, before getting a new Access Token, the authorizer first checks the
+        storage for a valid token stored by another process, and uses it if one is
+        found. New tokens are written to the storage. The storage adapter's ``lock()``
+        is held while checking and refreshing, so that only one process at a time gets
+        a new token. Requires ``resource_server``
+    :type token_storage: :class:`StorageAdapter \
+        <globus_sdk.tokenstorage.StorageAdapter>`, optional
+    :param resource_server: The resource server of the tokens in ``token_storage``
+    :type resource_server: str, optional
+
+    A ``RenewingAuthorizer`` may be shared between threads. Only one thread at a time
+    gets a new Access Token, and other threads which need a token wait for it.
     """
 
     def __init__(
@@ -53,9 +83,25 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         access_token: Optional[str] = None,
         expires_at: Optional[int] = None,
         on_refresh: Optional[Callable[["OAuthTokenResponse"], Any]] = None,
+        *,
+        background_refresh_margin: Optional[float] = None,
+        token_storage: Optional["StorageAdapter"] = None,
+        resource_server: Optional[str] = None,
     ):
-        self._access_token = None
-        self._access_token_hash = None
+        # the access token and its expiration time are replaced together, as one
+        # tuple, so that threads reading them without the lock see a matching pair
+        self._token: Tuple[Optional[str], Optional[int]] = (None, None)
+        self._access_token_hash: Optional[str] = None
+        # held while getting a new token, so that only one thread does so at a time
+        # reentrant so that an on_refresh callback may use the authorizer
+        self._refresh_lock = threading.RLock()
+        # the token most recently handed out to each thread, used to tell whether a
+        # 401 was caused by the current token or by one which was already replaced
+        self._thread_local = threading.local()
+        self.background_refresh_margin = background_refresh_margin
+        self._background_refresh_timer: Optional[threading.Timer] = None
+        # cancels the timer when called, or when the authorizer is garbage collected
+        self._cancel_background_refresh_timer: Optional[weakref.finalize] = None
 
         log.info(
             "Setting up a RenewingAuthorizer. It will use an "
@@ -69,9 +115,15 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
                 "A RenewingAuthorizer cannot be initialized with one of "
                 "access_token and expires_at. Either provide both or neither."
             )
+        if token_storage is not None and resource_server is None:
+            raise exc.GlobusSDKUsageError(
+                "A RenewingAuthorizer using token_storage must be given the "
+                "resource_server of its tokens."
+            )
+        self.token_storage = token_storage
+        self.resource_server = resource_server
 
-        self.access_token = access_token
-        self.expires_at = expires_at
+        self._set_token(access_token, expires_at)
         self.on_refresh = on_refresh
 
         if self.access_token is not None:
@@ -79,23 +131,51 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
                 "RenewingAuthorizer will start by using access_token "
                 f'with hash "{self._access_token_hash}"'
             )
+            self._schedule_background_refresh()
         # if data were unspecified, fetch a new access token
         else:
             log.info(
                 "Creating RenewingAuthorizer without Access "
                 "Token. Fetching initial token now."
             )
-            self._get_new_access_token()
+            with self._refresh_lock:
+                self._refresh()
 
     @property
     def access_token(self) -> Optional[str]:
-        return self._access_token
+        return self._token[0]
 
     @access_token.setter
     def access_token(self, value: Optional[str]) -> None:
-        self._access_token = value
-        if value:
-            self._access_token_hash = utils.sha256_string(value)
+        self._set_token(value, self._token[1])
+
+    @property
+    def expires_at(self) -> Optional[int]:
+        return self._token[1]
+
+    @expires_at.setter
+    def expires_at(self, value: Optional[int]) -> None:
+        self._set_token(self._token[0], value)
+
+    def _set_token(
+        self, access_token: Optional[str], expires_at: Optional[int]
+    ) -> None:
+        if access_token:
+            self._access_token_hash = utils.sha256_string(access_token)
+        self._token = (access_token, expires_at)
+
+    def _get_valid_token(self) -> Optional[str]:
+        """
+        Get the current access token if it is valid, or None.
+        """
+        access_token, expires_at = self._token
+        if (
+            access_token is not None
+            and expires_at is not None
+            and time.time() <= expires_at - EXPIRES_ADJUST_SECONDS
+        ):
+            return access_token
+        return None
 
     @abc.abstractmethod
     def _get_token_response(self) -> "OAuthTokenResponse":
@@ -123,19 +203,123 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         res = self._get_token_response()
         token_data = self._extract_token_data(res)
 
-        self.expires_at = token_data["expires_at_seconds"]
-        self.access_token = token_data["access_token"]
+        self._set_token(token_data["access_token"], token_data["expires_at_seconds"])
 
         log.info(
             "RenewingAuthorizer.access_token updated to "
             f'token with hash "{self._access_token_hash}"'
         )
 
+        if self.token_storage is not None:
+            log.debug("storing new token in token_storage")
+            self.token_storage.store(res)
+
         if callable(self.on_refresh):
             log.debug("will call on_refresh callback")
             self.on_refresh(res)
             log.debug("on_refresh callback finished")
 
+        self._schedule_background_refresh()
+
+    def _token_is_valid(self) -> bool:
+        return self._get_valid_token() is not None
+
+    def _use_stored_token_data(self, token_data: Dict[str, Any]) -> None:
+        """
+        Use token data which was read from ``token_storage``.
+        """
+        self._set_token(token_data["access_token"], token_data["expires_at_seconds"])
+        log.info(
+            "RenewingAuthorizer.access_token updated from token_storage to "
+            f'token with hash "{self._access_token_hash}"'
+        )
+        self._schedule_background_refresh()
+
+    def _load_from_token_storage(self, min_remaining: float) -> bool:
+        """
+        Check ``token_storage`` for a token which is not the current one and which
+        remains valid for at least ``min_remaining`` seconds. If found, use it.
+
+        Returns True if a stored token is now in use.
+        """
+        if self.token_storage is None or self.resource_server is None:
+            return False
+        token_data = self.token_storage.get_token_data(self.resource_server)
+        if (
+            token_data is None
+            or token_data.get("access_token") in (None, self.access_token)
+            or token_data.get("expires_at_seconds") is None
+            or time.time() > token_data["expires_at_seconds"] - min_remaining
+        ):
+            return False
+        log.debug("RenewingAuthorizer found a newer token in token_storage")
+        self._use_stored_token_data(token_data)
+        return True
+
+    def _refresh(self, min_remaining: float = EXPIRES_ADJUST_SECONDS) -> None:
+        """
+        Get a new token, first checking ``token_storage`` for a token at least
+        ``min_remaining`` seconds from expiring, if storage is in use.
+
+        Must be called with ``_refresh_lock`` held.
+        """
+        if self.token_storage is None:
+            self._get_new_access_token()
+            return
+        with self.token_storage.lock():
+            if not self._load_from_token_storage(min_remaining):
+                self._get_new_access_token()
+
+    def _schedule_background_refresh(self) -> None:
+        """
+        If background refresh is enabled, (re)start the timer which will refresh the
+        current token before it expires.
+        """
+        if self.background_refresh_margin is None or self.expires_at is None:
+            return
+        self.cancel_background_refresh()
+        delay = max(0.0, self.expires_at - self.background_refresh_margin - time.time())
+        log.debug(f"RenewingAuthorizer will refresh in the background in {delay}s")
+        timer = threading.Timer(delay, _run_background_refresh, (weakref.ref(self),))
+        timer.daemon = True
+        self._background_refresh_timer = timer
+        self._cancel_background_refresh_timer = weakref.finalize(self, timer.cancel)
+        timer.start()
+
+    def _background_refresh(self) -> None:
+        margin = self.background_refresh_margin
+        # errors would otherwise be lost in the timer thread; the next request will
+        # try to get a new token and raise the error
+        try:
+            with self._refresh_lock:
+                # the token may have been refreshed by a request thread after the timer
+                # was started, in which case a new timer was also started
+                if (
+                    margin is not None
+                    and self.expires_at is not None
+                    and time.time() < self.expires_at - margin
+                ):
+                    return
+                log.debug("RenewingAuthorizer refreshing token in the background")
+                self._refresh(
+                    min_remaining=EXPIRES_ADJUST_SECONDS if margin is None else margin
+                )
+        except Exception:
+            log.exception("RenewingAuthorizer background refresh failed")
+
+    def cancel_background_refresh(self) -> None:
+        """
+        Stop any pending background refresh. Tokens will still be refreshed when they
+        are used after they have expired.
+
+        A pending refresh is also stopped when the authorizer is garbage collected.
+        """
+        cancel = self._cancel_background_refresh_timer
+        if cancel is not None:
+            cancel()
+            self._cancel_background_refresh_timer = None
+        self._background_refresh_timer = None
+
     def ensure_valid_token(self) -> None:
         """
         Check that the authorizer has a valid token. Checks that the token is set and
@@ -147,28 +331,34 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         ``on_refresh`` handler.
         """
         log.debug("RenewingAuthorizer checking expiration time")
-        if self.access_token is None:
-            log.debug("RenewingAuthorizer has no token")
-        else:
-            if (
-                self.expires_at is not None
-                and time.time() <= self.expires_at - EXPIRES_ADJUST_SECONDS
-            ):
-                log.debug("RenewingAuthorizer determined time has not yet expired")
+        if self._token_is_valid():
+            log.debug("RenewingAuthorizer determined time has not yet expired")
+            return
+
+        with self._refresh_lock:
+            # another thread may have gotten a new token while this one waited
+            if self._token_is_valid():
+                log.debug("RenewingAuthorizer token was refreshed by another thread")
                 return
+            if self.access_token is None:
+                log.debug("RenewingAuthorizer has no token")
             else:
                 log.debug("RenewingAuthorizer has a token, but it is expired")
 
-        log.debug("RenewingAuthorizer fetching new Access Token")
-        self._get_new_access_token()
+            log.debug("RenewingAuthorizer fetching new Access Token")
+            self._refresh()
 
     def get_authorization_header(self) -> str:
         """
         Check to see if a new token is needed and return "Bearer <access_token>"
         """
-        self.ensure_valid_token()
+        access_token = self._get_valid_token()
+        if access_token is None:
+            self.ensure_valid_token()
+            access_token = self.access_token
+        self._thread_local.access_token = access_token
         log.debug(f'bearer token has hash "{self._access_token_hash}"')
-        return f"Bearer {self.access_token}"
+        return f"Bearer {access_token}"
 
     def handle_missing_authorization(self) -> bool:
         """
@@ -176,12 +366,37 @@ class RenewingAuthorizer(GlobusAuthorizer, metaclass=abc.ABCMeta):
         invalidating its current Access Token. When this happens, the next call
         to ``set_authorization_header()`` will result in a new Access Token
         being fetched.
+
+        If the token which was sent by this thread has already been replaced, e.g.
+        because many threads saw a 401 at once, the current token is kept.
         """
-        log.debug(
-            "RenewingAuthorizer seeing 401. Invalidating "
-            "token and preparing for refresh."
-        )
-        # None for expires_at invalidates any current token
-        self.expires_at = None
+        return self._invalidate_token(getattr(self._thread_local, "access_token", None))
+
+    def handle_rejected_authorization(self, authorization: Optional[str]) -> bool:
+        """
+        Respond to a 401 in the same way as ``handle_missing_authorization``, but
+        check whether the token in the rejected ``authorization`` header, rather
+        than the one last used by this thread, has already been replaced.
+
+        :param authorization: The ``Authorization`` header which was sent, if any
+        :type authorization: str, optional
+        """
+        scheme, _, used_token = (authorization or "").partition(" ")
+        return self._invalidate_token(used_token if scheme == "Bearer" else None)
+
+    def _invalidate_token(self, used_token: Optional[str]) -> bool:
+        with self._refresh_lock:
+            if used_token is not None and used_token != self.access_token:
+                log.debug(
+                    "RenewingAuthorizer seeing 401 for a token which was already "
+                    "replaced. Keeping the current token."
+                )
+                return True
+            log.debug(
+                "RenewingAuthorizer seeing 401. Invalidating "
+                "token and preparing for refresh."
+            )
+            # None for expires_at invalidates any current token
+            self.expires_at = None
         # respond True, as in "we took some action, the 401 *may* be resolved"
         return True
@@ -1,18 +1,26 @@
+import copy
+import functools
 import logging
 import urllib.parse
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+
+import requests
 
 from globus_sdk import config, exc, utils
 from globus_sdk.authorizers import GlobusAuthorizer
+from globus_sdk.concurrency import ConcurrentBatch
 from globus_sdk.paging import PaginatorTable
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.scopes import ScopeBuilder
 from globus_sdk.transport import RequestsTransport
+from globus_sdk.transport.json_codec import get_response_codec
 
 log = logging.getLogger(__name__)
 
 DataParamType = Union[None, str, Dict[str, Any], utils.PayloadWrapper]
 
+C = TypeVar("C", bound="BaseClient")
+
 
 class BaseClient:
     r"""
@@ -116,12 +124,79 @@ class BaseClient:
             return None
         return cls.scopes.resource_server
 
+    @property
+    def cached(self: C) -> C:
+        """
+        A copy of this client whose ``GET`` requests use the ``response_cache`` of the
+        transport, as if they were sent with ``use_response_cache=True``. This opts
+        single calls of any method in to a cache which is ``opt_in``. A call which
+        passes ``use_response_cache`` itself is sent as it asks.
+
+        **Examples**
+
+        >>> cache = ResponseCache(opt_in=True)
+        >>> tc = TransferClient(..., transport_params={"response_cache": cache})
+        >>> ep = tc.cached.get_endpoint(endpoint_id)
+        >>> for page in tc.cached.paginated.endpoint_search("foo"):
+        >>>     ...
+        """
+        return self._with_request_params(use_response_cache=True)
+
+    def _with_request_params(self: C, **params: Any) -> C:
+        """
+        Get a shallow copy of this client, which shares its transport and authorizer,
+        and which sends its requests with defaults for some parameters of ``request``.
+        A parameter which is passed to ``request`` (and is not None) is kept.
+        """
+        request = self.request
+
+        @functools.wraps(request)
+        def request_with_params(
+            method: str, path: str, **kwargs: Any
+        ) -> GlobusHTTPResponse:
+            for name, value in params.items():
+                if kwargs.get(name) is None:
+                    kwargs[name] = value
+            return request(method, path, **kwargs)
+
+        client = copy.copy(self)
+        vars(client)["request"] = request_with_params
+        client.paginated = PaginatorTable(client)
+        return client
+
+    def concurrent(self, *, max_workers: Optional[int] = None) -> ConcurrentBatch:
+        """
+        Get a :class:`ConcurrentBatch <globus_sdk.concurrency.ConcurrentBatch>` for
+        making many calls with this client at once, on a bounded pool of threads.
+
+        :param max_workers: The maximum number of calls to run at once. Defaults to
+            the size of the connection pool of the transport
+        :type max_workers: int, optional
+
+        **Examples**
+
+        >>> tc = globus_sdk.TransferClient(..., transport_params={"pool_maxsize": 32})
+        >>> with tc.concurrent(max_workers=32) as batch:
+        >>>     futures = [batch.get_task(task_id) for task_id in task_ids]
+        >>> tasks = [f.result() for f in futures]
+        """
+        return ConcurrentBatch(self, max_workers=max_workers)
+
+    def _resolve_url(self, path: str) -> str:
+        # if a client is asked to make a request against a full URL, not just the path
+        # component, then do not resolve the path, simply pass it through as the URL
+        if path.startswith("https://") or path.startswith("http://"):
+            return path
+        return utils.slash_join(self.base_url, urllib.parse.quote(path))
+
     def get(
         self,
         path: str,
         *,
         query_params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        use_response_cache: Optional[bool] = None,
+        deadline: Optional[float] = None,
     ) -> GlobusHTTPResponse:
         """
         Make a GET request to the specified path.
@@ -132,7 +207,14 @@ class BaseClient:
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
         log.debug(f"GET to {path} with query_params {query_params}")
-        return self.request("GET", path, query_params=query_params, headers=headers)
+        return self.request(
+            "GET",
+            path,
+            query_params=query_params,
+            headers=headers,
+            use_response_cache=use_response_cache,
+            deadline=deadline,
+        )
 
     def post(
         self,
@@ -142,6 +224,7 @@ class BaseClient:
         data: DataParamType = None,
         headers: Optional[Dict[str, str]] = None,
         encoding: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> GlobusHTTPResponse:
         """
         Make a POST request to the specified path.
@@ -159,6 +242,7 @@ class BaseClient:
             data=data,
             headers=headers,
             encoding=encoding,
+            deadline=deadline,
         )
 
     def delete(
@@ -167,6 +251,7 @@ class BaseClient:
         *,
         query_params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        deadline: Optional[float] = None,
     ) -> GlobusHTTPResponse:
         """
         Make a DELETE request to the specified path.
@@ -177,7 +262,13 @@ class BaseClient:
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
         log.debug(f"DELETE to {path} with query_params {query_params}")
-        return self.request("DELETE", path, query_params=query_params, headers=headers)
+        return self.request(
+            "DELETE",
+            path,
+            query_params=query_params,
+            headers=headers,
+            deadline=deadline,
+        )
 
     def put(
         self,
@@ -187,6 +278,7 @@ class BaseClient:
         data: DataParamType = None,
         headers: Optional[Dict[str, str]] = None,
         encoding: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> GlobusHTTPResponse:
         """
         Make a PUT request to the specified path.
@@ -204,6 +296,7 @@ class BaseClient:
             data=data,
             headers=headers,
             encoding=encoding,
+            deadline=deadline,
         )
 
     def patch(
@@ -214,6 +307,7 @@ class BaseClient:
         data: DataParamType = None,
         headers: Optional[Dict[str, str]] = None,
         encoding: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> GlobusHTTPResponse:
         """
         Make a PATCH request to the specified path.
@@ -231,6 +325,7 @@ class BaseClient:
             data=data,
             headers=headers,
             encoding=encoding,
+            deadline=deadline,
         )
 
     def request(
@@ -244,6 +339,8 @@ class BaseClient:
         encoding: Optional[str] = None,
         allow_redirects: bool = True,
         stream: bool = False,
+        deadline: Optional[float] = None,
+        use_response_cache: Optional[bool] = None,
     ) -> GlobusHTTPResponse:
         """
         Send an HTTP request
@@ -267,25 +364,31 @@ class BaseClient:
             automatically. Defaults to ``True``
         :type allow_redirects: bool
         :param stream: Do not immediately download the response content. Defaults to
-            ``False``
+            ``False``, but responses are always streamed while a paginator is getting
+            a page for ``items(stream=True)``
         :type stream: bool
+        :param deadline: The maximum total time in seconds for the request, including
+            all of its retries. Defaults to the ``deadline`` of the transport, which is
+            unset by default
+        :type deadline: float, optional
+        :param use_response_cache: Whether to use the ``response_cache`` of the
+            transport for a ``GET`` request. Defaults to using it unless the cache is
+            ``opt_in``. To opt in the calls of other methods, use :attr:`cached`. See
+            :class:`ResponseCache <globus_sdk.transport.ResponseCache>`
+        :type use_response_cache: bool, optional
 
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
 
         :raises GlobusAPIError: a `GlobusAPIError` will be raised if the response to the
             request is received and has a status code in the 4xx or 5xx categories
+        :raises GlobusDeadlineExceededError: if the deadline is reached before a final
+            response is received
         """
         # prepare data...
         # copy headers if present
         rheaders = {**headers} if headers else {}
-
-        # if a client is asked to make a request against a full URL, not just the path
-        # component, then do not resolve the path, simply pass it through as the URL
-        if path.startswith("https://") or path.startswith("http://"):
-            url = path
-        else:
-            url = utils.slash_join(self.base_url, urllib.parse.quote(path))
+        url = self._resolve_url(path)
 
         # make the request
         log.debug("request will hit URL: %s", url)
@@ -299,6 +402,8 @@ class BaseClient:
             authorizer=self.authorizer,
             allow_redirects=allow_redirects,
             stream=stream,
+            deadline=deadline,
+            use_response_cache=use_response_cache,
         )
         log.debug("request made to URL: %s", r.url)
 
@@ -307,4 +412,13 @@ class BaseClient:
             return GlobusHTTPResponse(r, self)
 
         log.debug(f"request completed with (error) response code: {r.status_code}")
-        raise self.error_class(r)
+        raise self._make_error(r)
+
+    def _make_error(self, r: requests.Response) -> exc.GlobusAPIError:
+        """
+        Make an instance of the ``error_class`` for an error response, whose body is
+        parsed with the JSON codec of this client's transport.
+        """
+        error = self.error_class(r)
+        error._json_codec = get_response_codec(self)
+        return error
@@ -0,0 +1,150 @@
+import concurrent.futures
+import functools
+import inspect
+import logging
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Type
+
+if TYPE_CHECKING:
+    import globus_sdk
+
+log = logging.getLogger(__name__)
+
+
+class ConcurrentBatch:
+    """
+    A ``ConcurrentBatch`` runs calls to the methods of a client on a bounded pool of
+    threads. It is normally created with
+    :meth:`BaseClient.concurrent <globus_sdk.BaseClient.concurrent>` and used as a
+    context manager.
+
+    Any public method of the client may be called on the batch, with the same
+    arguments. Instead of running the call, the batch submits it to the pool and
+    returns a ``concurrent.futures.Future`` for its result.
+
+    All calls share the client, its transport, and the ``requests`` session of the
+    transport, so they are authorized and retried exactly as they would be if made
+    directly on the client. Sharing these between threads is safe:
+
+    - the session's connection pools are thread-safe, and each call sends its own
+      prepared request
+    - the SDK's authorizers can be used from several threads; a
+      :class:`RenewingAuthorizer <globus_sdk.authorizers.RenewingAuthorizer>`
+      refreshes its token once for all of the calls which need it
+    - the shared components which may be given to the transport, such as a
+      ``ResponseCache`` or a ``RateLimiter``, are thread-safe
+
+    The settings of the transport are not thread-safe: they are shared by all of
+    the calls, so they must not be changed (e.g. with ``transport.tune()``) while
+    calls in the batch are running.
+
+    Each call holds a connection while it runs, so the connection pool of the session
+    should allow ``max_workers`` connections to a host. By default, ``max_workers``
+    is the :attr:`pool_maxsize \
+    <globus_sdk.transport.RequestsTransport.pool_maxsize>` of the transport. A
+    larger ``max_workers`` needs a larger pool, e.g. via
+    ``transport_params={"pool_maxsize": 32}``, or else connections beyond the pool
+    size are opened for each call and then discarded.
+
+    When the context manager exits, it waits for all submitted calls to complete. If
+    the context manager exits with an error, calls which have not started are
+    cancelled.
+
+    :param client: The client whose methods will be called
+    :type client: :class:`BaseClient <globus_sdk.BaseClient>`
+    :param max_workers: The maximum number of calls to run at once. Defaults to the
+        size of the connection pool of the client's transport
+    :type max_workers: int, optional
+
+    **Examples**
+
+    >>> tc = globus_sdk.TransferClient(..., transport_params={"pool_maxsize": 32})
+    >>> with tc.concurrent(max_workers=32) as batch:
+    >>>     futures = [batch.get_task(task_id) for task_id in task_ids]
+    >>> tasks = [f.result() for f in futures]
+
+    or, iterating over results in the order in which calls were made
+
+    >>> with tc.concurrent(max_workers=32) as batch:
+    >>>     for task_id in task_ids:
+    >>>         batch.get_task(task_id)
+    >>> for task in batch.results():
+    >>>     print(task["status"])
+    """
+
+    def __init__(
+        self, client: "globus_sdk.BaseClient", *, max_workers: Optional[int] = None
+    ):
+        self.client = client
+        pool_maxsize = client.transport.pool_maxsize
+        if max_workers is None:
+            max_workers = pool_maxsize
+        elif pool_maxsize is not None and max_workers > pool_maxsize:
+            log.warning(
+                "concurrent batch max_workers=%d exceeds the connection pool size "
+                "(%d) of the transport, extra connections will not be reused",
+                max_workers,
+                pool_maxsize,
+            )
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="globus-sdk-concurrent"
+        )
+        self._futures: List["concurrent.futures.Future[Any]"] = []
+
+    def __enter__(self) -> "ConcurrentBatch":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            log.debug("concurrent batch exited with an error, cancelling calls")
+            for future in self._futures:
+                future.cancel()
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Wait for all submitted calls to complete and release the pool of threads.
+        This is called automatically when the batch is used as a context manager.
+        """
+        self._executor.shutdown(wait=True)
+
+    def submit(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "concurrent.futures.Future[Any]":
+        """
+        Submit an arbitrary callable to run in the batch.
+
+        :param func: The callable to run
+        :type func: callable
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def results(self) -> Iterator[Any]:
+        """
+        Iterate over the results of all calls submitted to the batch, in the order in
+        which they were submitted. If a call raised an error, the error is raised when
+        its result is reached.
+        """
+        for future in self._futures:
+            yield future.result()
+
+    def __getattr__(self, name: str) -> Callable[..., "concurrent.futures.Future[Any]"]:
+        if name == "client":
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if name.startswith("_") or not inspect.ismethod(attr):
+            raise AttributeError(f"'{name}' is not a client method")
+
+        @functools.wraps(attr)
+        def submit_call(*args: Any, **kwargs: Any) -> "concurrent.futures.Future[Any]":
+            return self.submit(attr, *args, **kwargs)
+
+        return submit_call
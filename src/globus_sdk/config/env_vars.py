@@ -15,6 +15,7 @@ T = TypeVar("T")
 ENVNAME_VAR = "GLOBUS_SDK_ENVIRONMENT"
 HTTP_TIMEOUT_VAR = "GLOBUS_SDK_HTTP_TIMEOUT"
 SSL_VERIFY_VAR = "GLOBUS_SDK_VERIFY_SSL"
+JSON_CODEC_VAR = "GLOBUS_SDK_JSON_CODEC"
 
 
 def _str2bool(val: str) -> bool:
@@ -102,3 +103,7 @@ def get_http_timeout(value: Optional[float] = None) -> Optional[float]:
     if ret == -1.0:
         return None
     return ret
+
+
+def get_json_codec_name(value: Optional[str] = None) -> str:
+    return _load_var(JSON_CODEC_VAR, "stdlib", explicit_value=value)
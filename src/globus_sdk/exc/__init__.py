@@ -1,8 +1,10 @@
 from .api import GlobusAPIError
 from .base import GlobusError, GlobusSDKUsageError
 from .convert import (
+    GlobusCircuitOpenError,
     GlobusConnectionError,
     GlobusConnectionTimeoutError,
+    GlobusDeadlineExceededError,
     GlobusTimeoutError,
     NetworkError,
     convert_request_exception,
@@ -21,7 +23,9 @@ __all__ = (
     "NetworkError",
     "GlobusTimeoutError",
     "GlobusConnectionTimeoutError",
+    "GlobusDeadlineExceededError",
     "GlobusConnectionError",
+    "GlobusCircuitOpenError",
     "convert_request_exception",
     "ErrorInfo",
     "ErrorInfoContainer",
@@ -1,11 +1,14 @@
 import logging
-from typing import Any, Dict, List, Mapping, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 import requests
 
 from .base import GlobusError
 from .err_info import ErrorInfoContainer
 
+if TYPE_CHECKING:
+    from globus_sdk.transport import JSONCodec
+
 log = logging.getLogger(__name__)
 
 
@@ -19,21 +22,89 @@ class GlobusAPIError(GlobusError):
     :ivar message: Error message from the API. In general, this will be more
                    useful to developers, but there may be cases where it's
                    suitable for display to end users.
+
+    The body of the response is parsed when one of the fields parsed from it is first
+    used. A subclass which parses more fields in ``_load_from_json`` should expose
+    them as properties which call ``_parse_response_once()``, and set
+    ``_parses_lazily = True``. Otherwise, the body is parsed when the error is created.
     """
 
     MESSAGE_FIELDS = ["message", "detail"]
     RECOGNIZED_AUTHZ_SCHEMES = ["bearer", "basic", "globus-goauthtoken"]
 
+    #: whether the fields parsed by this class are only parsed when they are used
+    _parses_lazily = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # a subclass which parses more fields may set them as plain attributes, which
+        # must be set when the error is created
+        parses_fields = "_load_from_json" in vars(cls) or "_parse_response" in vars(cls)
+        if parses_fields and "_parses_lazily" not in vars(cls):
+            cls._parses_lazily = False
+
     def __init__(self, r: requests.Response, *args: Any, **kwargs: Any):
         self.http_status = r.status_code
-        # defaults, may be rewritten during parsing
-        self.code = "Error"
-        self.message = r.text
-
         self._info: Optional[ErrorInfoContainer] = None
         self._underlying_response = r
-        self._parse_response()
-        super().__init__(*self._get_args())
+        # the body is parsed on first use, as many errors are only checked for their
+        # status (e.g. when handling a 404)
+        self._did_parse_json = False
+        self._raw_json: Optional[Dict[str, Any]] = None
+        self._did_parse_response = False
+        self._code = "Error"
+        self._message = ""
+        # the exception args are built from the parsed data when they are first used
+        self._args: Optional[Tuple[Any, ...]] = None
+        # the codec of the transport which received the response, set by the client
+        self._json_codec: Optional["JSONCodec"] = None
+        super().__init__()
+        if not self._parses_lazily:
+            self._parse_response_once()
+
+    @property
+    def code(self) -> str:
+        """
+        The error code from the API, or "Error" for unclassified errors
+        """
+        self._parse_response_once()
+        return self._code
+
+    @code.setter
+    def code(self, value: str) -> None:
+        self._parse_response_once()
+        self._code = value
+
+    @property
+    def message(self) -> str:
+        """
+        The error message from the API, or the body of the response if it has none
+        """
+        self._parse_response_once()
+        return self._message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._parse_response_once()
+        self._message = value
+
+    # BaseException formats its args in C, so they are a property here to be built
+    # lazily, and __str__ and __repr__ are defined to use them
+    @property  # type: ignore[override]
+    def args(self) -> Tuple[Any, ...]:  # type: ignore[override]
+        if self._args is None:
+            self._args = tuple(self._get_args())
+        return self._args
+
+    @args.setter
+    def args(self, value: Tuple[Any, ...]) -> None:
+        self._args = tuple(value)
+
+    def __str__(self) -> str:
+        return str(self.args)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.args!r}"
 
     @property
     def http_reason(self) -> str:
@@ -70,14 +141,24 @@ class GlobusAPIError(GlobusError):
 
         If the body cannot be loaded as JSON, this is None
         """
+        if not self._did_parse_json:
+            self._raw_json = self._parse_json()
+            self._did_parse_json = True
+        return self._raw_json
+
+    def _parse_json(self) -> Optional[Dict[str, Any]]:
+        # imported here, as the transport package imports this one
+        from globus_sdk.transport.json_codec import get_response_codec
+
         r = self._underlying_response
         if not self._json_content_type():
             return None
 
+        codec = self._json_codec or get_response_codec(None)
         try:
             # technically, this could be a non-dict JSON type, like a list or string
             # but in those cases the user can just cast -- the "normal" case is a dict
-            return cast(Dict[str, Any], r.json())
+            return cast(Dict[str, Any], codec.load_response(r))
         except ValueError:
             log.error(
                 "Error body could not be JSON decoded! "
@@ -133,6 +214,15 @@ class GlobusAPIError(GlobusError):
             self.message or self._underlying_response.reason,
         ]
 
+    def _parse_response_once(self) -> None:
+        if self._did_parse_response:
+            return
+        self._did_parse_response = True
+        # defaults, may be rewritten during parsing
+        self._code = "Error"
+        self._message = self._underlying_response.text
+        self._parse_response()
+
     def _parse_response(self) -> None:
         """
         This is an intermediate step between 'raw_json' (loading bare JSON data)
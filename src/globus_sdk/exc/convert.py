@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 import requests
 
@@ -30,6 +30,42 @@ class GlobusConnectionTimeoutError(GlobusTimeoutError):
     These errors are safe to retry."""
 
 
+class GlobusDeadlineExceededError(GlobusTimeoutError):
+    """
+    The deadline for a request, including all of its retries, was reached.
+
+    If the last attempt received a response, it is available as ``last_response``.
+    """
+
+    def __init__(
+        self,
+        msg: str,
+        exc: Exception,
+        *args: Any,
+        last_response: Optional[requests.Response] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(msg, exc, *args, **kwargs)
+        self.last_response = last_response
+
+
+class GlobusCircuitOpenError(GlobusError):
+    """
+    A request was not sent, because the circuit breaker for its host is open after
+    too many failed requests.
+
+    :ivar host: The host to which the request was not sent
+    :ivar retry_after: The number of seconds until a trial request may be sent
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(
+            f"Circuit breaker for {host} is open, retry after {retry_after:.1f}s"
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
 class GlobusConnectionError(NetworkError):
     """A connection error occured while making a REST request."""
 
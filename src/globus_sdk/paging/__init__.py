@@ -3,6 +3,7 @@ from .last_key import LastKeyPaginator
 from .limit_offset import HasNextPaginator, LimitOffsetTotalPaginator
 from .marker import MarkerPaginator, NullableMarkerPaginator
 from .next_token import NextTokenPaginator
+from .prefetch import PrefetchingPaginator
 from .table import PaginatorTable
 
 __all__ = (
@@ -15,4 +16,5 @@ __all__ = (
     "LastKeyPaginator",
     "HasNextPaginator",
     "LimitOffsetTotalPaginator",
+    "PrefetchingPaginator",
 )
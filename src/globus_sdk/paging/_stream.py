@@ -0,0 +1,206 @@
+"""
+Support for streaming the items of pages, so that a page is not held in memory all
+at once.
+
+A paginator fetches its pages with a copy of its client which asks for responses
+whose bodies are not downloaded immediately (see ``streaming_method``).
+``iter_page_items`` then reads the body of a page incrementally, handing out the
+elements of its array of items as they are decoded.
+"""
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Iterator, List
+
+from globus_sdk.response import GlobusHTTPResponse
+
+# the number of bytes of a response body to read at a time
+_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# the text at the end of the buffer which could be the rest of a number
+_NUMBER_CONTINUATION = re.compile(r"[0-9.eE+-]*\Z")
+
+
+def _iter_slices(content: bytes, size: int) -> Iterator[bytes]:
+    for start in range(0, len(content), size):
+        end = start + size
+        yield content[start:end]
+
+
+def streaming_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Get a variant of a bound method of a client whose requests do not download
+    response bodies immediately. Only the requests sent by the variant are streamed,
+    not those sent by the client itself, e.g. while the items of a page are handled.
+
+    ``method`` is returned unchanged if it is not a method of a client.
+    """
+    client = getattr(method, "__self__", None)
+    with_request_params = getattr(client, "_with_request_params", None)
+    if with_request_params is None:
+        return method
+    streaming: Callable[..., Any] = getattr(
+        with_request_params(stream=True), method.__name__
+    )
+    return streaming
+
+
+class _JSONStreamReader:
+    """
+    Reads a JSON object from chunks of bytes, decoding the elements of one of its
+    arrays one at a time.
+
+    The buffer holds the text of the value being decoded and at most as much text
+    again, so memory use is bounded by a multiple of the size of the largest element.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], encoding: str) -> None:
+        self._chunks = chunks
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self, min_chars: int = 1) -> bool:
+        """
+        Read at least ``min_chars`` more characters into the buffer, or up to the end
+        of the body, dropping the text which was already decoded.
+        Returns False if the end of the body was already reached.
+        """
+        if self._eof:
+            return False
+        start = self._pos
+        parts = [self._buf[start:]]
+        self._pos = 0
+        read = 0
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            parts.append(text)
+            read += len(text)
+            if read >= min_chars:
+                break
+        else:
+            parts.append(self._text_decoder.decode(b"", final=True))
+            self._eof = True
+        self._buf = "".join(parts)
+        return True
+
+    def _peek(self) -> str:
+        """
+        Skip whitespace, and get the next character, or "" at the end of the body.
+        """
+        while True:
+            match = _WHITESPACE.match(self._buf, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read_more():
+                return ""
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"invalid JSON document, expected one of '{chars}'")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # the value may be incomplete. Decoding starts again from the start of
+                # the value, so at least as much text as is buffered is read before
+                # trying again, which keeps the time to decode a large value linear in
+                # its size
+                if not self._read_more(len(self._buf) - self._pos):
+                    raise
+                continue
+            # a number which reaches the end of the buffer may be cut off, as in 12
+            # read from the start of 123, or 12 read from 12.5 when the buffer ends
+            # at the "."
+            if (
+                isinstance(value, (int, float))
+                and _NUMBER_CONTINUATION.match(self._buf, end)
+                and self._read_more()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def iter_object_items(
+        self, items_key: str, fields: Dict[str, Any]
+    ) -> Iterator[Any]:
+        """
+        Read a JSON object, yielding the elements of the array under ``items_key``.
+        The other fields of the object are stored in ``fields``. The items are not
+        kept, and each one is replaced with None, so that the number of items is
+        still known.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("invalid JSON document, expected a string key")
+            self._expect(":")
+            if key == items_key and self._peek() == "[":
+                self._pos += 1
+                streamed: List[None] = []
+                fields[key] = streamed
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        streamed.append(None)
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                fields[key] = self._value()
+                if key == items_key:
+                    yield from fields[key]
+            if self._expect(",}") == "}":
+                break
+        if self._peek():
+            raise ValueError("invalid JSON document, found extra data")
+
+
+def iter_page_items(page: GlobusHTTPResponse, items_key: str) -> Iterator[Any]:
+    """
+    Yield the items of a page, decoding them from the response body one at a time.
+
+    Afterwards, the data of the page holds all of its fields except for the items,
+    which are replaced with None, so that paginators can still count them.
+
+    If the page data was already parsed, or the page does not present the response
+    body as its data, the items are read from the page data instead.
+    """
+    inner = page
+    while inner._wrapped is not None:
+        inner = inner._wrapped
+    if inner._did_parse_json or type(page).data is not GlobusHTTPResponse.data:
+        yield from page[items_key]
+        return
+
+    response = inner._raw_response
+    chunks: Iterator[bytes]
+    if response.raw is None:
+        # a response which was constructed with its content, rather than received
+        chunks = _iter_slices(response.content, _CHUNK_SIZE)
+    else:
+        chunks = response.iter_content(_CHUNK_SIZE)
+    reader = _JSONStreamReader(chunks, response.encoding or "utf-8")
+    fields: Dict[str, Any] = {}
+    try:
+        yield from reader.iter_object_items(items_key, fields)
+    finally:
+        response.close()
+        # the remaining fields are used by the paginator, e.g. to find the next page
+        inner._parsed_json_data = fields
+        inner._did_parse_json = True
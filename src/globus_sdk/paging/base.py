@@ -1,6 +1,7 @@
 import abc
 import functools
 import inspect
+import json
 import sys
 from typing import (
     Any,
@@ -10,6 +11,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Type,
     TypeVar,
@@ -18,6 +20,8 @@ from typing import (
 
 from globus_sdk.response import GlobusHTTPResponse
 
+from ._stream import iter_page_items, streaming_method
+
 if sys.version_info >= (3, 10):
     from typing import ParamSpec
 else:
@@ -59,6 +63,9 @@ class Paginator(Iterable[PageT], metaclass=abc.ABCMeta):
     :type client_kwargs: dict
     """
 
+    # the version of the checkpoint format produced by ``checkpoint()``
+    _CHECKPOINT_VERSION = 1
+
     def __init__(
         self,
         method: Callable[..., Any],
@@ -74,6 +81,12 @@ class Paginator(Iterable[PageT], metaclass=abc.ABCMeta):
         self.items_key = items_key
         self.client_args = client_args
         self.client_kwargs = client_kwargs
+        # set once the last page has been handled, so that a paginator restored from
+        # a final checkpoint yields no pages
+        self._exhausted = False
+        self._pages_completed = 0
+        self._checkpoint_callback: Optional[Callable[[str], None]] = None
+        self._checkpoint_every = 1
 
     def __iter__(self) -> Iterator[PageT]:
         yield from self.pages()
@@ -83,7 +96,7 @@ class Paginator(Iterable[PageT], metaclass=abc.ABCMeta):
         """``pages()`` yields GlobusHTTPResponse objects, each one representing a page
         of results."""
 
-    def items(self) -> Iterator[Any]:
+    def items(self, *, stream: bool = False) -> Iterator[Any]:
         """
         ``items()`` of a paginator is a generator which yields each item in each page of
         results.
@@ -91,14 +104,204 @@ class Paginator(Iterable[PageT], metaclass=abc.ABCMeta):
         ``items()`` may raise a ``ValueError`` if the paginator was constructed without
         identifying a key for use within each page of results. This may be the case for
         paginators whose pages are not primarily an array of data.
+
+        :param stream: Download each page as a stream, and decode its items one at a
+            time as they are consumed, so that only one item of the page is held in
+            memory at once. The other fields of each page are kept, but its items are
+            not. Only the requests for pages are streamed, not other requests sent
+            by the client (e.g. while the items are handled). Pages which are fetched
+            ahead by :meth:`prefetch` are downloaded in full, but their items are
+            still decoded one at a time
+        :type stream: bool
+
+        **Examples**
+
+        >>> tc = TransferClient(...)
+        >>> paginator = tc.paginated.task_successful_transfers(task_id)
+        >>> for transfer in paginator.items(stream=True):
+        >>>     export(transfer)
         """
         if self.items_key is None:
             raise ValueError(
                 "Cannot provide items() iteration on a paginator where 'items_key' "
                 "is not set."
             )
-        for page in self.pages():
-            yield from page[self.items_key]
+        if not stream:
+            for page in self.pages():
+                yield from page[self.items_key]
+            return
+
+        # the pages are fetched with a copy of the client which streams responses, so
+        # that the other requests of the client are not streamed
+        method = self.method
+        self.method = streaming_method(method)
+        pages = self.pages()
+        try:
+            for page in pages:
+                yield from iter_page_items(page, self.items_key)
+        finally:
+            # stop a paginator which is a generator from fetching more pages
+            if inspect.isgenerator(pages):
+                pages.close()
+            self.method = method
+
+    def prefetch(self, depth: int = 2) -> "Paginator[PageT]":
+        """
+        Get a paginator which produces the same pages as this one, but fetches them on
+        a worker thread, up to ``depth`` pages ahead of the consumer. This allows the
+        next pages to be requested while the current page is being handled.
+
+        :param depth: The maximum number of pages to fetch ahead of the consumer
+        :type depth: int
+
+        **Examples**
+
+        >>> tc = TransferClient(...)
+        >>> paginator = tc.paginated.task_list().prefetch(depth=2)
+        >>> for task in paginator.items():
+        >>>     print(task["task_id"])
+        """
+        # imported here to avoid a circular import
+        from .prefetch import PrefetchingPaginator
+
+        return PrefetchingPaginator(self, depth=depth)
+
+    def _get_cursor_state(self) -> Dict[str, Any]:
+        """
+        Get the state needed to resume paging, as a JSON-serializable dict.
+
+        Paginators which support :meth:`checkpoint` must override this.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support checkpointing"
+        )
+
+    def _set_cursor_state(self, state: Mapping[str, Any]) -> None:
+        """
+        Set the state of the paginator from a dict produced by ``_get_cursor_state``.
+
+        Paginators which support :meth:`restore` must override this.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support restoring from a checkpoint"
+        )
+
+    def _page_completed(self, has_next_page: bool) -> None:
+        """
+        Record that a page has been handled by the consumer, and that the cursor
+        state points at the next page. Paginators call this in ``pages()`` after
+        updating their cursor.
+        """
+        self._pages_completed += 1
+        if not has_next_page:
+            self._exhausted = True
+        if self._checkpoint_callback is not None and (
+            self._exhausted or self._pages_completed % self._checkpoint_every == 0
+        ):
+            self._checkpoint_callback(self.checkpoint())
+
+    def checkpoint(self) -> str:
+        """
+        Get the current position of the paginator as a JSON string.
+
+        The checkpoint records where paging will resume: the page after the last one
+        which was fully handled. It does not include the arguments to the paginated
+        method, so to resume paging, get a new paginator with the same arguments and
+        call :meth:`restore` on it.
+
+        **Examples**
+
+        >>> paginator = tc.paginated.task_successful_transfers(task_id)
+        >>> for page in paginator:
+        >>>     handle(page)
+        >>>     save(paginator.checkpoint())
+
+        and later, after a crash
+
+        >>> paginator = tc.paginated.task_successful_transfers(task_id)
+        >>> paginator.restore(load())
+        >>> for page in paginator:  # starts after the last saved page
+        >>>     handle(page)
+        """
+        return json.dumps(
+            {
+                "version": self._CHECKPOINT_VERSION,
+                "paginator": type(self).__name__,
+                "exhausted": self._exhausted,
+                "cursor": self._get_cursor_state(),
+            }
+        )
+
+    def restore(self, checkpoint: str) -> "Paginator[PageT]":
+        """
+        Set the position of the paginator from a checkpoint produced by
+        :meth:`checkpoint`. Paging will resume from the recorded position.
+
+        Returns this paginator.
+
+        :param checkpoint: A checkpoint from a paginator of the same type
+        :type checkpoint: str
+        :raises ValueError: if the checkpoint is malformed or is from a different
+            type of paginator
+        :raises NotImplementedError: if this type of paginator cannot be restored
+        """
+        try:
+            data = json.loads(checkpoint)
+        except ValueError as e:
+            raise ValueError("paginator checkpoint is not valid JSON") from e
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self._CHECKPOINT_VERSION
+        ):
+            raise ValueError("unrecognized paginator checkpoint format")
+        if data.get("paginator") != type(self).__name__:
+            raise ValueError(
+                f"cannot restore a {type(self).__name__} from a checkpoint of a "
+                f"{data.get('paginator')}"
+            )
+        if not isinstance(data.get("cursor"), dict):
+            raise ValueError("paginator checkpoint has no cursor")
+        try:
+            self._set_cursor_state(data["cursor"])
+        except KeyError as e:
+            raise ValueError(f"paginator checkpoint cursor is missing {e}") from e
+        self._exhausted = bool(data.get("exhausted", False))
+        return self
+
+    def on_checkpoint(
+        self, callback: Callable[[str], None], *, every: int = 1
+    ) -> "Paginator[PageT]":
+        """
+        Register a callback which is given a checkpoint (see :meth:`checkpoint`) every
+        ``every`` pages, and after the last page.
+
+        The checkpoint is produced when the consumer asks for the next page, once the
+        previous pages have been handled. If the process stops, paging restored from
+        the last checkpoint repeats at most ``every`` pages.
+
+        Returns this paginator.
+
+        :param callback: A callable which takes the checkpoint string, e.g. to save it
+            to a file
+        :type callback: callable
+        :param every: The number of pages between checkpoints
+        :type every: int
+
+        **Examples**
+
+        >>> def save(checkpoint):
+        >>>     with open("export.checkpoint", "w") as f:
+        >>>         f.write(checkpoint)
+        >>>
+        >>> paginator = sc.paginated.scroll(index_id, {"q": "*"})
+        >>> for item in paginator.on_checkpoint(save, every=10).items():
+        >>>     export(item)
+        """
+        if every < 1:
+            raise ValueError("checkpoint interval must be at least 1")
+        self._checkpoint_callback = callback
+        self._checkpoint_every = every
+        return self
 
     @classmethod
     def wrap(cls, method: Callable[P, R]) -> Callable[P, "Paginator[R]"]:
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 from .base import PageT, Paginator
 
@@ -20,8 +20,14 @@ class LastKeyPaginator(Paginator[PageT]):
         )
         self.last_key: Optional[str] = None
 
+    def _get_cursor_state(self) -> Dict[str, Any]:
+        return {"last_key": self.last_key}
+
+    def _set_cursor_state(self, state: Mapping[str, Any]) -> None:
+        self.last_key = state["last_key"]
+
     def pages(self) -> Iterator[PageT]:
-        has_next_page = True
+        has_next_page = not self._exhausted
         while has_next_page:
             if self.last_key:
                 self.client_kwargs["last_key"] = self.last_key
@@ -29,3 +35,4 @@ class LastKeyPaginator(Paginator[PageT]):
             yield current_page
             self.last_key = current_page.get("last_key")
             has_next_page = current_page["has_next_page"]
+            self._page_completed(has_next_page)
@@ -1,8 +1,21 @@
-from typing import Any, Callable, Dict, Iterator, List, Optional
+import collections
+import concurrent.futures
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from globus_sdk.response import GlobusHTTPResponse
 
 from .base import PageT, Paginator
 
 
+def _close_unused_page(future: "concurrent.futures.Future[Any]") -> None:
+    # a page which was fetched but never produced is closed, as it may be a streamed
+    # response which holds a connection open
+    if not future.cancelled() and future.exception() is None:
+        page = future.result()
+        if isinstance(page, GlobusHTTPResponse):
+            page._raw_response.close()
+
+
 class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-method
     def __init__(
         self,
@@ -34,6 +47,13 @@ class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-
             self.limit = self.max_total_results - self.offset
         self.client_kwargs["limit"] = self.limit
 
+    def _get_cursor_state(self) -> Dict[str, Any]:
+        return {"offset": self.offset}
+
+    def _set_cursor_state(self, state: Mapping[str, Any]) -> None:
+        self.offset = state["offset"]
+        self.client_kwargs["offset"] = self.offset
+
     def _update_and_check_offset(self, current_page: Dict[str, Any]) -> bool:
         self.offset += self.get_page_size(current_page)
         self.client_kwargs["offset"] = self.offset
@@ -44,23 +64,158 @@ class _LimitOffsetBasedPaginator(Paginator[PageT]):  # pylint: disable=abstract-
 
 class HasNextPaginator(_LimitOffsetBasedPaginator[PageT]):
     def pages(self) -> Iterator[PageT]:
-        has_next_page = True
+        has_next_page = not self._exhausted
         while has_next_page:
             self._update_limit()
             current_page = self.method(*self.client_args, **self.client_kwargs)
             yield current_page
-            if self._update_and_check_offset(current_page):
-                return
-            has_next_page = current_page["has_next_page"]
+            has_next_page = (
+                not self._update_and_check_offset(current_page)
+                and current_page["has_next_page"]
+            )
+            self._page_completed(has_next_page)
 
 
 class LimitOffsetTotalPaginator(_LimitOffsetBasedPaginator[PageT]):
+    """
+    A paginator which uses ``limit`` and ``offset`` to page, and stops when the
+    ``total`` from the results has been reached.
+
+    Because the ``total`` is known after the first page, the remaining pages may be
+    fetched in parallel. See :meth:`parallel`.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        *,
+        items_key: Optional[str] = None,
+        get_page_size: Callable[[Dict[str, Any]], int],
+        max_total_results: int,
+        page_size: int,
+        client_args: List[Any],
+        client_kwargs: Dict[str, Any],
+    ):
+        super().__init__(
+            method,
+            items_key=items_key,
+            get_page_size=get_page_size,
+            max_total_results=max_total_results,
+            page_size=page_size,
+            client_args=client_args,
+            client_kwargs=client_kwargs,
+        )
+        self.max_workers: Optional[int] = None
+
+    def parallel(self, max_workers: int = 4) -> "LimitOffsetTotalPaginator[PageT]":
+        """
+        Fetch pages in parallel.
+
+        After the first page is fetched, the paginator knows the ``total`` number of
+        results, and requests the remaining pages at once, with up to ``max_workers``
+        requests in flight. Pages are still produced in order, so ``pages()`` and
+        ``items()`` yield the same results as when fetching serially. If the service
+        returns fewer results than were requested for a page, the missing results are
+        fetched before any later pages are produced.
+
+        Returns this paginator.
+
+        :param max_workers: The maximum number of pages to fetch at once
+        :type max_workers: int
+
+        **Examples**
+
+        >>> tc = TransferClient(...)
+        >>> for task in tc.paginated.task_list().parallel(max_workers=8).items():
+        >>>     print(task["task_id"])
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        return self
+
     def pages(self) -> Iterator[PageT]:
-        has_next_page = True
+        if self.max_workers is not None:
+            yield from self._parallel_pages(self.max_workers)
+            return
+
+        has_next_page = not self._exhausted
         while has_next_page:
             self._update_limit()
             current_page = self.method(*self.client_args, **self.client_kwargs)
             yield current_page
-            if self._update_and_check_offset(current_page):
-                return
-            has_next_page = self.offset < current_page["total"]
+            has_next_page = (
+                not self._update_and_check_offset(current_page)
+                and self.offset < current_page["total"]
+            )
+            self._page_completed(has_next_page)
+
+    def _parallel_pages(self, max_workers: int) -> Iterator[PageT]:
+        if self._exhausted:
+            return
+        # the first page is fetched normally, to find the total
+        self._update_limit()
+        first_page = self.method(*self.client_args, **self.client_kwargs)
+        yield first_page
+        first_page_size = self.get_page_size(first_page)
+        has_next_page = (
+            not self._update_and_check_offset(first_page)
+            and self.offset < first_page["total"]
+            and first_page_size > 0
+        )
+        self._page_completed(has_next_page)
+        if not has_next_page:
+            return
+
+        end = first_page["total"]
+        if self.max_total_results is not None:
+            end = min(end, self.max_total_results)
+        # the service may return fewer results than were requested, so step by the
+        # size of the first page to avoid skipping results
+        step = min(self.limit, first_page_size)
+        windows = collections.deque(
+            (offset, min(step, end - offset))
+            for offset in range(self.offset, end, step)
+        )
+
+        def fetch(offset: int, limit: int) -> Any:
+            kwargs = {**self.client_kwargs, "offset": offset, "limit": limit}
+            return self.method(*self.client_args, **kwargs)
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="globus-sdk-paginator"
+        )
+        # (offset, limit, future) for each window which was requested
+        in_flight: Deque[
+            Tuple[int, int, "concurrent.futures.Future[Any]"]
+        ] = collections.deque()
+        try:
+            while windows or in_flight:
+                while windows and len(in_flight) < max_workers:
+                    offset, limit = windows.popleft()
+                    in_flight.append(
+                        (offset, limit, executor.submit(fetch, offset, limit))
+                    )
+                offset, limit, future = in_flight.popleft()
+                current_page = future.result()
+                yield current_page
+                page_size = self.get_page_size(current_page)
+                self.offset = offset + page_size
+                self.client_kwargs["offset"] = self.offset
+                if page_size == 0:
+                    # the results ended early, so the later windows are empty too
+                    windows.clear()
+                    for _, _, other in in_flight:
+                        other.cancel()
+                    in_flight.clear()
+                elif page_size < limit:
+                    # a short page leaves a gap before the next window, which must be
+                    # fetched before the next page is produced
+                    gap = (self.offset, limit - page_size)
+                    in_flight.appendleft((*gap, executor.submit(fetch, *gap)))
+                self._page_completed(bool(windows or in_flight))
+        finally:
+            for _, _, future in in_flight:
+                if not future.cancel():
+                    future.add_done_callback(_close_unused_page)
+            executor.shutdown(wait=False)
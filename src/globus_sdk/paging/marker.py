@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 from .base import PageT, Paginator
 
@@ -32,8 +32,14 @@ class MarkerPaginator(Paginator[PageT]):
     def _check_has_next_page(self, page: Dict[str, Any]) -> bool:
         return bool(page.get("has_next_page", False))
 
+    def _get_cursor_state(self) -> Dict[str, Any]:
+        return {"marker": self.marker}
+
+    def _set_cursor_state(self, state: Mapping[str, Any]) -> None:
+        self.marker = state["marker"]
+
     def pages(self) -> Iterator[PageT]:
-        has_next_page = True
+        has_next_page = not self._exhausted
         while has_next_page:
             if self.marker:
                 self.client_kwargs["marker"] = self.marker
@@ -41,6 +47,7 @@ class MarkerPaginator(Paginator[PageT]):
             yield current_page
             self.marker = current_page.get(self.marker_key)
             has_next_page = self._check_has_next_page(current_page)
+            self._page_completed(has_next_page)
 
 
 class NullableMarkerPaginator(MarkerPaginator[PageT]):
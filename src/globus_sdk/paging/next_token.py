@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Iterator, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 from .base import PageT, Paginator
 
@@ -28,8 +28,14 @@ class NextTokenPaginator(Paginator[PageT]):
         )
         self.next_token: Optional[str] = None
 
+    def _get_cursor_state(self) -> Dict[str, Any]:
+        return {"next_token": self.next_token}
+
+    def _set_cursor_state(self, state: Mapping[str, Any]) -> None:
+        self.next_token = state["next_token"]
+
     def pages(self) -> Iterator[PageT]:
-        has_next_page = True
+        has_next_page = not self._exhausted
         while has_next_page:
             if self.next_token:
                 self.client_kwargs["next_token"] = self.next_token
@@ -37,3 +43,4 @@ class NextTokenPaginator(Paginator[PageT]):
             yield current_page
             self.next_token = current_page.get("next_token")
             has_next_page = current_page.get("next_token") is not None
+            self._page_completed(has_next_page)
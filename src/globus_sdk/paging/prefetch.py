@@ -0,0 +1,150 @@
+import json
+import logging
+import queue
+import threading
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+
+from .base import PageT, Paginator
+
+log = logging.getLogger(__name__)
+
+# how long the worker waits on a full queue before checking if it should stop
+_PUT_POLL_INTERVAL = 0.1
+
+
+class _Done:
+    """Marks the end of the pages fetched by a prefetch worker"""
+
+
+class _Checkpoint:
+    """
+    Carries the checkpoint of the wrapped paginator after a page, which follows the
+    page in the queue
+    """
+
+    def __init__(self, checkpoint: str) -> None:
+        self.checkpoint = checkpoint
+        self.exhausted = bool(json.loads(checkpoint)["exhausted"])
+
+
+class _FetchError:
+    """Carries an error raised while fetching pages back to the consumer"""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class PrefetchingPaginator(Paginator[PageT]):
+    """
+    A paginator which wraps another paginator, fetching its pages on a worker thread
+    ahead of the consumer.
+
+    Up to ``depth`` pages are held in a queue, so the next pages are requested while
+    the caller is still handling the current one. Iterating over ``pages()`` or
+    ``items()`` produces the same results, in the same order, as the wrapped
+    paginator.
+
+    Checkpoints (see :meth:`Paginator.checkpoint \
+    <globus_sdk.paging.Paginator.checkpoint>`) follow the consumer, not the worker:
+    a page is only recorded as handled once the consumer asks for the next one, so
+    paging restored from a checkpoint never skips pages which were fetched but not
+    handled. A callback registered on the wrapped paginator with ``on_checkpoint``
+    is taken over by the ``PrefetchingPaginator``. The checkpoints are those of the
+    wrapped paginator, so they can be restored with or without prefetching.
+
+    ``PrefetchingPaginator`` objects are normally created with
+    :meth:`Paginator.prefetch <globus_sdk.paging.Paginator.prefetch>`.
+
+    :param paginator: The paginator whose pages will be fetched
+    :type paginator: Paginator
+    :param depth: The maximum number of pages to fetch ahead of the consumer
+    :type depth: int
+    """
+
+    def __init__(self, paginator: Paginator[PageT], *, depth: int = 2):
+        if depth < 1:
+            raise ValueError("prefetch depth must be at least 1")
+        super().__init__(
+            paginator.method,
+            items_key=paginator.items_key,
+            client_args=paginator.client_args,
+            client_kwargs=paginator.client_kwargs,
+        )
+        self.paginator = paginator
+        self.depth = depth
+        # the wrapped paginator runs ahead of the consumer, so its checkpoints are
+        # passed through the queue, and produced by this paginator
+        self._checkpoint_callback = paginator._checkpoint_callback
+        self._checkpoint_every = paginator._checkpoint_every
+        paginator._checkpoint_callback = None
+        # the checkpoint after the last page handled by the consumer, while paging
+        self._consumer_checkpoint: Optional[str] = None
+
+    def _get_cursor_state(self) -> Dict[str, Any]:
+        return self.paginator._get_cursor_state()
+
+    def _set_cursor_state(self, state: Mapping[str, Any]) -> None:
+        self.paginator._set_cursor_state(state)
+
+    def checkpoint(self) -> str:
+        if self._consumer_checkpoint is not None:
+            return self._consumer_checkpoint
+        return self.paginator.checkpoint()
+
+    def restore(self, checkpoint: str) -> "PrefetchingPaginator[PageT]":
+        self.paginator.restore(checkpoint)
+        self._consumer_checkpoint = None
+        return self
+
+    def pages(self) -> Iterator[PageT]:
+        # each page is followed by its checkpoint, so the queue holds two items for
+        # each page fetched ahead
+        pages_queue: "queue.Queue[Union[PageT, _Checkpoint, _Done, _FetchError]]" = (
+            queue.Queue(maxsize=2 * self.depth)
+        )
+        stop = threading.Event()
+        self._consumer_checkpoint = self.paginator.checkpoint()
+
+        def put(item: Any) -> bool:
+            # put an item on the queue, giving up if the consumer has stopped
+            while not stop.is_set():
+                try:
+                    pages_queue.put(item, timeout=_PUT_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch() -> None:
+            # `_page_completed` of the wrapped paginator runs on this thread
+            def put_checkpoint(checkpoint: str) -> None:
+                put(_Checkpoint(checkpoint))
+
+            self.paginator.on_checkpoint(put_checkpoint)
+            try:
+                for page in self.paginator.pages():
+                    if not put(page):
+                        log.debug("prefetch consumer stopped, worker exiting")
+                        return
+            except Exception as err:
+                put(_FetchError(err))
+            else:
+                put(_Done())
+
+        worker = threading.Thread(target=fetch, name="globus-sdk-prefetch", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = pages_queue.get()
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _FetchError):
+                    raise item.error
+                if isinstance(item, _Checkpoint):
+                    # the consumer has asked for the page after the checkpoint
+                    self._consumer_checkpoint = item.checkpoint
+                    self._page_completed(not item.exhausted)
+                    continue
+                yield item
+        finally:
+            stop.set()
@@ -15,6 +15,8 @@ from typing import (
 
 from requests import Response
 
+from globus_sdk.transport.json_codec import get_response_codec
+
 log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -26,7 +28,8 @@ class GlobusHTTPResponse:
     Response object that wraps an HTTP response from the underlying HTTP
     library. If the response is JSON, the parsed data will be available in
     ``data``, otherwise ``data`` will be ``None`` and ``text`` should
-    be used instead.
+    be used instead. The response body is parsed when ``data`` (or an item of
+    the response) is first accessed, and the result is reused.
 
     The most common response data is a JSON dictionary. To make
     handling this type of response as seamless as possible, the
@@ -55,9 +58,6 @@ class GlobusHTTPResponse:
             self._response: Optional[Response] = None
             self.client: "globus_sdk.BaseClient" = self._wrapped.client
 
-            # copy parsed JSON data off of '_wrapped'
-            self._parsed_json: Any = self._wrapped._parsed_json
-
         # init on a Response object, this is the "normal" case
         # _wrapped is None
         else:
@@ -67,18 +67,35 @@ class GlobusHTTPResponse:
             self._response = response
             self.client = client
 
-            # JSON decoding may raise a ValueError due to an invalid JSON
-            # document. In the case of trying to fetch the "data" on an HTTP
-            # response, this means we didn't get a JSON response.
-            # store this as None, as in "no data"
-            #
-            # if the caller *really* wants the raw body of the response, they can
-            # always use `text`
-            try:
-                self._parsed_json = self._response.json()
-            except ValueError:
-                log.warning("response data did not parse as JSON, data=None")
-                self._parsed_json = None
+        # the body is parsed on first use, as many responses are never read (e.g.
+        # when only the status matters)
+        self._did_parse_json = False
+        self._parsed_json_data: Any = None
+
+    @property
+    def _parsed_json(self) -> Any:
+        # a wrapping response shares the parsed data of the response it wraps, so
+        # that the body is parsed at most once
+        if self._wrapped is not None:
+            return self._wrapped._parsed_json
+        if not self._did_parse_json:
+            self._parsed_json_data = self._parse_json()
+            self._did_parse_json = True
+        return self._parsed_json_data
+
+    def _parse_json(self) -> Any:
+        # JSON decoding may raise a ValueError due to an invalid JSON
+        # document. In the case of trying to fetch the "data" on an HTTP
+        # response, this means we didn't get a JSON response.
+        # store this as None, as in "no data"
+        #
+        # if the caller *really* wants the raw body of the response, they can
+        # always use `text`
+        try:
+            return get_response_codec(self.client).load_response(self._raw_response)
+        except ValueError:
+            log.warning("response data did not parse as JSON, data=None")
+            return None
 
     @property
     def _raw_response(self) -> Response:
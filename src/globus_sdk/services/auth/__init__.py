@@ -1,10 +1,12 @@
 from .client import AuthClient, ConfidentialAppAuthClient, NativeAppAuthClient
+from .dependent_token_cache import DependentTokenCache
 from .errors import AuthAPIError
 from .flow_managers import (
     GlobusAuthorizationCodeFlowManager,
     GlobusNativeAppFlowManager,
 )
 from .identity_map import IdentityMap
+from .introspection_cache import TokenIntrospectionCache
 from .response import OAuthDependentTokenResponse, OAuthTokenResponse
 
 __all__ = [
@@ -12,9 +14,11 @@ __all__ = [
     "AuthAPIError",
     "NativeAppAuthClient",
     "ConfidentialAppAuthClient",
+    "DependentTokenCache",
     "IdentityMap",
     "GlobusNativeAppFlowManager",
     "GlobusAuthorizationCodeFlowManager",
     "OAuthDependentTokenResponse",
     "OAuthTokenResponse",
+    "TokenIntrospectionCache",
 ]
@@ -0,0 +1,125 @@
+"""
+A process-wide cache of the OIDC configuration and signing keys of Globus Auth, used
+to decode ID tokens without fetching them for every token.
+"""
+import json
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+
+from globus_sdk._cache import TTLCache
+
+if TYPE_CHECKING:
+    from .client import AuthClient
+
+log = logging.getLogger(__name__)
+
+# how long the OIDC configuration and signing keys are reused before being fetched
+# again
+CACHE_TTL = 3600.0
+# when a token is signed with an unknown key, the keys are fetched again, unless they
+# were fetched less than this many seconds ago
+MIN_KEY_REFRESH_INTERVAL = 30.0
+
+# (environment, base_url) -> OIDC configuration
+_ConfigKeyType = Tuple[str, str]
+# (environment, base_url, jwks_uri) -> (fetched at, key ID -> key)
+_KeysKeyType = Tuple[str, str, str]
+_KeysType = Tuple[float, Dict[Optional[str], RSAPublicKey]]
+
+_configs: TTLCache[_ConfigKeyType, Dict[str, Any]] = TTLCache(maxsize=64, ttl=CACHE_TTL)
+_signing_keys: TTLCache[_KeysKeyType, _KeysType] = TTLCache(maxsize=64, ttl=CACHE_TTL)
+# held while fetching, so that concurrent cache misses result in one fetch
+_fetch_lock = threading.Lock()
+
+
+def get_openid_configuration(auth_client: "AuthClient") -> Dict[str, Any]:
+    """
+    Get the OIDC configuration for the environment and base URL of a client.
+    """
+    key = (auth_client.environment, auth_client.base_url)
+    config = _configs.get(key)
+    if config is not None:
+        return config
+    with _fetch_lock:
+        config = _configs.get(key)
+        if config is None:
+            log.debug("OIDC config cache miss, fetching")
+            config = dict(auth_client.get_openid_configuration().data)
+            _configs.set(key, config)
+    return config
+
+
+def _fetch_signing_keys(auth_client: "AuthClient", jwks_uri: str) -> _KeysType:
+    log.debug("fetching JWKs from %s", jwks_uri)
+    jwk_data = auth_client.get(jwks_uri).data
+    keys: Dict[Optional[str], RSAPublicKey] = {}
+    for key_data in jwk_data["keys"]:
+        if key_data.get("kty") != "RSA" or key_data.get("use", "sig") != "sig":
+            continue
+        # cast here because this should never be private key
+        keys.setdefault(
+            key_data.get("kid"),
+            cast(
+                RSAPublicKey, jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(key_data))
+            ),
+        )
+    return (time.monotonic(), keys)
+
+
+def _find_key(
+    keys: Dict[Optional[str], RSAPublicKey], kid: Optional[str]
+) -> Optional[RSAPublicKey]:
+    if kid in keys:
+        return keys[kid]
+    # a token without a key ID is checked against the first key
+    if kid is None and keys:
+        return next(iter(keys.values()))
+    return None
+
+
+def get_signing_key(
+    auth_client: "AuthClient", jwks_uri: str, kid: Optional[str]
+) -> RSAPublicKey:
+    """
+    Get the public key with the given key ID from the JWKs at ``jwks_uri``.
+
+    If there is no such key, the JWKs are fetched again, in case the keys were
+    rotated.
+
+    :raises jwt.InvalidTokenError: if no key has the key ID
+    """
+    cache_key = (auth_client.environment, auth_client.base_url, jwks_uri)
+    cached = _signing_keys.get(cache_key)
+    if cached is not None:
+        key = _find_key(cached[1], kid)
+        if key is not None:
+            return key
+
+    with _fetch_lock:
+        # another thread may have fetched the keys while this one waited
+        latest = _signing_keys.get(cache_key)
+        if latest is not None and latest is not cached:
+            key = _find_key(latest[1], kid)
+            if key is not None:
+                return key
+        if latest is None or (time.monotonic() - latest[0] >= MIN_KEY_REFRESH_INTERVAL):
+            latest = _fetch_signing_keys(auth_client, jwks_uri)
+            _signing_keys.set(cache_key, latest)
+
+    key = _find_key(latest[1], kid)
+    if key is None:
+        raise jwt.InvalidTokenError(f"no signing key found with kid '{kid}'")
+    return key
+
+
+def clear() -> None:
+    """
+    Drop all cached OIDC configurations and signing keys.
+    """
+    _configs.clear()
+    _signing_keys.clear()
@@ -0,0 +1,169 @@
+import concurrent.futures
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from globus_sdk import utils
+from globus_sdk._cache import CacheStats, TTLCache
+
+from .client import ConfidentialAppAuthClient
+
+log = logging.getLogger(__name__)
+
+# the key for a dependent token exchange: the token hash and the serialized
+# additional params
+_KeyType = Tuple[str, str]
+_TokenDataType = Dict[str, Dict[str, Any]]
+
+
+class DependentTokenCache:
+    r"""
+    A ``DependentTokenCache`` caches the results of
+    :meth:`ConfidentialAppAuthClient.oauth2_get_dependent_tokens \
+    <globus_sdk.ConfidentialAppAuthClient.oauth2_get_dependent_tokens>`, for services
+    which exchange the token sent with each request they receive for dependent
+    tokens.
+
+    Results are cached under a sha256 hash of the upstream token and the
+    ``additional_params`` of the exchange (e.g. ``access_type``), so the cache does
+    not hold upstream tokens themselves. A result is reused until ``safety_margin``
+    seconds before the first of its dependent tokens expires.
+
+    If several threads ask for the same exchange at once, only one request is sent to
+    Globus Auth, and all of the threads receive its result.
+
+    :param auth_client: The client used to get dependent tokens
+    :type auth_client: :class:`ConfidentialAppAuthClient \
+        <globus_sdk.ConfidentialAppAuthClient>`
+    :param safety_margin: The number of seconds before the dependent tokens expire at
+        which the cached result is no longer used
+    :type safety_margin: float
+    :param maxsize: The maximum number of results to cache
+    :type maxsize: int
+
+    **Examples**
+
+    >>> ac = globus_sdk.ConfidentialAppAuthClient(CLIENT_ID, CLIENT_SECRET)
+    >>> dependent_tokens = globus_sdk.DependentTokenCache(ac)
+    >>> # in a request handler
+    >>> tokens = dependent_tokens.get_dependent_tokens(token)
+    >>> transfer_token = tokens["transfer.api.globus.org"]["access_token"]
+    """
+
+    def __init__(
+        self,
+        auth_client: ConfidentialAppAuthClient,
+        *,
+        safety_margin: float = 300.0,
+        maxsize: int = 4096,
+    ):
+        self.auth_client = auth_client
+        self.safety_margin = safety_margin
+        self._cache: TTLCache[_KeyType, _TokenDataType] = TTLCache(maxsize=maxsize)
+        # exchanges which are in progress, which other threads may wait on
+        self._in_flight: Dict[
+            _KeyType, "concurrent.futures.Future[_TokenDataType]"
+        ] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Counters of cache ``hits``, ``misses``, ``evictions``, ``expirations``, and
+        ``invalidations``, and the ``hit_rate``.
+        """
+        return self._cache.stats
+
+    def get_dependent_tokens(
+        self, token: str, *, additional_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get dependent tokens for a token, using a cached result if there is one.
+
+        The parameters are the same as those of
+        :meth:`ConfidentialAppAuthClient.oauth2_get_dependent_tokens \
+        <globus_sdk.ConfidentialAppAuthClient.oauth2_get_dependent_tokens>`.
+
+        Returns the token data indexed by resource server, as in
+        :attr:`OAuthTokenResponse.by_resource_server \
+        <globus_sdk.OAuthTokenResponse.by_resource_server>`.
+
+        :param token: A Globus Access Token as a string
+        :type token: str
+        :param additional_params: Additional parameters to include in the request body
+        :type additional_params: dict, optional
+        """
+        key = (
+            utils.sha256_string(token),
+            json.dumps(additional_params or {}, sort_keys=True),
+        )
+        while True:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    log.debug("dependent token cache hit")
+                    return _copy_token_data(cached)
+                in_flight = self._in_flight.get(key)
+                if in_flight is None:
+                    in_flight = concurrent.futures.Future()
+                    self._in_flight[key] = in_flight
+                    break
+
+            log.debug("waiting for an in-progress dependent token exchange")
+            error = in_flight.exception()
+            if error is None:
+                return _copy_token_data(in_flight.result())
+            if isinstance(error, Exception):
+                raise utils.copy_error(error) from error
+            # the exchange was interrupted, e.g. by a KeyboardInterrupt in the thread
+            # which made it, so it is made again rather than interrupting this thread
+            log.debug("in-progress dependent token exchange was interrupted")
+
+        log.debug("dependent token cache miss")
+        try:
+            response = self.auth_client.oauth2_get_dependent_tokens(
+                token, additional_params=additional_params
+            )
+            token_data = response.by_resource_server
+            expires_at = min(
+                (data["expires_at_seconds"] for data in token_data.values()),
+                default=time.time(),
+            )
+            self._cache.set(
+                key, token_data, ttl=expires_at - self.safety_margin - time.time()
+            )
+            in_flight.set_result(token_data)
+        except BaseException as err:
+            # the waiting callers must always be woken, even if this thread is
+            # interrupted, or they would wait forever
+            in_flight.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return _copy_token_data(token_data)
+
+    def invalidate(self, token: str) -> int:
+        """
+        Drop all cached results for an upstream token.
+
+        Returns the number of cached results which were dropped.
+
+        :param token: A Globus Access Token as a string
+        :type token: str
+        """
+        token_hash = utils.sha256_string(token)
+        return self._cache.invalidate_matching(lambda key: key[0] == token_hash)
+
+    def clear(self) -> None:
+        """
+        Drop all cached results.
+        """
+        self._cache.clear()
+
+
+def _copy_token_data(token_data: _TokenDataType) -> _TokenDataType:
+    # callers get copies, so that changes they make are not seen by other callers
+    return {rs: dict(data) for rs, data in token_data.items()}
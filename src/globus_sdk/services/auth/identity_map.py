@@ -1,5 +1,19 @@
+import concurrent.futures
+import time
 import uuid
-from typing import Any, Dict, Iterable, MutableMapping, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from globus_sdk.response import GlobusHTTPResponse
 
 from .client import AuthClient
 
@@ -67,6 +81,9 @@ class IdentityMap:
     map, it will be immediately added. But adding many identities beforehand will
     improve performance.
 
+    To resolve a large number of identities at once, add them and then call
+    :py:meth:`~IdentityMap.resolve_all`, which fetches the batches concurrently.
+
     The ``IdentityMap`` will cache its results so that repeated lookups of the same Identity
     will not repeat work. It will also map identities both by ID and by Username,
     regardless of how they're initially looked up.
@@ -123,7 +140,23 @@ class IdentityMap:
     :param cache:  A dict or other mapping object which will be used to cache results.
         The default is that results are cached once per IdentityMap object. If you want
         multiple IdentityMaps to share data, explicitly pass the same ``cache`` to both.
+        A cache which records when it stored each identity, like
+        :class:`SQLiteIdentityCache <globus_sdk.tokenstorage.SQLiteIdentityCache>`,
+        provides ``get_many(keys, max_age=...)`` and ``put_many(identities)`` methods,
+        which are used to read and write many identities at once.
     :type cache: MutableMapping, optional
+    :param cache_ttl: The number of seconds for which a resolved identity is cached.
+        After this time, looking it up again fetches a fresh record from Globus Auth.
+        The default is to cache records for the lifetime of the cache. For a cache
+        with a ``get_many`` method, the age of a record is measured from the time at
+        which the cache stored it. For other mappings, it is measured from the time at
+        which this ``IdentityMap`` stored the record, or first found it in the cache.
+    :type cache_ttl: float, optional
+    :param negative_cache_ttl: The number of seconds for which identities which were
+        not found are remembered. During this time, looking them up again raises a
+        KeyError without calling Globus Auth. The default is not to remember identities
+        which were not found, so every lookup of one makes a new call.
+    :type negative_cache_ttl: float, optional
 
     .. automethodlist:: globus_sdk.IdentityMap
         include_methods=__getitem__,__delitem__
@@ -138,6 +171,8 @@ class IdentityMap:
         *,
         id_batch_size: Optional[int] = None,
         cache: Optional[MutableMapping[str, Dict[str, Any]]] = None,
+        cache_ttl: Optional[float] = None,
+        negative_cache_ttl: Optional[float] = None,
     ):
         self.auth_client = auth_client
         self.id_batch_size = id_batch_size or self._default_id_batch_size
@@ -150,6 +185,60 @@ class IdentityMap:
         # a cache may be passed in via the constructor in order to make multiple
         # IdentityMap objects share a cache
         self._cache = cache if cache is not None else {}
+        # caches which support bulk reads, like SQLiteIdentityCache, also record when
+        # they stored each identity, and are used to check for expired records
+        self._cache_get_many: Optional[
+            Callable[..., Dict[str, Dict[str, Any]]]
+        ] = getattr(self._cache, "get_many", None)
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        # for other caches, the times at which cached keys were stored (or, for a
+        # shared cache, first seen by this map), used to expire them
+        self._cached_at: Dict[str, float] = {}
+        # keys which were looked up but not found, and the times of those lookups
+        self._not_found: Dict[str, float] = {}
+
+    def _get_cached(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the records for those of the keys which are cached and have not expired.
+        """
+        if self._cache_get_many is not None:
+            return self._cache_get_many(keys, max_age=self.cache_ttl)
+        return {key: self._cache[key] for key in keys if self._is_cached(key)}
+
+    def _is_cached(self, key: str) -> bool:
+        """
+        Check if a key is in the cache, first dropping it if it has expired.
+        """
+        if self._cache_get_many is not None:
+            return key in self._get_cached([key])
+        if key not in self._cache:
+            return False
+        if self.cache_ttl is None:
+            return True
+        now = time.monotonic()
+        cached_at = self._cached_at.setdefault(key, now)
+        if now - cached_at < self.cache_ttl:
+            return True
+        # the entry may have already been dropped via a shared cache
+        self._cache.pop(key, None)
+        del self._cached_at[key]
+        return False
+
+    def _is_not_found(self, key: str) -> bool:
+        """
+        Check if a key was recently looked up and not found, first dropping it if the
+        negative cache entry has expired.
+        """
+        if key not in self._not_found:
+            return False
+        if (
+            self.negative_cache_ttl is not None
+            and time.monotonic() - self._not_found[key] < self.negative_cache_ttl
+        ):
+            return True
+        del self._not_found[key]
+        return False
 
     def _create_batch(self, key: str) -> Set[str]:
         """
@@ -172,13 +261,18 @@ class IdentityMap:
 
         # until we've exhausted the set or filled the batch, keep trying to add
         while set_to_use and len(batch) < self.id_batch_size:
-            value = set_to_use.pop()
-
-            # value may already have been looked up if the cache is shared, skip those
-            if value in self._cache:
-                continue
-
-            batch.add(value)
+            candidates = [
+                set_to_use.pop()
+                for _ in range(min(len(set_to_use), self.id_batch_size - len(batch)))
+            ]
+            # values may already have been looked up if the cache is shared, skip
+            # those and values which are known not to exist
+            cached = self._get_cached(candidates)
+            batch.update(
+                value
+                for value in candidates
+                if value not in cached and not self._is_not_found(value)
+            )
 
         return batch
 
@@ -196,10 +290,97 @@ class IdentityMap:
             response = self.auth_client.get_identities(usernames=batch)
         else:
             response = self.auth_client.get_identities(ids=batch)
+        self._store_batch_results(batch, response)
+
+    def _store_batch_results(
+        self, batch: Set[str], response: GlobusHTTPResponse
+    ) -> None:
+        """
+        Store the identities from a response in the cache, and if negative caching is
+        enabled, record the members of the batch which were not found.
+        """
+        now = time.monotonic()
+        identities = response["identities"]
+        # caches which support bulk writes, like SQLiteIdentityCache, store the whole
+        # batch at once
+        put_many = getattr(self._cache, "put_many", None)
+        if put_many is not None:
+            put_many(identities)
+
+        found = set()
+        for x in identities:
+            for found_key in (x["id"], x["username"]):
+                if put_many is None:
+                    self._cache[found_key] = x
+                if self._cache_get_many is None:
+                    self._cached_at[found_key] = now
+                found.add(found_key)
+
+        if self.negative_cache_ttl is not None:
+            for missing_key in batch - found:
+                self._not_found[missing_key] = now
+
+    def resolve_all(self, *, max_workers: int = 4) -> None:
+        """
+        Look up all of the unresolved IDs and usernames in the ``IdentityMap``.
+
+        The unresolved values are split into batches, which are fetched from Globus Auth
+        concurrently, with up to ``max_workers`` calls in flight at once. This is much
+        faster than resolving the batches one by one when looking up a large number of
+        identities, e.g. when warming the cache before processing a long list of ACLs.
 
-        for x in response["identities"]:
-            self._cache[x["id"]] = x
-            self._cache[x["username"]] = x
+        If any of the calls fail, the values from the failed batches remain unresolved
+        and the first error is raised after all calls have completed.
+
+        :param max_workers: The maximum number of calls to make at once
+        :type max_workers: int
+
+        **Examples**
+
+        >>> idmap = globus_sdk.IdentityMap(ac, identity_ids)
+        >>> idmap.resolve_all(max_workers=8)
+        >>> # lookups are now served from the cache
+        >>> usernames = [idmap[i]["username"] for i in identity_ids]
+        """
+        batches: List[Tuple[Set[str], Set[str]]] = []
+        for unresolved in (self.unresolved_ids, self.unresolved_usernames):
+            cached = self._get_cached(unresolved)
+            values = [
+                value
+                for value in unresolved
+                if value not in cached and not self._is_not_found(value)
+            ]
+            unresolved.clear()
+            batch_size = self.id_batch_size
+            for start in range(0, len(values), batch_size):
+                end = start + batch_size
+                batches.append((unresolved, set(values[start:end])))
+        if not batches:
+            return
+
+        def fetch(unresolved: Set[str], batch: Set[str]) -> GlobusHTTPResponse:
+            if unresolved is self.unresolved_usernames:
+                return self.auth_client.get_identities(usernames=batch)
+            return self.auth_client.get_identities(ids=batch)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="globus-sdk-identity-map"
+        ) as executor:
+            futures = [executor.submit(fetch, *batch_info) for batch_info in batches]
+
+        # results are stored from this thread, so that the cache does not need to
+        # support concurrent writes
+        errors: List[Exception] = []
+        for (unresolved, batch), future in zip(batches, futures):
+            try:
+                response = future.result()
+            except Exception as err:
+                unresolved.update(batch)
+                errors.append(err)
+            else:
+                self._store_batch_results(batch, response)
+        if errors:
+            raise errors[0]
 
     def add(self, identity_id: str) -> bool:
         """
@@ -212,7 +393,7 @@ class IdentityMap:
             add
         :type identity_id: str
         """
-        if identity_id in self._cache:
+        if self._is_cached(identity_id) or self._is_not_found(identity_id):
             return False
         if is_username(identity_id):
             if identity_id in self.unresolved_usernames:
@@ -238,13 +419,24 @@ class IdentityMap:
         """
         ``IdentityMap`` supports dict-like lookups with ``map[key]``
         """
-        if key not in self._cache:
-            self._fetch_batch_including(key)
+        cached = self._get_cached([key])
+        if key in cached:
+            return cached[key]
+        if self._is_not_found(key):
+            raise KeyError(key)
+        self._fetch_batch_including(key)
         return self._cache[key]
 
     def __delitem__(self, key: str) -> None:
         """
         ``IdentityMap`` supports ``del map[key]``. Note that this only removes lookup
         values from the cache and will not impact the set of unresolved/pending IDs.
+
+        Deleting a key which was not found removes it from the negative cache, so that
+        the next lookup calls Globus Auth again.
         """
+        if key in self._not_found:
+            del self._not_found[key]
+            return
+        self._cached_at.pop(key, None)
         del self._cache[key]
@@ -0,0 +1,126 @@
+import logging
+import time
+from typing import Optional, Tuple
+
+from globus_sdk import utils
+from globus_sdk._cache import CacheStats, TTLCache
+from globus_sdk.response import GlobusHTTPResponse
+from globus_sdk.transport.response_cache import clone_response
+
+from .client import ConfidentialAppAuthClient
+
+log = logging.getLogger(__name__)
+
+
+def _copy_response(response: GlobusHTTPResponse) -> GlobusHTTPResponse:
+    # each caller gets its own response, with its own parsed data, so that a caller
+    # which modifies its result cannot change the results of other callers
+    return GlobusHTTPResponse(clone_response(response._raw_response), response.client)
+
+
+class TokenIntrospectionCache:
+    r"""
+    A ``TokenIntrospectionCache`` caches the results of
+    :meth:`ConfidentialAppAuthClient.oauth2_token_introspect \
+    <globus_sdk.ConfidentialAppAuthClient.oauth2_token_introspect>`, for resource
+    servers which introspect the token sent with each request they receive.
+
+    Results are cached under a sha256 hash of the token, so the cache does not hold
+    tokens themselves. An entry expires after ``ttl`` seconds, or when the token
+    expires (its ``exp``), whichever comes first. Results for inactive tokens are
+    cached for ``ttl`` seconds. When the cache holds ``maxsize`` entries, the least
+    recently used entry is evicted.
+
+    A cached result may be out of date if the token is revoked, so ``ttl`` bounds how
+    long a revoked token may continue to be accepted. Use :meth:`invalidate` to drop
+    a token which is known to be revoked.
+
+    Each caller gets its own copy of a cached result, so results may be modified
+    without affecting other callers.
+
+    :param auth_client: The client used to introspect tokens
+    :type auth_client: :class:`ConfidentialAppAuthClient \
+        <globus_sdk.ConfidentialAppAuthClient>`
+    :param ttl: The maximum number of seconds for which a result is cached
+    :type ttl: float
+    :param maxsize: The maximum number of results to cache
+    :type maxsize: int
+
+    **Examples**
+
+    >>> ac = globus_sdk.ConfidentialAppAuthClient(CLIENT_ID, CLIENT_SECRET)
+    >>> introspect_cache = globus_sdk.TokenIntrospectionCache(ac, ttl=30)
+    >>> # in a request handler
+    >>> data = introspect_cache.introspect(token, include="identity_set")
+    >>> if not data["active"]:
+    >>>     raise Unauthorized()
+    """
+
+    def __init__(
+        self,
+        auth_client: ConfidentialAppAuthClient,
+        *,
+        ttl: float = 60.0,
+        maxsize: int = 4096,
+    ):
+        self.auth_client = auth_client
+        self.ttl = ttl
+        self._cache: TTLCache[Tuple[str, Optional[str]], GlobusHTTPResponse] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Counters of cache ``hits``, ``misses``, ``evictions``, ``expirations``, and
+        ``invalidations``, and the ``hit_rate``.
+        """
+        return self._cache.stats
+
+    def introspect(
+        self, token: str, *, include: Optional[str] = None
+    ) -> GlobusHTTPResponse:
+        """
+        Introspect a token, using a cached result if there is one.
+
+        The parameters are the same as those of
+        :meth:`ConfidentialAppAuthClient.oauth2_token_introspect \
+        <globus_sdk.ConfidentialAppAuthClient.oauth2_token_introspect>`.
+
+        :param token: An Access Token as a raw string, being evaluated
+        :type token: str
+        :param include: A value for the ``include`` parameter in the request body
+        :type include: str, optional
+        """
+        key = (utils.sha256_string(token), include)
+        cached = self._cache.get(key)
+        if cached is not None:
+            log.debug("token introspection cache hit")
+            return _copy_response(cached)
+
+        log.debug("token introspection cache miss")
+        response = self.auth_client.oauth2_token_introspect(token, include=include)
+        ttl = self.ttl
+        exp = response.get("exp") if response.get("active") else None
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        self._cache.set(key, _copy_response(response), ttl=ttl)
+        return response
+
+    def invalidate(self, token: str) -> int:
+        """
+        Drop all cached results for a token, e.g. when it is known to be revoked.
+
+        Returns the number of cached results which were dropped.
+
+        :param token: An Access Token as a raw string
+        :type token: str
+        """
+        token_hash = utils.sha256_string(token)
+        return self._cache.invalidate_matching(lambda key: key[0] == token_hash)
+
+    def clear(self) -> None:
+        """
+        Drop all cached results.
+        """
+        self._cache.clear()
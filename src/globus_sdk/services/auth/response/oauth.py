@@ -9,6 +9,8 @@ from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from globus_sdk import exc
 from globus_sdk.response import GlobusHTTPResponse
 
+from .. import _oidc_cache
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -181,11 +183,17 @@ class OAuthTokenResponse(GlobusHTTPResponse):
 
         If you provide the `jwk`, you must also provide `openid_configuration`.
 
+        The OIDC config and JWKs which are fetched automatically are cached for the
+        whole process, so decoding is usually done without any requests to Globus
+        Auth. If the ID Token is signed with a key which is not in the cached JWKs,
+        e.g. after the keys are rotated, the JWKs are fetched again.
+
         :param openid_configuration: The OIDC config as a GlobusHTTPResponse or dict.
             When not provided, it will be fetched automatically.
         :type openid_configuration: dict or GlobusHTTPResponse
         :param jwk: The JWK as a cryptography public key object. When not provided, it
-            will be fetched and parsed automatically.
+            will be fetched and parsed automatically, and the key matching the ``kid``
+            of the ID Token will be used.
         :type jwk: RSAPublicKey
         :param jwt_params: An optional dict of parameters to pass to the jwt decode
             step. These are passed verbatim to the jwt library.
@@ -201,16 +209,17 @@ class OAuthTokenResponse(GlobusHTTPResponse):
                 raise exc.GlobusSDKUsageError(
                     "passing jwk without openid configuration is not allowed"
                 )
-            logger.debug("No OIDC Config provided, autofetching...")
+            logger.debug("No OIDC Config provided, using cached or autofetching...")
             oidc_config: Union[
                 GlobusHTTPResponse, Dict[str, Any]
-            ] = auth_client.get_openid_configuration()
+            ] = _oidc_cache.get_openid_configuration(auth_client)
         else:
             oidc_config = openid_configuration
 
         if not jwk:
-            logger.debug("No JWK provided, autofetching + decoding...")
-            jwk = auth_client.get_jwk(openid_configuration=oidc_config, as_pem=True)
+            logger.debug("No JWK provided, using cached or autofetching + decoding...")
+            kid = jwt.get_unverified_header(self["id_token"]).get("kid")
+            jwk = _oidc_cache.get_signing_key(auth_client, oidc_config["jwks_uri"], kid)
 
         logger.debug("final step: decode with JWK")
         signing_algos = oidc_config["id_token_signing_alg_values_supported"]
@@ -10,11 +10,33 @@ class GCSAPIError(exc.GlobusAPIError):
     Error class for the GCS Manager API client
     """
 
+    _parses_lazily = True
+
     def __init__(self, r: requests.Response) -> None:
-        self.detail_data_type: Optional[str] = None
-        self.detail: Union[None, str, Dict[str, Any]] = None
+        self._detail_data_type: Optional[str] = None
+        self._detail: Union[None, str, Dict[str, Any]] = None
         super().__init__(r)
 
+    @property
+    def detail_data_type(self) -> Optional[str]:
+        self._parse_response_once()
+        return self._detail_data_type
+
+    @detail_data_type.setter
+    def detail_data_type(self, value: Optional[str]) -> None:
+        self._parse_response_once()
+        self._detail_data_type = value
+
+    @property
+    def detail(self) -> Union[None, str, Dict[str, Any]]:
+        self._parse_response_once()
+        return self._detail
+
+    @detail.setter
+    def detail(self, value: Union[None, str, Dict[str, Any]]) -> None:
+        self._parse_response_once()
+        self._detail = value
+
     def _get_args(self) -> List[Any]:
         args = super()._get_args()
         args.append(self.detail_data_type)
@@ -28,6 +50,6 @@ class GCSAPIError(exc.GlobusAPIError):
         super()._load_from_json(data)
         # detail can be a full document, so fetch, then look for a DATA_TYPE
         # and expose it as a top-level attribute for easy access
-        self.detail = data.get("detail")
-        if isinstance(self.detail, dict) and "DATA_TYPE" in self.detail:
-            self.detail_data_type = self.detail["DATA_TYPE"]
+        self._detail = data.get("detail")
+        if isinstance(self._detail, dict) and "DATA_TYPE" in self._detail:
+            self._detail_data_type = self._detail["DATA_TYPE"]
@@ -17,10 +17,22 @@ class SearchAPIError(exc.GlobusAPIError):
     # the Search API always and only returns 'message' for string messages
     MESSAGE_FIELDS = ["message"]
 
+    _parses_lazily = True
+
     def __init__(self, r: requests.Response) -> None:
-        self.error_data = None
+        self._error_data: Any = None
         super().__init__(r)
 
+    @property
+    def error_data(self) -> Any:
+        self._parse_response_once()
+        return self._error_data
+
+    @error_data.setter
+    def error_data(self, value: Any) -> None:
+        self._parse_response_once()
+        self._error_data = value
+
     def _load_from_json(self, data: Dict[str, Any]) -> None:
         super()._load_from_json(data)
-        self.error_data = data.get("error_data")
+        self._error_data = data.get("error_data")
@@ -14,6 +14,9 @@ class TimerAPIError(GlobusAPIError):
 
     MESSAGE_FIELDS: List[str] = []  # we are overriding `_load_from_json` instead
 
+    # only `code` and `message` are parsed, and they are read lazily
+    _parses_lazily = True
+
     def _load_from_json(self, data: Dict[str, Any]) -> None:
         """
         Errors generated by Timer itself look like this:
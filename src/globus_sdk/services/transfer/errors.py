@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import requests
 
@@ -14,10 +14,22 @@ class TransferAPIError(exc.GlobusAPIError):
                       provided when contacting support@globus.org.
     """
 
+    _parses_lazily = True
+
     def __init__(self, r: requests.Response) -> None:
-        self.request_id = None
+        self._request_id: Optional[str] = None
         super().__init__(r)
 
+    @property
+    def request_id(self) -> Optional[str]:
+        self._parse_response_once()
+        return self._request_id
+
+    @request_id.setter
+    def request_id(self, value: Optional[str]) -> None:
+        self._parse_response_once()
+        self._request_id = value
+
     def _get_args(self) -> List[Any]:
         args = super()._get_args()
         args.append(self.request_id)
@@ -25,4 +37,4 @@ class TransferAPIError(exc.GlobusAPIError):
 
     def _load_from_json(self, data: Dict[str, Any]) -> None:
         super()._load_from_json(data)
-        self.request_id = data.get("request_id")
+        self._request_id = data.get("request_id")
@@ -1,6 +1,7 @@
 import abc
 import contextlib
 import os
+import sys
 from typing import Any, Dict, Iterator, Optional
 
 from globus_sdk.services.auth import OAuthTokenResponse
@@ -30,6 +31,19 @@ class StorageAdapter(metaclass=abc.ABCMeta):
         """
         self.store(token_response)
 
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        A context manager which holds a lock on the underlying storage.
+
+        Authorizers which use the storage adapter to coordinate token refreshes (see
+        :class:`RenewingAuthorizer <globus_sdk.authorizers.RenewingAuthorizer>`) hold
+        this lock while they check for new tokens and refresh them.
+        Adapters whose storage is shared between processes should override this to
+        provide a lock across processes. By default, it does nothing.
+        """
+        yield
+
 
 class FileAdapter(StorageAdapter, metaclass=abc.ABCMeta):
     """
@@ -65,3 +79,38 @@ class FileAdapter(StorageAdapter, metaclass=abc.ABCMeta):
             yield
         finally:
             os.umask(old_umask)
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on a file next to the storage file, named
+        ``<filename>.lock``, so that only one process at a time holds the lock.
+        """
+        with self.user_only_umask():
+            fd = os.open(f"{self.filename}.lock", os.O_RDWR | os.O_CREAT)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                # LK_LOCK gives up after about 10 seconds, so retry until locked
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+                try:
+                    yield
+                finally:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -1,5 +1,7 @@
+import contextlib
 import json
 import sqlite3
+import threading
 from typing import Any, Dict, Iterator, Mapping, Optional, Set
 
 from globus_sdk.services.auth import OAuthTokenResponse
@@ -29,23 +31,42 @@ class SQLiteAdapter(FileAdapter):
     responses passed to the storage adapter are broken apart and stored indexed by
     *resource_server*. If you have a more complex use-case in which this scheme will be
     insufficient, you should encode that in your choice of ``namespace`` values.
+
+    An adapter may be used from several threads, for instance by an authorizer which
+    refreshes tokens on a background thread.
     """
 
     def __init__(self, dbname: str, *, namespace: str = "DEFAULT"):
         self.filename = self.dbname = dbname
         self.namespace = namespace
+        # the connection is shared between threads, and access to it is serialized
+        self._lock = threading.Lock()
         self._connection = self._init_and_connect()
 
     def _is_memory_db(self) -> bool:
         return self.dbname == ":memory:"
 
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self._connection
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        # an in-memory database is private to this adapter, so no lock file is needed
+        if self._is_memory_db():
+            yield
+        else:
+            with super().lock():
+                yield
+
     def _init_and_connect(self) -> sqlite3.Connection:
         init_tables = self._is_memory_db() or not self.file_exists()
         if init_tables and not self._is_memory_db():  # real file needs to be created
             with self.user_only_umask():
-                conn = sqlite3.connect(self.dbname)
+                conn = sqlite3.connect(self.dbname, check_same_thread=False)
         else:
-            conn = sqlite3.connect(self.dbname)
+            conn = sqlite3.connect(self.dbname, check_same_thread=False)
         if init_tables:
             conn.executescript(
                 """
@@ -95,12 +116,13 @@ CREATE TABLE sdk_storage_adapter_internal (
 
         Uses sqlite "REPLACE" to perform the operation.
         """
-        self._connection.execute(
-            "REPLACE INTO config_storage(namespace, config_name, config_data_json) "
-            "VALUES (?, ?, ?)",
-            (self.namespace, config_name, json.dumps(config_dict)),
-        )
-        self._connection.commit()
+        with self._connect() as conn:
+            conn.execute(
+                "REPLACE INTO config_storage(namespace, config_name, config_data_json) "
+                "VALUES (?, ?, ?)",
+                (self.namespace, config_name, json.dumps(config_dict)),
+            )
+            conn.commit()
 
     def read_config(self, config_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -110,11 +132,12 @@ CREATE TABLE sdk_storage_adapter_internal (
         Load a config dict under the current namespace in the config table.
         If no value is found, returns None
         """
-        row = self._connection.execute(
-            "SELECT config_data_json FROM config_storage "
-            "WHERE namespace=? AND config_name=?",
-            (self.namespace, config_name),
-        ).fetchone()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT config_data_json FROM config_storage "
+                "WHERE namespace=? AND config_name=?",
+                (self.namespace, config_name),
+            ).fetchone()
 
         if row is None:
             return None
@@ -133,11 +156,12 @@ CREATE TABLE sdk_storage_adapter_internal (
 
         Returns True if data was deleted, False if none was found to delete.
         """
-        rowcount = self._connection.execute(
-            "DELETE FROM config_storage WHERE namespace=? AND config_name=?",
-            (self.namespace, config_name),
-        ).rowcount
-        self._connection.commit()
+        with self._connect() as conn:
+            rowcount = conn.execute(
+                "DELETE FROM config_storage WHERE namespace=? AND config_name=?",
+                (self.namespace, config_name),
+            ).rowcount
+            conn.commit()
         return rowcount != 0
 
     def store(self, token_response: OAuthTokenResponse) -> None:
@@ -155,15 +179,16 @@ CREATE TABLE sdk_storage_adapter_internal (
         for rs_name, token_data in token_response.by_resource_server.items():
             pairs.append((rs_name, token_data))
 
-        self._connection.executemany(
-            "REPLACE INTO token_storage(namespace, resource_server, token_data_json) "
-            "VALUES(?, ?, ?)",
-            [
-                (self.namespace, rs_name, json.dumps(token_data))
-                for (rs_name, token_data) in pairs
-            ],
-        )
-        self._connection.commit()
+        with self._connect() as conn:
+            conn.executemany(
+                "REPLACE INTO token_storage(namespace, resource_server, "
+                "token_data_json) VALUES(?, ?, ?)",
+                [
+                    (self.namespace, rs_name, json.dumps(token_data))
+                    for (rs_name, token_data) in pairs
+                ],
+            )
+            conn.commit()
 
     def get_token_data(self, resource_server: str) -> Optional[Dict[str, Any]]:
         """
@@ -175,17 +200,19 @@ CREATE TABLE sdk_storage_adapter_internal (
             one would use as a key in OAuthTokenResponse.by_resource_server
         :type resource_server: str
         """
-        for row in self._connection.execute(
-            "SELECT token_data_json FROM token_storage "
-            "WHERE namespace=? AND resource_server=?",
-            (self.namespace, resource_server),
-        ):
-            (token_data_json,) = row
-            val = json.loads(token_data_json)
-            if not isinstance(val, dict):
-                raise ValueError("data error: token data was not saved as a dict")
-            return val
-        return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT token_data_json FROM token_storage "
+                "WHERE namespace=? AND resource_server=?",
+                (self.namespace, resource_server),
+            ).fetchone()
+        if row is None:
+            return None
+        (token_data_json,) = row
+        val = json.loads(token_data_json)
+        if not isinstance(val, dict):
+            raise ValueError("data error: token data was not saved as a dict")
+        return val
 
     def get_by_resource_server(self) -> Dict[str, Any]:
         """
@@ -195,15 +222,16 @@ CREATE TABLE sdk_storage_adapter_internal (
         This should look identical to an OAuthTokenResponse.by_resource_server in format
         and content. (But it is not attached to a token response object.)
         """
-        data = {}
-        for row in self._connection.execute(
-            "SELECT resource_server, token_data_json "
-            "FROM token_storage WHERE namespace=?",
-            (self.namespace,),
-        ):
-            resource_server, token_data_json = row
-            data[resource_server] = json.loads(token_data_json)
-        return data
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT resource_server, token_data_json "
+                "FROM token_storage WHERE namespace=?",
+                (self.namespace,),
+            ).fetchall()
+        return {
+            resource_server: json.loads(token_data_json)
+            for resource_server, token_data_json in rows
+        }
 
     def remove_tokens_for_resource_server(self, resource_server: str) -> bool:
         """
@@ -218,11 +246,12 @@ CREATE TABLE sdk_storage_adapter_internal (
             as one would use as a key in OAuthTokenResponse.by_resource_server
         :type resource_server: str
         """
-        rowcount = self._connection.execute(
-            "DELETE FROM token_storage WHERE namespace=? AND resource_server=?",
-            (self.namespace, resource_server),
-        ).rowcount
-        self._connection.commit()
+        with self._connect() as conn:
+            rowcount = conn.execute(
+                "DELETE FROM token_storage WHERE namespace=? AND resource_server=?",
+                (self.namespace, resource_server),
+            ).rowcount
+            conn.commit()
         return rowcount != 0
 
     def iter_namespaces(
@@ -239,17 +268,19 @@ CREATE TABLE sdk_storage_adapter_internal (
         :type include_config_namespaces: bool, optional
         """
         seen: Set[str] = set()
-        for row in self._connection.execute(
-            "SELECT DISTINCT namespace FROM token_storage;"
-        ):
-            namespace = row[0]
+        # rows are fetched before they are yielded, so that the connection is not held
+        # while the caller iterates
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT namespace FROM token_storage;")
+            token_namespaces = [row[0] for row in rows]
+        for namespace in token_namespaces:
             seen.add(namespace)
             yield namespace
 
         if include_config_namespaces:
-            for row in self._connection.execute(
-                "SELECT DISTINCT namespace FROM config_storage;"
-            ):
-                namespace = row[0]
+            with self._connect() as conn:
+                rows = conn.execute("SELECT DISTINCT namespace FROM config_storage;")
+                config_namespaces = [row[0] for row in rows]
+            for namespace in config_namespaces:
                 if namespace not in seen:
                     yield namespace
@@ -0,0 +1,214 @@
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional
+
+from globus_sdk.services.auth.identity_map import is_username, split_ids_and_usernames
+
+# the maximum number of keys to look up in one query, to stay below the sqlite limit
+# on the number of parameters in a statement
+_QUERY_BATCH_SIZE = 500
+
+
+class SQLiteIdentityCache(MutableMapping[str, Dict[str, Any]]):
+    """
+    :param dbname: The name of the DB file to write to and read from. If the string
+        ":memory:" is used, an in-memory database will be used instead.
+    :type dbname: str
+    :param max_age: The number of seconds for which stored identities are valid.
+        Older records are treated as missing, so they will be looked up again. The
+        default is for records to never expire.
+    :type max_age: float, optional
+    :param timeout: The number of seconds to wait for another process to release a
+        lock on the database
+    :type timeout: float, optional
+
+    A cache of Globus Auth identity records, stored in a sqlite database.
+
+    ``SQLiteIdentityCache`` is designed to be passed as the ``cache`` of an
+    :class:`IdentityMap <globus_sdk.IdentityMap>`, so that resolved identities persist
+    across restarts and are shared between processes using the same database file.
+    The database uses write-ahead logging, so that many readers can use it while it
+    is being written.
+
+    Identities are stored once, with the time at which they were stored, and may be
+    looked up either by ID or by username. Deleting either key removes the identity
+    record.
+
+    The database file should not be shared with a :class:`SQLiteAdapter`.
+
+    **Examples**
+
+    >>> cache = SQLiteIdentityCache("identities.db", max_age=24 * 60 * 60)
+    >>> idmap = globus_sdk.IdentityMap(auth_client, identity_ids, cache=cache)
+    """
+
+    def __init__(
+        self, dbname: str, *, max_age: Optional[float] = None, timeout: float = 5.0
+    ):
+        self.dbname = dbname
+        self.max_age = max_age
+        # the connection is shared between threads, and access to it is serialized
+        self._lock = threading.Lock()
+        self._connection = self._init_and_connect(timeout)
+
+    def _is_memory_db(self) -> bool:
+        return self.dbname == ":memory:"
+
+    def _init_and_connect(self, timeout: float) -> sqlite3.Connection:
+        if self._is_memory_db() or os.path.exists(self.dbname):
+            conn = sqlite3.connect(
+                self.dbname, timeout=timeout, check_same_thread=False
+            )
+        else:
+            # identity records include names and email addresses, so the file should
+            # be private to the user
+            old_umask = os.umask(0o177)
+            try:
+                conn = sqlite3.connect(
+                    self.dbname, timeout=timeout, check_same_thread=False
+                )
+            finally:
+                os.umask(old_umask)
+
+        if not self._is_memory_db():
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(
+            """
+CREATE TABLE IF NOT EXISTS identity_cache (
+    id VARCHAR NOT NULL,
+    username VARCHAR NOT NULL,
+    identity_json VARCHAR NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS identity_cache_username ON identity_cache (username);
+            """
+        )
+        conn.commit()
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            with self._connection:
+                yield self._connection
+
+    def _min_stored_at(self, max_age: Optional[float] = None) -> float:
+        ages = [age for age in (self.max_age, max_age) if age is not None]
+        if not ages:
+            return float("-inf")
+        return time.time() - min(ages)
+
+    def get_many(
+        self, keys: Iterable[str], *, max_age: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up many identities at once, by ID or by username.
+
+        Returns a dict mapping each key which was found to its identity record. Keys
+        which are not in the cache, or whose records are older than ``max_age``, are
+        omitted.
+
+        :param keys: The identity IDs and usernames to look up
+        :type keys: iterable of str
+        :param max_age: The maximum age of the records in seconds, if it is less than
+            the ``max_age`` of the cache
+        :type max_age: float, optional
+        """
+        ids, usernames = split_ids_and_usernames(keys)
+        min_stored_at = self._min_stored_at(max_age)
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._transaction() as conn:
+            for column, values in (("id", list(ids)), ("username", list(usernames))):
+                for start in range(0, len(values), _QUERY_BATCH_SIZE):
+                    end = start + _QUERY_BATCH_SIZE
+                    chunk = values[start:end]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT {column}, identity_json FROM identity_cache "
+                        f"WHERE {column} IN ({placeholders}) AND stored_at >= ?",
+                        (*chunk, min_stored_at),
+                    )
+                    for key, identity_json in rows:
+                        found[key] = json.loads(identity_json)
+        return found
+
+    def put_many(self, identities: Iterable[Dict[str, Any]]) -> None:
+        """
+        Store many identity records at once, in a single transaction.
+
+        :param identities: Identity records, as returned by
+            :meth:`AuthClient.get_identities <globus_sdk.AuthClient.get_identities>`
+        :type identities: iterable of dict
+        """
+        now = time.time()
+        rows = [(x["id"], x["username"], json.dumps(x), now) for x in identities]
+        with self._transaction() as conn:
+            conn.executemany(
+                "REPLACE INTO identity_cache(id, username, identity_json, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def purge_expired(self) -> int:
+        """
+        Delete records which are older than ``max_age`` from the database.
+
+        Returns the number of records deleted.
+        """
+        with self._transaction() as conn:
+            rowcount: int = conn.execute(
+                "DELETE FROM identity_cache WHERE stored_at < ?",
+                (self._min_stored_at(),),
+            ).rowcount
+        return rowcount
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        found = self.get_many([key])
+        if key not in found:
+            raise KeyError(key)
+        return found[key]
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        if key not in (value.get("id"), value.get("username")):
+            raise ValueError(
+                "SQLiteIdentityCache keys must be the ID or username of the identity"
+            )
+        self.put_many([value])
+
+    def __delitem__(self, key: str) -> None:
+        column = "username" if is_username(key) else "id"
+        with self._transaction() as conn:
+            rowcount = conn.execute(
+                f"DELETE FROM identity_cache WHERE {column}=?", (key,)
+            ).rowcount
+        if rowcount == 0:
+            raise KeyError(key)
+
+    def _keys(self) -> List[str]:
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, username FROM identity_cache WHERE stored_at >= ?",
+                (self._min_stored_at(),),
+            ).fetchall()
+        return [key for row in rows for key in row]
+
+    def __iter__(self) -> Iterator[str]:
+        # each identity is present under two keys: its ID and its username
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and bool(self.get_many([key]))
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        self._connection.close()
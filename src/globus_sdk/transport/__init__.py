@@ -1,5 +1,13 @@
+from .asynchronous import AsyncTransport
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .coalescing import RequestCoalescer
 from .encoders import FormRequestEncoder, JSONRequestEncoder, RequestEncoder
+from .hedging import HedgingPolicy
+from .hooks import RequestEvent, RequestHook, RequestHooks, template_path
+from .json_codec import JSONCodec, OrjsonJSONCodec, StdlibJSONCodec, get_json_codec
+from .rate_limit import RateLimiter
 from .requests import RequestsTransport
+from .response_cache import ResponseCache, ResponseCacheStats
 from .retry import (
     RetryCheck,
     RetryCheckFlags,
@@ -8,9 +16,11 @@ from .retry import (
     RetryContext,
     set_retry_check_flags,
 )
+from .retry_budget import RetryBudget
 
 __all__ = (
     "RequestsTransport",
+    "AsyncTransport",
     "RetryCheck",
     "RetryCheckFlags",
     "RetryCheckResult",
@@ -20,4 +30,20 @@ __all__ = (
     "RequestEncoder",
     "JSONRequestEncoder",
     "FormRequestEncoder",
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonJSONCodec",
+    "get_json_codec",
+    "ResponseCache",
+    "ResponseCacheStats",
+    "RequestCoalescer",
+    "RateLimiter",
+    "CircuitBreaker",
+    "CircuitState",
+    "RetryBudget",
+    "HedgingPolicy",
+    "RequestHooks",
+    "RequestHook",
+    "RequestEvent",
+    "template_path",
 )
@@ -0,0 +1,163 @@
+import asyncio
+import concurrent.futures
+import functools
+import logging
+from typing import Any, Callable, Dict, Optional, Union, cast
+
+import requests
+
+from globus_sdk import exc
+from globus_sdk.authorizers import GlobusAuthorizer
+
+from .requests import RequestsTransport, _RequestSteps, _Sleep
+
+log = logging.getLogger(__name__)
+
+
+# `get_running_loop` is new in python3.7; on python3.6, `get_event_loop` returns the
+# running loop when called from a coroutine
+_get_running_loop: Callable[[], asyncio.AbstractEventLoop] = getattr(
+    asyncio, "get_running_loop", asyncio.get_event_loop
+)
+
+
+class AsyncTransport:
+    """
+    An ``AsyncTransport`` sends requests for ``asyncio`` applications.
+
+    It wraps a :class:`RequestsTransport <globus_sdk.transport.RequestsTransport>` and
+    runs exactly the same request steps as that transport: the same encoders, the same
+    retry checks and retry parameters, and the same handling of the authorizer. Any
+    settings on the wrapped transport (including those set via ``tune()``) apply to
+    requests sent by the ``AsyncTransport`` as well.
+
+    The difference is in how the request is driven:
+
+    - blocking steps, sending the request, getting an ``Authorization`` header, and
+      running the retry checks (either of which may fetch a new token), run in a
+      pool of threads
+    - sleeps between retries are done with ``asyncio.sleep``, so a request which is
+      waiting to be retried does not hold a thread
+
+    This is not event loop I/O: each request in flight holds one thread of the pool
+    while it is sent, so ``max_workers`` is the number of requests which can be in
+    flight at once. The connection pool of the transport's session should allow as
+    many connections to each host.
+
+    :param transport: The transport whose configuration and session will be used
+    :type transport: :class:`RequestsTransport \
+        <globus_sdk.transport.RequestsTransport>`
+    :param executor: The executor used to run blocking steps. By default, the
+        ``AsyncTransport`` creates its own pool of ``max_workers`` threads
+    :type executor: concurrent.futures.Executor, optional
+    :param max_workers: The number of threads in the pool created by the
+        ``AsyncTransport``. Cannot be combined with ``executor``
+    :type max_workers: int, optional
+    """
+
+    #: the default number of threads used to send requests
+    DEFAULT_MAX_WORKERS = 64
+
+    def __init__(
+        self,
+        transport: RequestsTransport,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
+    ):
+        if executor is not None and max_workers is not None:
+            raise exc.GlobusSDKUsageError(
+                "An AsyncTransport cannot be given both an executor and max_workers."
+            )
+        self.transport = transport
+        self.max_workers = (
+            max_workers if max_workers is not None else self.DEFAULT_MAX_WORKERS
+        )
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> concurrent.futures.Executor:
+        """The executor used to run blocking steps."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="globus-sdk-async"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """
+        Stop the threads created by the ``AsyncTransport``, once they are idle. An
+        executor which was passed in is not shut down.
+        """
+        executor, self._executor = self._executor, None
+        if self._owns_executor and executor is not None:
+            executor.shutdown(wait=False)
+
+    async def _run_request_steps(self, steps: _RequestSteps) -> requests.Response:
+        loop = _get_running_loop()
+        value: Any = None
+        error: Optional[Exception] = None
+        while True:
+            try:
+                step = steps.throw(error) if error is not None else steps.send(value)
+            except StopIteration as stop:
+                return cast(requests.Response, stop.value)
+            value, error = None, None
+            if isinstance(step, _Sleep):
+                await asyncio.sleep(step.seconds)
+            else:
+                try:
+                    value = await loop.run_in_executor(self.executor, step)
+                except Exception as err:
+                    error = err
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        data: Union[Dict[str, Any], str, None] = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        authorizer: Optional[GlobusAuthorizer] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        deadline: Optional[float] = None,
+        use_response_cache: Optional[bool] = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP request. The parameters and return value are the same as those of
+        :meth:`RequestsTransport.request \
+        <globus_sdk.transport.RequestsTransport.request>`.
+
+        :return: ``requests.Response`` object
+        """
+        log.debug("starting async request for %s", url)
+        return await self._run_request_steps(
+            self.transport._request_steps(
+                method,
+                url,
+                query_params=query_params,
+                data=data,
+                headers=headers,
+                encoding=encoding,
+                authorizer=authorizer,
+                allow_redirects=allow_redirects,
+                stream=stream,
+                deadline=deadline,
+                use_response_cache=use_response_cache,
+            )
+        )
+
+    async def run_in_executor(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a synchronous callable in this transport's executor.
+
+        :param func: The callable to run
+        :type func: callable
+        """
+        loop = _get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
@@ -0,0 +1,290 @@
+import collections
+import enum
+import itertools
+import logging
+import threading
+import time
+import urllib.parse
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from globus_sdk import exc
+
+from .retry import RetryCheckResult, RetryContext
+
+log = logging.getLogger(__name__)
+
+
+class CircuitState(enum.Enum):
+    #: requests are sent as usual
+    closed = "closed"
+    #: requests fail immediately, without being sent
+    open = "open"
+    #: trial requests are sent, to find out whether the host has recovered
+    half_open = "half_open"
+
+
+#: the type of callbacks for changes of state: ``callback(host, old, new)``
+StateChangeCallback = Callable[[str, CircuitState, CircuitState], None]
+
+
+class _Circuit:
+    """The state of the circuit breaker for one host."""
+
+    def __init__(self) -> None:
+        self.state = CircuitState.closed
+        # (time, failed) for each result in the window, oldest first
+        self.results: Deque[Tuple[float, bool]] = collections.deque()
+        self.failures = 0
+        self.opened_at = 0.0
+        # the start times of the trial requests which are in flight, by trial ID
+        self.trials: Dict[int, float] = {}
+
+    def prune(self, now: float, window: float) -> None:
+        while self.results and self.results[0][0] <= now - window:
+            _, failed = self.results.popleft()
+            self.failures -= failed
+
+    def reset(self) -> None:
+        self.results.clear()
+        self.failures = 0
+        self.trials = {}
+
+
+class CircuitBreaker:
+    """
+    A ``CircuitBreaker`` stops sending requests to a host which is failing, so that
+    it can recover rather than receive retries from every client.
+
+    The breaker tracks the results of requests to each host over a rolling window of
+    ``window`` seconds. Connection errors, timeouts, and ``5xx`` responses count as
+    failures. The circuit for a host is in one of three states:
+
+    ``closed``
+      Requests are sent as usual. If at least ``min_requests`` results are in the
+      window, and the fraction which failed reaches ``failure_threshold``, the
+      circuit opens.
+
+    ``open``
+      Requests fail immediately with :class:`GlobusCircuitOpenError
+      <globus_sdk.GlobusCircuitOpenError>`, and failed requests are not retried.
+      After ``reset_timeout`` seconds, the circuit becomes half-open.
+
+    ``half_open``
+      Up to ``half_open_max_calls`` trial requests are sent at a time, and others
+      fail immediately. A successful trial closes the circuit, and a failed trial
+      opens it again. Only the results of trial requests are counted, so a request
+      which was sent before the circuit opened cannot close it.
+
+    A circuit breaker is used by passing it to a transport, as ``circuit_breaker``.
+    The transport checks it before sending each request, reports the result of each
+    attempt to it, and runs it as its first retry check. A breaker may be shared by
+    several transports.
+
+    Callers can check the state of a host with :meth:`get_state`, to shed load
+    rather than queue it, or pass ``on_state_change`` to be notified of changes.
+
+    :param failure_threshold: The fraction of failed requests at which the circuit
+        opens
+    :type failure_threshold: float
+    :param min_requests: The number of results which must be in the window before the
+        circuit can open
+    :type min_requests: int
+    :param window: The length of the rolling window in seconds
+    :type window: float
+    :param reset_timeout: The number of seconds for which the circuit stays open
+        before trial requests are sent
+    :type reset_timeout: float
+    :param half_open_max_calls: The number of trial requests which may be in flight
+        at once
+    :type half_open_max_calls: int
+    :param on_state_change: A callback, called with the host and the old and new
+        states whenever the state of a circuit changes
+    :type on_state_change: callable, optional
+
+    **Examples**
+
+    >>> breaker = CircuitBreaker(failure_threshold=0.5, reset_timeout=60)
+    >>> tc = TransferClient(..., transport_params={"circuit_breaker": breaker})
+    >>> if breaker.get_state(tc.base_url) is CircuitState.open:
+    >>>     ...  # shed load
+    """
+
+    #: status codes for responses which count as failures
+    FAILURE_STATUS_CODES = (500, 502, 503, 504)
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        min_requests: int = 10,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be between 0 and 1")
+        if min_requests < 1 or half_open_max_calls < 1:
+            raise ValueError("min_requests and half_open_max_calls must be positive")
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._trial_ids = itertools.count()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _circuit(self, host: str, now: float) -> _Circuit:
+        """
+        Get the circuit for a host, with its window pruned, and moved to half-open if
+        its reset timeout has passed.
+        """
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _Circuit()
+        circuit.prune(now, self.window)
+        if (
+            circuit.state is CircuitState.open
+            and now - circuit.opened_at >= self.reset_timeout
+        ):
+            circuit.state = CircuitState.half_open
+            circuit.trials = {}
+        return circuit
+
+    def _set_state(
+        self,
+        host: str,
+        circuit: _Circuit,
+        state: CircuitState,
+        now: float,
+        changes: List[Tuple[str, CircuitState, CircuitState]],
+    ) -> None:
+        if circuit.state is state:
+            return
+        changes.append((host, circuit.state, state))
+        circuit.state = state
+        if state is CircuitState.open:
+            circuit.opened_at = now
+        circuit.reset()
+
+    def _publish(self, changes: List[Tuple[str, CircuitState, CircuitState]]) -> None:
+        for host, old, new in changes:
+            log.warning("circuit for %s changed from %s to %s", host, old, new)
+            if self.on_state_change is not None:
+                self.on_state_change(host, old, new)
+
+    def get_state(self, url: str) -> CircuitState:
+        """
+        Get the state of the circuit for the host of a URL.
+
+        :param url: The URL, or any URL for the same host
+        :type url: str
+        """
+        with self._lock:
+            return self._circuit(self._host(url), time.monotonic()).state
+
+    def check_request(self, url: str) -> Optional[int]:
+        """
+        Check that a request to a URL may be sent. In the half-open state, the request
+        is counted as a trial request, and an ID for the trial is returned. It must be
+        passed to :meth:`record_result` with the result of the request.
+
+        :param url: The URL of the request
+        :type url: str
+        :raises GlobusCircuitOpenError: if the request must not be sent
+        """
+        host = self._host(url)
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuit(host, now)
+            if circuit.state is CircuitState.closed:
+                return None
+            if circuit.state is CircuitState.half_open:
+                # trials which never reported a result are forgotten after a while
+                circuit.trials = {
+                    trial: started
+                    for trial, started in circuit.trials.items()
+                    if now - started < self.reset_timeout
+                }
+                if len(circuit.trials) < self.half_open_max_calls:
+                    trial = next(self._trial_ids)
+                    circuit.trials[trial] = now
+                    log.debug("sending trial request to %s", host)
+                    return trial
+                retry_after = min(circuit.trials.values()) + self.reset_timeout - now
+            else:
+                retry_after = circuit.opened_at + self.reset_timeout - now
+        raise exc.GlobusCircuitOpenError(host, max(retry_after, 0.0))
+
+    def record_result(
+        self, url: str, failed: bool, *, trial: Optional[int] = None
+    ) -> None:
+        """
+        Record the result of a request to a URL.
+
+        :param url: The URL of the request
+        :type url: str
+        :param failed: Whether the request failed
+        :type failed: bool
+        :param trial: The trial ID returned by :meth:`check_request` for the request,
+            if any. In the half-open state, only the results of trial requests count.
+        :type trial: int, optional
+        """
+        host = self._host(url)
+        changes: List[Tuple[str, CircuitState, CircuitState]] = []
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuit(host, now)
+            if circuit.state is CircuitState.half_open:
+                # results of requests which were not trials, or which are trials from
+                # an earlier half-open period, are ignored
+                if trial is not None and circuit.trials.pop(trial, None) is not None:
+                    new_state = CircuitState.open if failed else CircuitState.closed
+                    self._set_state(host, circuit, new_state, now, changes)
+            elif circuit.state is CircuitState.closed:
+                circuit.results.append((now, failed))
+                circuit.failures += failed
+                total = len(circuit.results)
+                if (
+                    total >= self.min_requests
+                    and circuit.failures / total >= self.failure_threshold
+                ):
+                    self._set_state(host, circuit, CircuitState.open, now, changes)
+            # results of requests which were sent before the circuit opened are
+            # ignored while it is open
+        self._publish(changes)
+
+    def is_failure(self, ctx: RetryContext) -> bool:
+        """
+        Whether the result of an attempt counts as a failure.
+
+        :param ctx: The context of the attempt
+        :type ctx: RetryContext
+        """
+        if ctx.exception is not None:
+            return True
+        return (
+            ctx.response is not None
+            and ctx.response.status_code in self.FAILURE_STATUS_CODES
+        )
+
+    def __call__(self, ctx: RetryContext) -> RetryCheckResult:
+        """
+        A retry check, which prevents retries to a host whose circuit is not closed.
+        """
+        if ctx.url is not None and self.get_state(ctx.url) is not CircuitState.closed:
+            return RetryCheckResult.do_not_retry
+        return RetryCheckResult.no_decision
+
+    def reset(self) -> None:
+        """
+        Close the circuits for all hosts, and forget their results.
+        """
+        with self._lock:
+            self._circuits.clear()
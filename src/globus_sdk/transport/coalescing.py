@@ -0,0 +1,138 @@
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from globus_sdk import utils
+
+from .response_cache import RequestKey, clone_response, request_key
+
+log = logging.getLogger(__name__)
+
+
+class _Flight:
+    """
+    A request which is in flight, and which other identical requests may wait for.
+    """
+
+    def __init__(self, key: RequestKey) -> None:
+        self.key = key
+        self.waiters = 0
+        self._done = threading.Event()
+        self._response: Optional[requests.Response] = None
+        self._error: Optional[Exception] = None
+
+    def finish(
+        self,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self._response = response
+        self._error = error
+        self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[requests.Response]:
+        """
+        Wait for the request to finish, and get a copy of its response or raise a copy
+        of its error. If the request was abandoned without a result, returns None.
+
+        :raises requests.Timeout: if the request does not finish within ``timeout``
+            seconds
+        """
+        if not self._done.wait(timeout):
+            raise requests.Timeout(
+                f"identical request in flight did not finish within {timeout}s"
+            )
+        if self._error is not None:
+            raise utils.copy_error(self._error) from self._error
+        if self._response is None:
+            return None
+        return clone_response(self._response)
+
+
+class RequestCoalescer:
+    """
+    A ``RequestCoalescer`` lets identical ``GET`` requests which are sent at the same
+    time share a single request to the service.
+
+    When a transport with a coalescer sends a ``GET`` request, and an identical request
+    is already in flight, it waits for that request rather than sending its own. All
+    of the callers then get a copy of the same response, or of the same error.
+    Requests are identical if they have the same URL, query params, ``Authorization``
+    header, and content negotiation headers, such as ``Accept``. A caller with a
+    deadline stops waiting when its deadline is reached. Requests with their own
+    conditional headers, such as ``If-None-Match``, are not coalesced, as the response
+    to them may be a ``304 Not Modified``.
+
+    Only requests which are in flight at the same time are coalesced. To reuse
+    responses for longer, use a :class:`ResponseCache
+    <globus_sdk.transport.ResponseCache>`.
+
+    A coalescer may be shared between several transports, to coalesce the requests
+    sent by all of them.
+
+    **Examples**
+
+    >>> coalescer = RequestCoalescer()
+    >>> tc = TransferClient(..., transport_params={"request_coalescer": coalescer})
+
+    and then, in many threads,
+
+    >>> ep = tc.get_endpoint(endpoint_id)
+    """
+
+    def __init__(self) -> None:
+        #: the number of requests which were not sent, and instead used the response
+        #: to an identical request
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._flights: Dict[RequestKey, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def join(self, req: requests.Request) -> Tuple[_Flight, bool]:
+        """
+        Join the flight of an identical request, or start a new flight.
+
+        Returns the flight and whether the caller started it. The caller which starts
+        a flight must send the request and then call ``finish()``. Other callers wait
+        for its result.
+
+        :param req: The request, with its ``Authorization`` header set
+        :type req: requests.Request
+        """
+        key = request_key(req)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self.coalesced += 1
+                log.debug("joining in-flight request for %s", req.url)
+                return flight, False
+            flight = self._flights[key] = _Flight(key)
+            return flight, True
+
+    def finish(
+        self,
+        flight: _Flight,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Publish the result of a flight to the callers waiting for it. If there is
+        neither a response nor an error, the waiting callers send their own requests.
+
+        :param flight: The flight started by ``join()``
+        :param response: The response to the request
+        :type response: requests.Response, optional
+        :param error: The error raised when sending the request
+        :type error: Exception, optional
+        """
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+        if flight.waiters:
+            log.debug("sharing result of request with %d waiters", flight.waiters)
+        flight.finish(response, error)
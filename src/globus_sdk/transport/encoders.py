@@ -2,6 +2,8 @@ from typing import Any, Dict, Optional
 
 import requests
 
+from .json_codec import JSONCodec
+
 
 class RequestEncoder:
     """
@@ -32,8 +34,15 @@ class JSONRequestEncoder(RequestEncoder):
     """
     This encoder prepares the data as JSON. It also ensures that content-type is set, so
     that APIs requiring a content-type of "application/json" are able to read the data.
+
+    :param json_codec: The codec used to serialize the data. By default, the data is
+        serialized by ``requests``, with the standard library ``json`` module
+    :type json_codec: JSONCodec, optional
     """
 
+    def __init__(self, json_codec: Optional[JSONCodec] = None) -> None:
+        self.json_codec = json_codec
+
     def encode(
         self,
         method: str,
@@ -44,6 +53,14 @@ class JSONRequestEncoder(RequestEncoder):
     ) -> requests.Request:
         if data is not None:
             headers = {"Content-Type": "application/json", **headers}
+        if self.json_codec is not None and data is not None:
+            return requests.Request(
+                method,
+                url,
+                data=self.json_codec.dumps(data),
+                params=params,
+                headers=headers,
+            )
         return requests.Request(method, url, json=data, params=params, headers=headers)
 
 
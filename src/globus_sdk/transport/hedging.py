@@ -0,0 +1,349 @@
+import collections
+import concurrent.futures
+import functools
+import logging
+import math
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Deque, Dict, Optional
+
+import requests
+
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .rate_limit import RateLimiter
+
+log = logging.getLogger(__name__)
+
+_SendFunc = Callable[..., requests.Response]
+
+
+def _close_response(future: "concurrent.futures.Future[requests.Response]") -> None:
+    # the response which was not used releases its connection
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _record_unused_result(
+    breaker: CircuitBreaker,
+    url: str,
+    future: "concurrent.futures.Future[requests.Response]",
+) -> None:
+    # the transport records the result of the response which was used, and the
+    # breaker sees the other request to the host here
+    if future.cancelled():
+        return
+    error = future.exception()
+    failed = (
+        error is not None
+        or future.result().status_code in CircuitBreaker.FAILURE_STATUS_CODES
+    )
+    breaker.record_result(url, failed)
+
+
+class HedgingPolicy:
+    """
+    A ``HedgingPolicy`` makes ``GET`` requests faster when some responses are much
+    slower than usual, for instance because of a slow replica of a service.
+
+    If no response to a request arrives within a delay, a second copy of the request
+    is sent, and whichever response arrives first is used. The delay is a percentile
+    of the recent response times of the host: with the default of the 95th
+    percentile, about 5% of requests would be hedged.
+
+    To limit the extra load on services, at most ``max_extra_load`` copies are sent
+    per request, on average: each request earns that fraction of a hedge, and a hedge
+    can only be sent once a whole one has been earned.
+
+    Both copies are sent with the same ``Authorization`` header. If the response is a
+    ``401``, the transport refreshes the header and retries as usual.
+
+    A copy is only sent if the circuit of the transport's ``circuit_breaker`` for the
+    host is closed, and if its ``rate_limiter`` has a token for the host which can be
+    used at once. A copy never waits for the rate limit, as it would no longer be
+    faster. The result of whichever request is not used is recorded by the circuit
+    breaker, as the transport records the other. Copies do not spend from the
+    ``retry_budget``, as their number is limited by ``max_extra_load``.
+
+    A request which could be hedged is sent in a thread pool, while the calling thread
+    waits for its response, so that the copy can be sent and used while the original
+    request is still in flight. The copies are sent in a second pool, so that they
+    never delay original requests. Each pool has ``max_workers`` threads. Requests
+    which cannot be hedged, or which arrive while every thread for original requests
+    is busy, are sent on the calling thread.
+
+    :param percentile: The percentile of recent response times after which a copy of
+        a request is sent
+    :type percentile: float
+    :param min_samples: The number of response times which must be known for a host
+        before its requests are hedged
+    :type min_samples: int
+    :param sample_size: The number of recent response times kept for each host
+    :type sample_size: int
+    :param initial_delay: The delay used for a host until ``min_samples`` response
+        times are known. By default, requests are not hedged until then
+    :type initial_delay: float, optional
+    :param max_extra_load: The maximum number of copies sent per request
+    :type max_extra_load: float
+    :param max_workers: The number of threads used to send original requests, and
+        the number used to send copies of them
+    :type max_workers: int
+
+    **Examples**
+
+    >>> policy = HedgingPolicy(percentile=99)
+    >>> tc = TransferClient(..., transport_params={"hedging_policy": policy})
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        sample_size: int = 100,
+        initial_delay: Optional[float] = None,
+        max_extra_load: float = 0.05,
+        max_workers: int = 32,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 1 <= min_samples <= sample_size:
+            raise ValueError("min_samples must be between 1 and sample_size")
+        if not 0 < max_extra_load <= 1:
+            raise ValueError("max_extra_load must be between 0 and 1")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.initial_delay = initial_delay
+        self.max_extra_load = max_extra_load
+        self.max_workers = max_workers
+        #: the number of requests sent through this policy
+        self.requests_sent = 0
+        #: the number of copies of requests sent
+        self.hedges_sent = 0
+        #: the number of copies whose response was used
+        self.hedges_won = 0
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+        # the fraction of a hedge which has been earned, at most 1
+        self._hedge_tokens = 1.0
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._primary_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # the number of original requests in the primary pool, which is never more
+        # than its number of threads, so that none waits for a thread
+        self._primaries_in_flight = 0
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="globus-sdk-hedge"
+                )
+            return self._executor
+
+    def record_latency(self, url: str, seconds: float) -> None:
+        """
+        Record the time taken to receive a response from the host of a URL.
+
+        :param url: The URL of the request
+        :type url: str
+        :param seconds: The time taken, in seconds
+        :type seconds: float
+        """
+        host = self._host(url)
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = collections.deque(
+                    maxlen=self.sample_size
+                )
+            samples.append(seconds)
+
+    def get_delay(self, url: str) -> Optional[float]:
+        """
+        Get the delay after which a copy of a request to a URL is sent, or None if
+        requests to its host are not hedged yet.
+
+        :param url: The URL of the request
+        :type url: str
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(self._host(url), ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        # the nearest-rank percentile
+        rank = math.ceil(self.percentile / 100 * len(samples))
+        return samples[max(rank, 1) - 1]
+
+    def _take_hedge_token(self) -> bool:
+        with self._lock:
+            if self._hedge_tokens >= 1:
+                self._hedge_tokens -= 1
+                self.hedges_sent += 1
+                return True
+        return False
+
+    def _can_hedge(self) -> bool:
+        with self._lock:
+            return self._hedge_tokens >= 1
+
+    def _timed_send(
+        self,
+        send: _SendFunc,
+        prepared: requests.PreparedRequest,
+        kwargs: Dict[str, Any],
+    ) -> requests.Response:
+        start = time.monotonic()
+        response = send(prepared, **kwargs)
+        self.record_latency(str(prepared.url), time.monotonic() - start)
+        return response
+
+    def _start(
+        self,
+        send: _SendFunc,
+        prepared: requests.PreparedRequest,
+        kwargs: Dict[str, Any],
+    ) -> "Optional[concurrent.futures.Future[requests.Response]]":
+        """
+        Send an original request in the primary pool, if one of its threads is free,
+        so that it starts right away. Returns None if every thread is busy.
+        """
+        with self._lock:
+            if self._primaries_in_flight >= self.max_workers:
+                return None
+            self._primaries_in_flight += 1
+            if self._primary_executor is None:
+                self._primary_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="globus-sdk-hedge-primary",
+                )
+            executor = self._primary_executor
+
+        def run() -> requests.Response:
+            try:
+                return self._timed_send(send, prepared, kwargs)
+            finally:
+                with self._lock:
+                    self._primaries_in_flight -= 1
+
+        return executor.submit(run)
+
+    def _submit(
+        self,
+        send: _SendFunc,
+        prepared: requests.PreparedRequest,
+        kwargs: Dict[str, Any],
+    ) -> "concurrent.futures.Future[requests.Response]":
+        return self._get_executor().submit(self._timed_send, send, prepared, kwargs)
+
+    def _may_send_copy(
+        self,
+        url: str,
+        rate_limiter: Optional[RateLimiter],
+        circuit_breaker: Optional[CircuitBreaker],
+    ) -> bool:
+        if (
+            circuit_breaker is not None
+            and circuit_breaker.get_state(url) is not CircuitState.closed
+        ):
+            log.debug("circuit for %s is not closed, not sending a copy", url)
+            return False
+        if not self._can_hedge():
+            return False
+        if rate_limiter is not None and not rate_limiter.try_acquire(url):
+            log.debug("rate limit for %s has no token, not sending a copy", url)
+            return False
+        if not self._take_hedge_token():
+            # another request took the hedge in the meantime
+            if rate_limiter is not None:
+                rate_limiter.release(url)
+            return False
+        return True
+
+    def send(
+        self,
+        send: _SendFunc,
+        prepared: requests.PreparedRequest,
+        *,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request with ``send``, and send a copy of it if no response arrives
+        within the delay. Returns the first response, or raises the error of the
+        original request if neither copy received a response.
+
+        :param send: The function used to send a request, such as
+            ``requests.Session.send``
+        :type send: callable
+        :param prepared: The request
+        :type prepared: requests.PreparedRequest
+        :param rate_limiter: The rate limiter which must have a token for a copy to be
+            sent
+        :type rate_limiter: :class:`RateLimiter \
+            <globus_sdk.transport.RateLimiter>`, optional
+        :param circuit_breaker: The circuit breaker whose circuit must be closed for a
+            copy to be sent, and which records the result of the unused request
+        :type circuit_breaker: :class:`CircuitBreaker \
+            <globus_sdk.transport.CircuitBreaker>`, optional
+        :param kwargs: Keyword arguments passed to ``send``
+        """
+        with self._lock:
+            self.requests_sent += 1
+            self._hedge_tokens = min(1.0, self._hedge_tokens + self.max_extra_load)
+        delay = self.get_delay(str(prepared.url))
+        if delay is None or not self._can_hedge():
+            # not hedged, but the response time is recorded
+            return self._timed_send(send, prepared, kwargs)
+
+        # the delay is measured from when the request is sent
+        primary = self._start(send, prepared, kwargs)
+        if primary is None:
+            log.debug("no thread is free for a hedged request, sending it unhedged")
+            return self._timed_send(send, prepared, kwargs)
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        url = str(prepared.url)
+        if done or not self._may_send_copy(url, rate_limiter, circuit_breaker):
+            return primary.result()
+
+        log.debug("no response after %.3fs, sending a copy of the request", delay)
+        hedge = self._submit(send, prepared.copy(), kwargs)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        if circuit_breaker is not None:
+                            other.add_done_callback(
+                                functools.partial(
+                                    _record_unused_result, circuit_breaker, url
+                                )
+                            )
+                        other.add_done_callback(_close_response)
+                    if future is hedge:
+                        with self._lock:
+                            self.hedges_won += 1
+                    return future.result()
+        # neither copy received a response
+        if circuit_breaker is not None:
+            _record_unused_result(circuit_breaker, url, hedge)
+        return primary.result()
+
+    def shutdown(self) -> None:
+        """
+        Stop the threads used to send requests, once they are idle.
+        """
+        with self._lock:
+            executors = [self._executor, self._primary_executor]
+            self._executor = self._primary_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
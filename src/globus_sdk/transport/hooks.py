@@ -0,0 +1,262 @@
+import logging
+import re
+import urllib.parse
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+log = logging.getLogger(__name__)
+
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+_NUMERIC_SEGMENT = re.compile(r"^[0-9]+$")
+
+
+def template_path(url: str) -> str:
+    """
+    Get the path of a URL with its IDs replaced by placeholders, so that requests to
+    the same API route can be grouped together. UUIDs are replaced with ``{uuid}``
+    and numbers with ``{id}``.
+
+    :param url: The URL of a request
+    :type url: str
+
+    **Examples**
+
+    >>> template_path(
+    ...     "https://transfer.api.globus.org/v0.10/endpoint/"
+    ...     "ddb59aef-6d04-11e5-ba46-22000b92c6ec/ls"
+    ... )
+    '/v0.10/endpoint/{uuid}/ls'
+    """
+    segments = urllib.parse.urlsplit(url).path.split("/")
+    return "/".join(
+        "{uuid}"
+        if _UUID_SEGMENT.match(segment)
+        else "{id}"
+        if _NUMERIC_SEGMENT.match(segment)
+        else segment
+        for segment in segments
+    )
+
+
+class RequestEvent:
+    """
+    A ``RequestEvent`` is passed to request hooks, describing a step in sending a
+    request. The attributes which do not apply to an event are ``None``.
+
+    :param name: The name of the event, such as ``"on_response"``
+    :type name: str
+    :param method: The HTTP method of the request
+    :type method: str
+    :param url: The URL of the request, without its query string
+    :type url: str
+    :param path_template: The path of the URL, with its IDs replaced by
+        placeholders. See :func:`template_path`
+    :type path_template: str
+    :param attempt: The attempt number, starting at 0. It is ``None`` for the
+        ``on_response`` or ``on_error`` event of a request which was answered from the
+        response cache or by an identical request in flight, without an attempt
+    :type attempt: int, optional
+    :param status_code: The status code of the response
+    :type status_code: int, optional
+    :param exception: The error raised when sending the request
+    :type exception: Exception, optional
+    :param bytes_sent: The size of the request body
+    :type bytes_sent: int, optional
+    :param bytes_received: The size of the response body. For streamed responses,
+        this is the ``Content-Length`` of the response, if it has one
+    :type bytes_received: int, optional
+    :param elapsed: The time in seconds from sending the request to receiving the
+        response or error
+    :type elapsed: float, optional
+    :param time_to_first_byte: The time in seconds from sending the request to
+        receiving the headers of the response
+    :type time_to_first_byte: float, optional
+    :param retry: Whether the request will be retried, after the retry checks, the
+        maximum number of retries, the deadline, and the retry budget were considered.
+        A retry is always preceded by an ``on_retry_sleep`` event
+    :type retry: bool, optional
+    :param sleep: The time in seconds before the next attempt
+    :type sleep: float, optional
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        method: str,
+        url: str,
+        path_template: str,
+        attempt: Optional[int] = None,
+        status_code: Optional[int] = None,
+        exception: Optional[Exception] = None,
+        bytes_sent: Optional[int] = None,
+        bytes_received: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        time_to_first_byte: Optional[float] = None,
+        retry: Optional[bool] = None,
+        sleep: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.url = url
+        self.path_template = path_template
+        self.attempt = attempt
+        self.status_code = status_code
+        self.exception = exception
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.elapsed = elapsed
+        self.time_to_first_byte = time_to_first_byte
+        self.retry = retry
+        self.sleep = sleep
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.name!r}, method={self.method!r}, "
+            f"path_template={self.path_template!r}, attempt={self.attempt!r}, "
+            f"status_code={self.status_code!r})"
+        )
+
+
+#: the type of the functions which are registered as request hooks
+RequestHook = Callable[[RequestEvent], None]
+
+
+class RequestHooks:
+    """
+    A registry of functions which are called with a :class:`RequestEvent` at each
+    step of sending a request, for instance to record metrics or tracing spans.
+
+    The events are
+
+    - ``on_request_start``: a request is about to be sent, or looked up in the cache
+    - ``on_attempt``: an attempt to send the request is about to be made
+    - ``on_response``: an attempt received a response, or the request was answered
+      from the response cache or by an identical request in flight
+    - ``on_error``: an attempt failed with an error, such as a timeout, or the
+      identical request in flight which the request waited for failed
+    - ``on_retry_sleep``: the transport is about to sleep before retrying
+
+    Hooks are called in the thread sending the request, in the order in which they
+    were registered, so they should be fast. Errors raised by hooks are logged and
+    do not affect the request.
+
+    When no hooks are registered, the transport does not create events, so an empty
+    registry has no cost.
+
+    **Examples**
+
+    >>> def record(event):
+    ...     statsd.timing(f"globus.{event.path_template}", event.elapsed)
+    >>> tc = TransferClient(...)
+    >>> tc.transport.hooks.register("on_response", record)
+
+    A registry may be shared by several transports:
+
+    >>> hooks = RequestHooks()
+    >>> hooks.register("on_error", record_error)
+    >>> tc = TransferClient(..., transport_params={"hooks": hooks})
+    >>> ac = AuthClient(..., transport_params={"hooks": hooks})
+    """
+
+    #: the names of the events for which hooks may be registered
+    EVENTS = (
+        "on_request_start",
+        "on_attempt",
+        "on_response",
+        "on_error",
+        "on_retry_sleep",
+    )
+
+    def __init__(self) -> None:
+        # the hooks are kept in tuples, which are replaced rather than modified, so
+        # that they can be called while other hooks are registered
+        self._hooks: Dict[str, Tuple[RequestHook, ...]] = {
+            event: () for event in self.EVENTS
+        }
+
+    def __bool__(self) -> bool:
+        return any(self._hooks.values())
+
+    def _check_event(self, event: str) -> None:
+        if event not in self._hooks:
+            raise ValueError(
+                f"Unknown request event '{event}', "
+                f"must be one of {', '.join(self.EVENTS)}"
+            )
+
+    def register(self, event: str, func: RequestHook) -> RequestHook:
+        """
+        Register a function to be called on an event.
+
+        :param event: The name of the event
+        :type event: str
+        :param func: The function, which is called with a :class:`RequestEvent`
+        :type func: callable
+        """
+        self._check_event(event)
+        self._hooks[event] = self._hooks[event] + (func,)
+        return func
+
+    def unregister(self, event: str, func: RequestHook) -> None:
+        """
+        Stop calling a function on an event.
+
+        :param event: The name of the event
+        :type event: str
+        :param func: The function which was registered
+        :type func: callable
+        """
+        self._check_event(event)
+        self._hooks[event] = tuple(hook for hook in self._hooks[event] if hook != func)
+
+    def has_hooks(self, event: str) -> bool:
+        """
+        Check whether any functions are registered for an event.
+
+        :param event: The name of the event
+        :type event: str
+        """
+        return bool(self._hooks.get(event))
+
+    def emit(self, event: RequestEvent) -> None:
+        """
+        Call the functions registered for an event.
+
+        :param event: The event
+        :type event: :class:`RequestEvent`
+        """
+        for hook in self._hooks.get(event.name, ()):
+            try:
+                hook(event)
+            except Exception:
+                log.exception("error in request hook for %s", event.name)
+
+
+def body_size(prepared: requests.PreparedRequest) -> Optional[int]:
+    """The size of the body of a request, or None if it is streamed."""
+    # the body may also be a file or an iterator, which are streamed
+    body: object = prepared.body
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, bytes):
+        return len(body)
+    return None
+
+
+def response_size(response: requests.Response, stream: bool) -> Optional[int]:
+    """
+    The size of the body of a response. A streamed response has not been read, so
+    its ``Content-Length`` is used, if it has one.
+    """
+    if not stream:
+        return len(response.content)
+    length = response.headers.get("Content-Length")
+    if length is not None and length.isdigit():
+        return int(length)
+    return None
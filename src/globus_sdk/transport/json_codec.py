@@ -0,0 +1,132 @@
+import abc
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+import requests
+
+from globus_sdk import config
+
+
+class JSONCodec(metaclass=abc.ABCMeta):
+    """
+    A JSONCodec serializes request data to JSON and parses JSON response bodies.
+
+    Subclasses must implement ``dumps`` and ``loads``. ``load_response`` parses the
+    body of a response, and by default passes its content to ``loads``.
+
+    Invalid JSON must result in a ``ValueError``.
+    """
+
+    #: the name of the codec, by which it can be selected
+    name: str
+
+    @abc.abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serialize data to a JSON document, encoded as UTF-8.
+        """
+
+    @abc.abstractmethod
+    def loads(self, content: Union[str, bytes]) -> Any:
+        """
+        Parse a JSON document.
+        """
+
+    def load_response(self, response: requests.Response) -> Any:
+        """
+        Parse the body of a response as JSON.
+        """
+        return self.loads(response.content)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    A codec which uses the ``json`` module of the standard library. This is the
+    default codec.
+    """
+
+    name = "stdlib"
+
+    def dumps(self, data: Any) -> bytes:
+        # the same serialization which `requests` uses for `json=...`
+        return json.dumps(data, allow_nan=False).encode("utf-8")
+
+    def loads(self, content: Union[str, bytes]) -> Any:
+        return json.loads(content)
+
+    def load_response(self, response: requests.Response) -> Any:
+        # use `requests` for parsing, which handles the charset of the response
+        return response.json()
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """
+    A codec which uses `orjson <https://github.com/ijl/orjson>`_, which is much faster
+    than the standard library on large documents. It requires ``orjson`` to be
+    installed.
+
+    ``orjson`` is stricter than the standard library: keys of objects must be
+    strings.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, data: Any) -> bytes:
+        dumped: bytes = self._orjson.dumps(data)
+        return dumped
+
+    def loads(self, content: Union[str, bytes]) -> Any:
+        return self._orjson.loads(content)
+
+
+_CODECS: Dict[str, Type[JSONCodec]] = {
+    "stdlib": StdlibJSONCodec,
+    "orjson": OrjsonJSONCodec,
+}
+
+
+def get_json_codec(value: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Get a JSON codec by name, or return a codec object as-is.
+
+    The name may be ``"stdlib"``, ``"orjson"``, or ``"auto"``, which selects the
+    fastest codec which is installed. If no value is given, the name is read from the
+    ``GLOBUS_SDK_JSON_CODEC`` environment variable, and defaults to ``"stdlib"``.
+
+    :param value: The codec or the name of a codec
+    :type value: str or JSONCodec, optional
+    """
+    if isinstance(value, JSONCodec):
+        return value
+    name = config.get_json_codec_name(value)
+    if name == "auto":
+        try:
+            return OrjsonJSONCodec()
+        except ImportError:
+            return StdlibJSONCodec()
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'")
+    return _CODECS[name]()
+
+
+# the codecs used where no transport is available to provide one, by name
+_DEFAULT_CODECS: Dict[str, JSONCodec] = {}
+
+
+def get_response_codec(client: Optional[Any]) -> JSONCodec:
+    """
+    Get the codec of the transport of a client. If there is none, get the codec
+    selected by the ``GLOBUS_SDK_JSON_CODEC`` environment variable.
+    """
+    codec = getattr(getattr(client, "transport", None), "json_codec", None)
+    if isinstance(codec, JSONCodec):
+        return codec
+    name = config.get_json_codec_name()
+    if name not in _DEFAULT_CODECS:
+        _DEFAULT_CODECS[name] = get_json_codec(name)
+    return _DEFAULT_CODECS[name]
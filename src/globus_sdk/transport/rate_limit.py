@@ -0,0 +1,221 @@
+import logging
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """
+    The token bucket for one host. Tokens may go negative, in which case the callers
+    which took them wait until they are refilled.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.last_decrease = float("-inf")
+
+    def refill(self, now: float, burst: int) -> None:
+        # during a block, ``updated`` is in the future, and no tokens are added
+        if now > self.updated:
+            elapsed = now - self.updated
+            self.tokens = min(float(burst), self.tokens + elapsed * self.rate)
+            self.updated = now
+
+
+class RateLimiter:
+    """
+    A ``RateLimiter`` limits the rate of requests sent to each host, using a token
+    bucket. Each host is a different Globus service (or Globus Connect Server
+    endpoint), so each has its own limit.
+
+    The rate adapts to the service, in the style of AIMD (additive increase,
+    multiplicative decrease):
+
+    - each successful response increases the rate slowly, by about
+      ``additive_increase`` requests per second for every second of requests
+    - a ``429 Too Many Requests`` response multiplies the rate by
+      ``multiplicative_decrease``
+    - a ``Retry-After`` header stops all requests to the host for the time which it
+      requests
+
+    Transports which are given the same ``RateLimiter`` share its limits, so a single
+    limiter should be shared by all of the clients in a process.
+
+    :param initial_rate: The rate in requests per second for a host which has not been
+        contacted yet
+    :type initial_rate: float
+    :param min_rate: The lowest rate in requests per second
+    :type min_rate: float
+    :param max_rate: The highest rate in requests per second
+    :type max_rate: float, optional
+    :param burst: The number of requests which may be sent at once, after a period
+        without requests
+    :type burst: int
+    :param additive_increase: The increase in the rate per second of successful
+        requests
+    :type additive_increase: float
+    :param multiplicative_decrease: The factor applied to the rate after a ``429``
+        response
+    :type multiplicative_decrease: float
+
+    **Examples**
+
+    >>> limiter = RateLimiter(initial_rate=20)
+    >>> tc = TransferClient(..., transport_params={"rate_limiter": limiter})
+    >>> ac = AuthClient(..., transport_params={"rate_limiter": limiter})
+    """
+
+    #: after a decrease, ``429`` responses to requests which were already in flight
+    #: are ignored for this many seconds, so that a burst of them decreases the rate
+    #: only once
+    DECREASE_COOLDOWN = 1.0
+
+    def __init__(
+        self,
+        *,
+        initial_rate: float = 10.0,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        burst: int = 10,
+        additive_increase: float = 1.0,
+        multiplicative_decrease: float = 0.5,
+    ) -> None:
+        if min_rate <= 0:
+            raise ValueError("min_rate must be positive")
+        if not min_rate <= initial_rate <= (max_rate or initial_rate):
+            raise ValueError("initial_rate must be between min_rate and max_rate")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError("multiplicative_decrease must be between 0 and 1")
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _bucket(self, host: str) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.initial_rate, self.burst)
+        return bucket
+
+    def get_rate(self, url: str) -> float:
+        """
+        Get the current rate in requests per second for the host of a URL.
+
+        :param url: The URL, or any URL for the same host
+        :type url: str
+        """
+        with self._lock:
+            return self._bucket(self._host(url)).rate
+
+    def acquire(self, url: str) -> float:
+        """
+        Take a token for a request to a URL, and return the number of seconds to wait
+        before sending the request.
+
+        :param url: The URL of the request
+        :type url: str
+        """
+        host = self._host(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            bucket.refill(now, self.burst)
+            bucket.tokens -= 1
+            # the callers which are waiting for a block are spaced out after it, at
+            # the current rate
+            delay = max(bucket.blocked_until - now, 0.0) + (
+                max(-bucket.tokens, 0.0) / bucket.rate
+            )
+        if delay:
+            log.debug("rate limit for %s requires waiting %.3fs", host, delay)
+        return delay
+
+    def try_acquire(self, url: str) -> bool:
+        """
+        Take a token for a request to a URL only if it may be sent at once. Returns
+        whether a token was taken.
+
+        :param url: The URL of the request
+        :type url: str
+        """
+        with self._lock:
+            bucket = self._bucket(self._host(url))
+            now = time.monotonic()
+            bucket.refill(now, self.burst)
+            if now < bucket.blocked_until or bucket.tokens < 1:
+                return False
+            bucket.tokens -= 1
+            return True
+
+    def release(self, url: str) -> None:
+        """
+        Return the token taken by :meth:`acquire` for a request which was not sent,
+        e.g. because its deadline would pass while it waited.
+
+        :param url: The URL of the request
+        :type url: str
+        """
+        with self._lock:
+            bucket = self._bucket(self._host(url))
+            bucket.tokens = min(float(self.burst), bucket.tokens + 1)
+
+    def record_response(
+        self, url: str, status_code: int, retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Adapt the rate for the host of a URL to a response received from it.
+
+        :param url: The URL of the request
+        :type url: str
+        :param status_code: The status of the response
+        :type status_code: int
+        :param retry_after: The number of seconds requested by a ``Retry-After``
+            header
+        :type retry_after: float, optional
+        """
+        host = self._host(url)
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            bucket.refill(now, self.burst)
+            if retry_after:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+                # no tokens are added during the block, and only one is left, so that
+                # the requests which are waiting are sent at the current rate after it,
+                # not in a burst
+                bucket.tokens = min(bucket.tokens, 1.0)
+                bucket.updated = bucket.blocked_until
+            if status_code == 429:
+                if now - bucket.last_decrease >= self.DECREASE_COOLDOWN:
+                    bucket.last_decrease = now
+                    bucket.rate = max(
+                        self.min_rate, bucket.rate * self.multiplicative_decrease
+                    )
+                    log.info("rate limit for %s decreased to %.3f", host, bucket.rate)
+            elif status_code < 400:
+                bucket.rate += self.additive_increase / bucket.rate
+                if self.max_rate is not None:
+                    bucket.rate = min(self.max_rate, bucket.rate)
+
+    def reset(self) -> None:
+        """
+        Forget the rates and state of all hosts.
+        """
+        with self._lock:
+            self._buckets.clear()
@@ -1,18 +1,37 @@
 import contextlib
+import functools
 import logging
 import random
 import time
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union, cast
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Union, cast
 
 import requests
 
 from globus_sdk import config, exc
 from globus_sdk.authorizers import GlobusAuthorizer
+from globus_sdk.transport.circuit_breaker import CircuitBreaker
+from globus_sdk.transport.coalescing import RequestCoalescer
 from globus_sdk.transport.encoders import (
     FormRequestEncoder,
     JSONRequestEncoder,
     RequestEncoder,
 )
+from globus_sdk.transport.hedging import HedgingPolicy
+from globus_sdk.transport.hooks import (
+    RequestEvent,
+    RequestHooks,
+    body_size,
+    response_size,
+    template_path,
+)
+from globus_sdk.transport.json_codec import JSONCodec, StdlibJSONCodec, get_json_codec
+from globus_sdk.transport.rate_limit import RateLimiter
+from globus_sdk.transport.response_cache import (
+    CONDITIONAL_HEADERS,
+    ResponseCache,
+    has_conditional_headers,
+)
+from globus_sdk.transport.retry_budget import RetryBudget
 from globus_sdk.version import __version__
 
 from .retry import (
@@ -45,6 +64,105 @@ def _exponential_backoff(ctx: RetryContext) -> float:
     return cast(float, (0.25 + 0.5 * random.random()) * (2**ctx.attempt))
 
 
+def _deadline_exceeded(
+    deadline: float,
+    error: Optional[Exception] = None,
+    response: Optional[requests.Response] = None,
+) -> exc.GlobusDeadlineExceededError:
+    log.warning("request done (fail, deadline of %ss exceeded)", deadline)
+    return exc.GlobusDeadlineExceededError(
+        f"Request deadline of {deadline}s exceeded",
+        error or requests.Timeout(f"deadline of {deadline}s exceeded"),
+        last_response=response,
+    )
+
+
+def _emit_event(
+    hooks: RequestHooks, name: str, req: requests.Request, **kwargs: Any
+) -> None:
+    hooks.emit(
+        RequestEvent(
+            name,
+            method=req.method,
+            url=req.url,
+            path_template=template_path(req.url),
+            **kwargs,
+        )
+    )
+
+
+def _emit_unsent_response_event(
+    hooks: RequestHooks, req: requests.Request, resp: requests.Response, elapsed: float
+) -> None:
+    # a response which was not received for this request, but taken from the cache or
+    # shared by an identical request, so that no attempt was made
+    _emit_event(
+        hooks,
+        "on_response",
+        req,
+        status_code=resp.status_code,
+        bytes_sent=0,
+        bytes_received=len(resp.content),
+        elapsed=elapsed,
+        retry=False,
+    )
+
+
+class _BlockingCall:
+    """
+    A step of sending a request which may block on I/O, such as sending the request
+    or fetching a new token to fill in the Authorization header.
+
+    The result of the call (or the exception it raised) is sent back into the steps
+    which yielded it.
+    """
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+
+class _Sleep:
+    """A step of sending a request which waits before the next attempt."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+
+# the steps of a request are a generator which yields blocking calls and sleeps, and
+# finally returns the response
+#
+# this allows the same retry logic to be run by the synchronous transport and by
+# drivers for other concurrency models (see `AsyncTransport`)
+_RequestSteps = Generator[Union[_BlockingCall, _Sleep], Any, requests.Response]
+
+
+def _run_request_steps(steps: _RequestSteps) -> requests.Response:
+    """
+    Run the steps of a request synchronously, making blocking calls in the current
+    thread and sleeping with ``time.sleep``.
+    """
+    value: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            step = steps.throw(error) if error is not None else steps.send(value)
+        except StopIteration as stop:
+            return cast(requests.Response, stop.value)
+        value, error = None, None
+        if isinstance(step, _Sleep):
+            time.sleep(step.seconds)
+        else:
+            try:
+                value = step()
+            except Exception as err:
+                error = err
+
+
 class RequestsTransport:
     """
     The RequestsTransport handles HTTP request sending and retries.
@@ -85,6 +203,62 @@ class RequestsTransport:
     :type max_sleep: int, optional
     :param max_retries: The maximum number of retries allowed by this transport
     :type max_retries: int, optional
+    :param deadline: The maximum total time in seconds for a request, including all
+        of its retries and the sleeps between them. The timeout of each attempt is
+        shortened to fit in the time which remains. By default, there is no deadline
+    :type deadline: float, optional
+    :param session: A session to use for sending requests, which may be shared with
+        other transports so that they reuse the same connections. See
+        :meth:`make_session`. By default, each transport creates its own session
+    :type session: requests.Session, optional
+    :param pool_connections: The number of hosts for which connection pools are kept.
+        Cannot be combined with ``session``
+    :type pool_connections: int, optional
+    :param pool_maxsize: The maximum number of connections kept open to each host.
+        Cannot be combined with ``session``
+    :type pool_maxsize: int, optional
+    :param pool_block: Whether to wait for a connection to a host to become free when
+        ``pool_maxsize`` connections are in use, rather than opening an extra
+        connection which is not kept. Cannot be combined with ``session``
+    :type pool_block: bool, optional
+    :param response_cache: A cache for the responses to ``GET`` requests. By default,
+        responses are not cached. Requests other than ``GET`` drop the cached
+        responses for their URL from every cache which the transport has used
+    :type response_cache: :class:`ResponseCache \
+        <globus_sdk.transport.ResponseCache>`, optional
+    :param request_coalescer: Used to share a single request between identical
+        ``GET`` requests which are sent at the same time. By default, every request
+        is sent
+    :type request_coalescer: :class:`RequestCoalescer \
+        <globus_sdk.transport.RequestCoalescer>`, optional
+    :param rate_limiter: Used to limit the rate of requests to each host, adapting to
+        ``429`` responses and ``Retry-After`` headers. By default, the rate is not
+        limited
+    :type rate_limiter: :class:`RateLimiter <globus_sdk.transport.RateLimiter>`,
+        optional
+    :param circuit_breaker: Used to stop sending requests to hosts which are failing.
+        By default, there is no circuit breaker
+    :type circuit_breaker: :class:`CircuitBreaker \
+        <globus_sdk.transport.CircuitBreaker>`, optional
+    :param retry_budget: Used to limit the number of retries in proportion to the
+        number of successful requests. By default, only ``max_retries`` limits retries
+    :type retry_budget: :class:`RetryBudget <globus_sdk.transport.RetryBudget>`,
+        optional
+    :param hedging_policy: Used to send a second copy of a ``GET`` request when its
+        response is slow. By default, requests are not hedged
+    :type hedging_policy: :class:`HedgingPolicy \
+        <globus_sdk.transport.HedgingPolicy>`, optional
+    :param hooks: Functions called at each step of sending a request, for instance to
+        record metrics. By default, the transport has its own empty registry, to
+        which hooks can be added
+    :type hooks: :class:`RequestHooks <globus_sdk.transport.RequestHooks>`,
+        optional
+    :param json_codec: The codec used to serialize JSON request data and to parse
+        JSON responses, or its name: ``"stdlib"``, ``"orjson"``, or ``"auto"`` to use
+        ``orjson`` if it is installed. This parameter defaults to ``"stdlib"``, but can
+        be set via the ``GLOBUS_SDK_JSON_CODEC`` environment variable
+    :type json_codec: str or :class:`JSONCodec <globus_sdk.transport.JSONCodec>`,
+        optional
     """
 
     #: default maximum number of retries
@@ -114,8 +288,41 @@ class RequestsTransport:
         retry_checks: Optional[List[RetryCheck]] = None,
         max_sleep: int = 10,
         max_retries: Optional[int] = None,
+        deadline: Optional[float] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        session: Optional[requests.Session] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        hooks: Optional[RequestHooks] = None,
     ):
-        self.session = requests.Session()
+        if session is not None:
+            if (pool_connections, pool_maxsize, pool_block) != (None, None, None):
+                raise exc.GlobusSDKUsageError(
+                    "A RequestsTransport cannot be given both a session and "
+                    "connection pool settings. Set the pool size of the session "
+                    "when it is created, e.g. with RequestsTransport.make_session()."
+                )
+            self.session = session
+        else:
+            self.session = self.make_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+        self.json_codec = get_json_codec(json_codec)
+        if not isinstance(self.json_codec, StdlibJSONCodec):
+            # JSON data is serialized by the codec, rather than by `requests`
+            self.encoders = {
+                **self.encoders,
+                "json": JSONRequestEncoder(json_codec=self.json_codec),
+            }
         self.verify_ssl = config.get_ssl_verify(verify_ssl)
         self.http_timeout = config.get_http_timeout(http_timeout)
         self._user_agent = self.BASE_USER_AGENT
@@ -126,10 +333,88 @@ class RequestsTransport:
         self.max_retries = (
             max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
         )
+        self.deadline = deadline
         self.retry_checks = list(retry_checks if retry_checks else [])  # copy
+        self.response_cache = response_cache
+        # every cache which has been used, so that writes can invalidate the responses
+        # cached for their URLs even after a cache is no longer in use
+        self._used_response_caches: List[ResponseCache] = []
+        if response_cache is not None:
+            self._used_response_caches.append(response_cache)
+        self.request_coalescer = request_coalescer
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.hedging_policy = hedging_policy
+        self.hooks = hooks if hooks is not None else RequestHooks()
         # register internal checks
         self.register_default_retry_checks()
 
+    @staticmethod
+    def make_session(
+        *,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+    ) -> requests.Session:
+        """
+        Create a session with the given connection pool settings. The session may be
+        passed to several transports (e.g. via the ``transport_params`` of clients),
+        which will then share its connections, rather than each opening their own.
+
+        Settings which are not given use the defaults of ``requests``.
+
+        :param pool_connections: The number of hosts for which connection pools are
+            kept
+        :type pool_connections: int, optional
+        :param pool_maxsize: The maximum number of connections kept open to each host
+        :type pool_maxsize: int, optional
+        :param pool_block: Whether to wait for a connection to a host to become free
+            when ``pool_maxsize`` connections are in use
+        :type pool_block: bool, optional
+
+        **Examples**
+
+        Share connections between a ``TransferClient`` and a ``GCSClient``, allowing
+        up to 32 connections to each host:
+
+        >>> session = RequestsTransport.make_session(pool_maxsize=32)
+        >>> tc = TransferClient(..., transport_params={"session": session})
+        >>> gcs = GCSClient(..., transport_params={"session": session})
+        """
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=(
+                pool_connections
+                if pool_connections is not None
+                else requests.adapters.DEFAULT_POOLSIZE
+            ),
+            pool_maxsize=(
+                pool_maxsize
+                if pool_maxsize is not None
+                else requests.adapters.DEFAULT_POOLSIZE
+            ),
+            pool_block=(
+                pool_block
+                if pool_block is not None
+                else requests.adapters.DEFAULT_POOLBLOCK
+            ),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def pool_maxsize(self) -> Optional[int]:
+        """
+        The maximum number of connections to each host which the session keeps open
+        for ``https`` URLs, or ``None`` if the session does not use an ``HTTPAdapter``
+        with a connection pool.
+        """
+        adapter = self.session.get_adapter("https://")
+        pool_maxsize = getattr(adapter, "_pool_maxsize", None)
+        return pool_maxsize if isinstance(pool_maxsize, int) else None
+
     @property
     def user_agent(self) -> str:
         return self._user_agent
@@ -151,6 +436,14 @@ class RequestsTransport:
         retry_backoff: Optional[Callable[[RetryContext], float]] = None,
         max_sleep: Optional[int] = None,
         max_retries: Optional[int] = None,
+        deadline: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        hooks: Optional[RequestHooks] = None,
     ) -> Iterator[None]:
         """
         Temporarily adjust some of the request sending settings of the transport.
@@ -173,6 +466,34 @@ class RequestsTransport:
         :type max_sleep: int, optional
         :param max_retries: The maximum number of retries allowed by this transport
         :type max_retries: int, optional
+        :param deadline: The maximum total time in seconds for a request, including
+            all of its retries
+        :type deadline: float, optional
+        :param response_cache: A cache for the responses to ``GET`` requests
+        :type response_cache: :class:`ResponseCache \
+            <globus_sdk.transport.ResponseCache>`, optional
+        :param request_coalescer: Used to share a single request between identical
+            ``GET`` requests which are sent at the same time
+        :type request_coalescer: :class:`RequestCoalescer \
+            <globus_sdk.transport.RequestCoalescer>`, optional
+        :param rate_limiter: Used to limit the rate of requests to each host
+        :type rate_limiter: :class:`RateLimiter <globus_sdk.transport.RateLimiter>`,
+            optional
+        :param circuit_breaker: Used to stop sending requests to hosts which are
+            failing
+        :type circuit_breaker: :class:`CircuitBreaker \
+            <globus_sdk.transport.CircuitBreaker>`, optional
+        :param retry_budget: Used to limit the number of retries in proportion to the
+            number of successful requests
+        :type retry_budget: :class:`RetryBudget <globus_sdk.transport.RetryBudget>`,
+            optional
+        :param hedging_policy: Used to send a second copy of a ``GET`` request when
+            its response is slow
+        :type hedging_policy: :class:`HedgingPolicy \
+            <globus_sdk.transport.HedgingPolicy>`, optional
+        :param hooks: Functions called at each step of sending a request
+        :type hooks: :class:`RequestHooks <globus_sdk.transport.RequestHooks>`,
+            optional
 
         **Examples**
 
@@ -190,6 +511,19 @@ class RequestsTransport:
         >>> client = ...  # any client class
         >>> with client.transport.tune(max_retries=0):
         >>>     foo = client.get_foo()
+
+        or to cache the responses to some calls:
+
+        >>> cache = ResponseCache()
+        >>> client = ...  # any client class
+        >>> with client.transport.tune(response_cache=cache):
+        >>>     foo = client.get_foo()
+
+        As ``tune`` changes the transport for every thread which uses it, a cache for
+        calls made by several threads should instead be given to the transport when it
+        is created. An ``opt_in`` cache is then used by the calls made through the
+        client's ``cached`` attribute, e.g. ``client.cached.get_foo()``, and by
+        ``client.get`` or ``client.request`` with ``use_response_cache=True``.
         """
         saved_settings = (
             self.verify_ssl,
@@ -197,6 +531,14 @@ class RequestsTransport:
             self.retry_backoff,
             self.max_sleep,
             self.max_retries,
+            self.deadline,
+            self.response_cache,
+            self.request_coalescer,
+            self.rate_limiter,
+            self.circuit_breaker,
+            self.retry_budget,
+            self.hedging_policy,
+            self.hooks,
         )
         if verify_ssl is not None:
             self.verify_ssl = verify_ssl
@@ -208,6 +550,24 @@ class RequestsTransport:
             self.max_sleep = max_sleep
         if max_retries is not None:
             self.max_retries = max_retries
+        if deadline is not None:
+            self.deadline = deadline
+        if response_cache is not None:
+            self.response_cache = response_cache
+            if response_cache not in self._used_response_caches:
+                self._used_response_caches.append(response_cache)
+        if request_coalescer is not None:
+            self.request_coalescer = request_coalescer
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        if circuit_breaker is not None:
+            self.circuit_breaker = circuit_breaker
+        if retry_budget is not None:
+            self.retry_budget = retry_budget
+        if hedging_policy is not None:
+            self.hedging_policy = hedging_policy
+        if hooks is not None:
+            self.hooks = hooks
         yield
         (
             self.verify_ssl,
@@ -215,6 +575,14 @@ class RequestsTransport:
             self.retry_backoff,
             self.max_sleep,
             self.max_retries,
+            self.deadline,
+            self.response_cache,
+            self.request_coalescer,
+            self.rate_limiter,
+            self.circuit_breaker,
+            self.retry_budget,
+            self.hedging_policy,
+            self.hooks,
         ) = saved_settings
 
     def _encode(
@@ -253,15 +621,31 @@ class RequestsTransport:
             else:
                 req.headers.pop("Authorization", None)  # remove any possible value
 
-    def _retry_sleep(self, ctx: RetryContext) -> None:
+    def _record_rate_limited_response(
+        self, limiter: RateLimiter, req: requests.Request, resp: requests.Response
+    ) -> None:
+        retry_after: Optional[float] = None
+        if resp.status_code in self.RETRY_AFTER_STATUS_CODES:
+            parsed_retry_after = _parse_retry_after(resp)
+            if parsed_retry_after is not None:
+                retry_after = min(parsed_retry_after, self.max_sleep)
+        limiter.record_response(req.url, resp.status_code, retry_after)
+
+    def _get_retry_sleep_period(self, ctx: RetryContext) -> float:
         """
-        Given a retry context, compute the amount of time to sleep and sleep that much
+        Given a retry context, compute the amount of time to sleep.
         This is always the minimum of the backoff (run on the context) and the
         ``max_sleep``.
         """
         sleep_period = min(self.retry_backoff(ctx), self.max_sleep)
         log.info("request retry_sleep(%s) [max=%s]", sleep_period, self.max_sleep)
-        time.sleep(sleep_period)
+        return sleep_period
+
+    def _retry_sleep(self, ctx: RetryContext) -> None:
+        """
+        Given a retry context, compute the amount of time to sleep and sleep that much
+        """
+        time.sleep(self._get_retry_sleep_period(ctx))
 
     def request(
         self,
@@ -274,6 +658,8 @@ class RequestsTransport:
         authorizer: Optional[GlobusAuthorizer] = None,
         allow_redirects: bool = True,
         stream: bool = False,
+        deadline: Optional[float] = None,
+        use_response_cache: Optional[bool] = None,
     ) -> requests.Response:
         """
         Send an HTTP request
@@ -302,53 +688,382 @@ class RequestsTransport:
         :param stream: Do not immediately download the response content. Defaults to
             ``False``
         :type stream: bool
+        :param deadline: The maximum total time in seconds for the request, including
+            all of its retries. Defaults to the ``deadline`` of the transport
+        :type deadline: float, optional
+        :param use_response_cache: Whether to use the ``response_cache`` of the
+            transport for a ``GET`` request. Defaults to using it unless the cache is
+            ``opt_in``
+        :type use_response_cache: bool, optional
 
         :return: ``requests.Response`` object
+
+        :raises GlobusDeadlineExceededError: if the deadline is reached before a
+            final response is received
+        """
+        return _run_request_steps(
+            self._request_steps(
+                method,
+                url,
+                query_params=query_params,
+                data=data,
+                headers=headers,
+                encoding=encoding,
+                authorizer=authorizer,
+                allow_redirects=allow_redirects,
+                stream=stream,
+                deadline=deadline,
+                use_response_cache=use_response_cache,
+            )
+        )
+
+    def _request_steps(
+        self,
+        method: str,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        data: Union[Dict[str, Any], str, None] = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None,
+        authorizer: Optional[GlobusAuthorizer] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        deadline: Optional[float] = None,
+        use_response_cache: Optional[bool] = None,
+    ) -> _RequestSteps:
+        """
+        The steps of sending a request, as a generator. See ``request`` for a
+        description of the parameters.
+
+        Blocking operations are yielded as ``_BlockingCall`` steps and sleeps between
+        retries are yielded as ``_Sleep`` steps. The driver running the steps sends the
+        result of each blocking call back in, or throws the exception which it raised.
         """
         log.debug("starting request for %s", url)
-        resp: Optional[requests.Response] = None
+        if deadline is None:
+            deadline = self.deadline
+        expires_at = time.monotonic() + deadline if deadline is not None else None
         req = self._encode(method, url, query_params, data, headers, encoding)
-        checker = RetryCheckRunner(self.retry_checks)
+        if method != "GET":
+            # the cached responses for the URL may be changed by this request
+            caches = list(self._used_response_caches)
+            if self.response_cache is not None and self.response_cache not in caches:
+                caches.append(self.response_cache)
+            for used_cache in caches:
+                used_cache.invalidate_url(req.url)
+        # streamed responses are not cached or shared, as their content is not read
+        cache = self.response_cache if method == "GET" and not stream else None
+        if cache is not None and not (
+            use_response_cache if use_response_cache is not None else not cache.opt_in
+        ):
+            cache = None
+        coalescer = self.request_coalescer if method == "GET" and not stream else None
+        if has_conditional_headers(req):
+            # the caller is revalidating a response of its own, so the response to it
+            # is returned as-is, and is not shared with callers which did not send
+            # the same conditional headers
+            log.debug("request has conditional headers, not caching or coalescing")
+            cache = coalescer = None
+        # events are only created if there are hooks to receive them
+        hooks = self.hooks if self.hooks else None
         log.debug("transport request state initialized")
+        if hooks is not None:
+            _emit_event(hooks, "on_request_start", req)
+            request_started_at = time.monotonic()
+
+        # add Authorization header, or (if it's a NullAuthorizer) possibly
+        # explicitly remove the Authorization header
+        yield _BlockingCall(self._set_authz_header, authorizer, req)
+        # the conditional headers added by the cache, to revalidate a cached response
+        added_headers: List[str] = []
+        if cache is not None:
+            absent_headers = [
+                name for name in CONDITIONAL_HEADERS if name not in req.headers
+            ]
+            cached = cache.lookup(req)
+            if cached is not None:
+                log.info("request done (cached response)")
+                if hooks is not None:
+                    _emit_unsent_response_event(
+                        hooks, req, cached, time.monotonic() - request_started_at
+                    )
+                return cached
+            added_headers = [name for name in absent_headers if name in req.headers]
+
+        flight = None
+        if coalescer is not None:
+            flight, started = coalescer.join(req)
+            if not started:
+                log.debug("waiting for an identical request in flight")
+                wait_timeout = None
+                if expires_at is not None:
+                    wait_timeout = max(0.0, expires_at - time.monotonic())
+                try:
+                    try:
+                        shared = yield _BlockingCall(flight.wait, wait_timeout)
+                    except requests.Timeout as err:
+                        raise _deadline_exceeded(cast(float, deadline), err)
+                except Exception as err:
+                    if hooks is not None:
+                        _emit_event(
+                            hooks,
+                            "on_error",
+                            req,
+                            exception=err,
+                            elapsed=time.monotonic() - request_started_at,
+                            retry=False,
+                        )
+                    raise
+                if shared is not None:
+                    log.info("request done (shared response)")
+                    if hooks is not None:
+                        _emit_unsent_response_event(
+                            hooks, req, shared, time.monotonic() - request_started_at
+                        )
+                    return cast(requests.Response, shared)
+                # the identical request was abandoned, so send this one
+                flight = None
+
+        shared_response: Optional[requests.Response] = None
+        shared_error: Optional[Exception] = None
+        send_with_retries = functools.partial(
+            self._send_with_retries,
+            req,
+            authorizer,
+            allow_redirects=allow_redirects,
+            stream=stream,
+            deadline=deadline,
+            expires_at=expires_at,
+            hooks=hooks,
+        )
+        try:
+            resp = yield from send_with_retries()
+            if cache is not None:
+                updated = cache.update(req, resp)
+                if updated is None and added_headers:
+                    # the response was revalidated, but it was evicted in the meantime,
+                    # so ask for the whole response
+                    log.debug("revalidated response was evicted, sending again")
+                    resp.close()
+                    for name in added_headers:
+                        del req.headers[name]
+                    resp = yield from send_with_retries()
+                    updated = cache.update(req, resp)
+                if updated is not None:
+                    resp = updated
+            shared_response = resp
+            return resp
+        except Exception as err:
+            shared_error = err
+            raise
+        finally:
+            # if sending stopped with neither, e.g. because the steps were closed,
+            # the waiting callers send their own requests
+            if coalescer is not None and flight is not None:
+                coalescer.finish(flight, response=shared_response, error=shared_error)
+
+    def _send_with_retries(
+        self,
+        req: requests.Request,
+        authorizer: Optional[GlobusAuthorizer],
+        *,
+        allow_redirects: bool,
+        stream: bool,
+        deadline: Optional[float] = None,
+        expires_at: Optional[float] = None,
+        hooks: Optional[RequestHooks] = None,
+    ) -> _RequestSteps:
+        """
+        The steps of sending a request until no retry is requested. The
+        ``Authorization`` header must already be set for the first attempt.
+
+        If there is a deadline, ``expires_at`` is the time (from ``time.monotonic``)
+        at which it is reached. If ``hooks`` are given, they receive the events of
+        each attempt.
+        """
+        resp: Optional[requests.Response] = None
+        error: Optional[requests.RequestException] = None
+        limiter = self.rate_limiter
+        breaker = self.circuit_breaker
+        budget = self.retry_budget
+        # only GETs are hedged, as they are idempotent, and only if the response
+        # content is read, so that the slower response can be closed
+        send: Callable[..., requests.Response] = self.session.send
+        hedging = self.hedging_policy
+        if hedging is not None and req.method == "GET" and not stream:
+            send = functools.partial(
+                hedging.send,
+                self.session.send,
+                rate_limiter=limiter,
+                circuit_breaker=breaker,
+            )
+        # the circuit breaker is the first retry check, so that requests to a host
+        # whose circuit opened are not retried
+        checker = RetryCheckRunner(
+            [breaker, *self.retry_checks] if breaker is not None else self.retry_checks
+        )
         for attempt in range(self.max_retries + 1):
             log.debug("transport request retry cycle. attempt=%d", attempt)
-            # add Authorization header, or (if it's a NullAuthorizer) possibly
-            # explicitly remove the Authorization header
-            # done fresh for each request, to handle potential for refreshed credentials
-            self._set_authz_header(authorizer, req)
+            if attempt:
+                # the Authorization header is set fresh for each attempt, to handle
+                # potential for refreshed credentials
+                yield _BlockingCall(self._set_authz_header, authorizer, req)
+            if limiter is not None:
+                delay = limiter.acquire(req.url)
+                if delay:
+                    if (
+                        expires_at is not None
+                        and time.monotonic() + delay >= expires_at
+                    ):
+                        # the request will not be sent, so its place in line is
+                        # given to the requests behind it
+                        limiter.release(req.url)
+                        raise _deadline_exceeded(cast(float, deadline), error, resp)
+                    log.debug("waiting for rate limit")
+                    yield _Sleep(delay)
+            # the breaker is checked after waiting for the rate limit, as the circuit
+            # may open while waiting, and a trial request should be sent at once
+            try:
+                trial = breaker.check_request(req.url) if breaker is not None else None
+            except exc.GlobusCircuitOpenError:
+                if limiter is not None:
+                    limiter.release(req.url)
+                raise
+
+            # the timeout of the attempt is shortened to the time before the deadline
+            timeout = self.http_timeout
+            timeout_is_deadline = False
+            if expires_at is not None:
+                remaining = expires_at - time.monotonic()
+                if remaining <= 0:
+                    if limiter is not None:
+                        limiter.release(req.url)
+                    raise _deadline_exceeded(cast(float, deadline), error, resp)
+                if timeout is None or remaining < timeout:
+                    timeout, timeout_is_deadline = remaining, True
 
-            ctx = RetryContext(attempt, authorizer=authorizer)
+            ctx = RetryContext(
+                attempt,
+                authorizer=authorizer,
+                url=req.url,
+                authorization=req.headers.get("Authorization"),
+            )
+            prepared = req.prepare()
+            if hooks is not None:
+                bytes_sent = body_size(prepared)
+                _emit_event(
+                    hooks, "on_attempt", req, attempt=attempt, bytes_sent=bytes_sent
+                )
+                started_at = time.monotonic()
             try:
                 log.debug("request about to send")
-                resp = ctx.response = self.session.send(
-                    req.prepare(),
-                    timeout=self.http_timeout,
+                sent: requests.Response = yield _BlockingCall(
+                    send,
+                    prepared,
+                    timeout=timeout,
                     verify=self.verify_ssl,
                     allow_redirects=allow_redirects,
                     stream=stream,
                 )
+                resp = ctx.response = sent
             except requests.RequestException as err:
                 log.debug("request hit error (RequestException)")
-                ctx.exception = err
-                if attempt >= self.max_retries or not checker.should_retry(ctx):
-                    log.warning("request done (fail, error)")
-                    raise exc.convert_request_exception(err)
-                log.debug("request may retry (should-retry=true)")
+                ctx.exception = error = err
+                resp = None
+                if breaker is not None:
+                    breaker.record_result(req.url, breaker.is_failure(ctx), trial=trial)
+                deadline_reached = timeout_is_deadline and isinstance(
+                    err, requests.Timeout
+                )
+                # retry checks may block, e.g. to refresh a token after a 401
+                checks_retry = not deadline_reached and (
+                    yield _BlockingCall(checker.should_retry, ctx)
+                )
             else:
+                error = None
+                deadline_reached = False
+                if breaker is not None:
+                    breaker.record_result(req.url, breaker.is_failure(ctx), trial=trial)
+                if limiter is not None:
+                    self._record_rate_limited_response(limiter, req, resp)
                 log.debug("request success, still check should-retry")
-                if not checker.should_retry(ctx):
+                checks_retry = yield _BlockingCall(checker.should_retry, ctx)
+
+            # decide whether the request will be retried before reporting the attempt,
+            # as the attempt limit, the deadline, or the retry budget may prevent it
+            retry = checks_retry and attempt < self.max_retries
+            if retry:
+                log.debug("request may retry, under attempt limit")
+                sleep_period = self._get_retry_sleep_period(ctx)
+                if (
+                    expires_at is not None
+                    and time.monotonic() + sleep_period >= expires_at
+                ):
+                    # there is no time left for another attempt
+                    retry, deadline_reached = False, True
+                # retrying with updated authorization does not spend the budget, as
+                # it is not caused by a failing service
+                elif (
+                    budget is not None
+                    and not ctx.authorization_updated
+                    and not budget.try_spend()
+                ):
+                    log.debug("request will not retry (retry budget)")
+                    retry = False
+
+            if hooks is not None:
+                if error is not None:
+                    _emit_event(
+                        hooks,
+                        "on_error",
+                        req,
+                        attempt=attempt,
+                        exception=error,
+                        bytes_sent=bytes_sent,
+                        elapsed=time.monotonic() - started_at,
+                        retry=retry,
+                    )
+                elif resp is not None:
+                    _emit_event(
+                        hooks,
+                        "on_response",
+                        req,
+                        attempt=attempt,
+                        status_code=resp.status_code,
+                        bytes_sent=bytes_sent,
+                        bytes_received=response_size(resp, stream),
+                        elapsed=time.monotonic() - started_at,
+                        time_to_first_byte=resp.elapsed.total_seconds(),
+                        retry=retry,
+                    )
+
+            if deadline_reached:
+                raise _deadline_exceeded(cast(float, deadline), error, resp)
+            if not retry:
+                if error is not None:
+                    log.warning("request done (fail, error)")
+                    raise exc.convert_request_exception(error)
+                if resp is None:
+                    raise ValueError("Somehow, retries ended without a response")
+                if checks_retry:
+                    log.warning("request reached max retries, done (fail, response)")
+                else:
                     log.info("request done (success)")
-                    return resp
-                log.debug("request may retry, will check attempts")
+                    if budget is not None and resp.status_code < 500:
+                        budget.record_success()
+                return resp
 
             # the request will be retried, so sleep...
-            if attempt < self.max_retries:
-                log.debug("under attempt limit, will sleep")
-                self._retry_sleep(ctx)
-        if resp is None:
-            raise ValueError("Somehow, retries ended without a response")
-        log.warning("request reached max retries, done (fail, response)")
-        return resp
+            if hooks is not None:
+                _emit_event(
+                    hooks,
+                    "on_retry_sleep",
+                    req,
+                    attempt=attempt,
+                    sleep=sleep_period,
+                )
+            yield _Sleep(sleep_period)
+        raise ValueError("Somehow, retries ended without a response")
 
     # decorator which lets you add a check to a retry policy
     def register_retry_check(self, func: RetryCheck) -> RetryCheck:
@@ -429,6 +1144,7 @@ class RequestsTransport:
 
         # run the authorizer's handler, and 'do_retry' if the handler indicated
         # that it was able to make a change which should make the request retryable
-        if ctx.authorizer.handle_missing_authorization():
+        if ctx.authorizer.handle_rejected_authorization(ctx.authorization):
+            ctx.authorization_updated = True
             return RetryCheckResult.do_retry
         return RetryCheckResult.no_decision
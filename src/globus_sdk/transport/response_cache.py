@@ -0,0 +1,322 @@
+import collections
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from globus_sdk._cache import CacheStats
+
+log = logging.getLogger(__name__)
+
+# (URL, serialized query params, serialized KEY_HEADERS, hash of the Authorization
+# header)
+RequestKey = Tuple[str, str, str, str]
+
+#: the headers which a cache adds to a request to revalidate a cached response
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+#: the request headers which select a different response, and so are part of the key
+KEY_HEADERS = ("Accept", "Accept-Encoding", "Accept-Language", "Range")
+
+
+class ResponseCacheStats(CacheStats):
+    """
+    Counters describing the use of a :class:`ResponseCache`.
+
+    ``hits`` counts responses served without contacting the service, and ``misses``
+    counts requests which were sent. Of the misses, ``revalidations`` counts those
+    which were answered with ``304 Not Modified``, so that the cached body was used.
+
+    :ivar revalidations: The number of cached responses confirmed by a 304
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.revalidations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseCacheStats(hits={self.hits}, misses={self.misses}, "
+            f"revalidations={self.revalidations}, evictions={self.evictions}, "
+            f"expirations={self.expirations}, invalidations={self.invalidations})"
+        )
+
+
+def _parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _get_max_age(directives: Dict[str, Optional[str]]) -> Optional[float]:
+    try:
+        return float(directives["max-age"] or "")
+    except (KeyError, ValueError):
+        return None
+
+
+def has_conditional_headers(req: requests.Request) -> bool:
+    """
+    Check whether a request has any of the ``CONDITIONAL_HEADERS``.
+    """
+    names = {name.lower() for name in (req.headers or {})}
+    return any(name.lower() in names for name in CONDITIONAL_HEADERS)
+
+
+def request_key(req: requests.Request) -> RequestKey:
+    """
+    Get a key identifying the response to a request, for the purpose of reusing it.
+    Requests with the same URL, query params, ``Authorization`` header, and values of
+    the headers in ``KEY_HEADERS`` have the same key.
+    """
+    headers = {name.lower(): value for name, value in (req.headers or {}).items()}
+    authorization = headers.get("authorization") or ""
+    return (
+        req.url,
+        json.dumps(req.params or {}, sort_keys=True, default=str),
+        json.dumps([headers.get(name.lower()) for name in KEY_HEADERS]),
+        hashlib.sha256(authorization.encode("utf-8")).hexdigest(),
+    )
+
+
+def clone_response(response: requests.Response) -> requests.Response:
+    """
+    Copy a response whose content has been read, so that each caller gets its own
+    response object.
+    """
+    clone = requests.Response()
+    clone.status_code = response.status_code
+    clone.headers = copy.copy(response.headers)
+    clone._content = response.content
+    clone._content_consumed = True  # type: ignore[attr-defined]
+    clone.encoding = response.encoding
+    clone.url = response.url
+    clone.reason = response.reason
+    clone.request = response.request
+    clone.elapsed = response.elapsed
+    clone.history = list(response.history)
+    clone.cookies = copy.copy(response.cookies)
+    return clone
+
+
+class _CacheEntry:
+    def __init__(
+        self, response: requests.Response, fresh_until: float, size: int
+    ) -> None:
+        self.response = response
+        self.fresh_until = fresh_until
+        self.size = size
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.fresh_until
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if "ETag" in self.response.headers:
+            headers["If-None-Match"] = self.response.headers["ETag"]
+        if "Last-Modified" in self.response.headers:
+            headers["If-Modified-Since"] = self.response.headers["Last-Modified"]
+        return headers
+
+
+class ResponseCache:
+    """
+    A cache of responses to ``GET`` requests, for use by a
+    :class:`RequestsTransport <globus_sdk.transport.RequestsTransport>`.
+
+    Responses are cached according to their headers:
+
+    - a response with ``Cache-Control: max-age=N`` is reused for ``N`` seconds
+      without contacting the service
+    - a response with an ``ETag`` or ``Last-Modified`` header is revalidated after
+      that, by sending ``If-None-Match`` or ``If-Modified-Since``. If the service
+      responds with ``304 Not Modified``, the cached response is used
+    - a response with ``Cache-Control: no-store``, or with none of these headers, is
+      not cached
+    - a request which is sent with its own ``If-None-Match`` or ``If-Modified-Since``
+      header does not use the cache, and gets the response of the service as-is
+
+    Responses are cached separately for each ``Authorization`` header, so that data
+    is never shared between users, and for each value of the headers which select a
+    representation, such as ``Accept``. Any other request to a URL, sent by a transport
+    which has used the cache, drops the cached responses for it.
+
+    When the cache holds ``maxsize`` responses, or their bodies are larger than
+    ``max_bytes`` in total, the least recently used responses are evicted.
+
+    :param maxsize: The maximum number of responses to cache
+    :type maxsize: int
+    :param max_bytes: The maximum total size of the bodies of cached responses
+    :type max_bytes: int
+    :param opt_in: If true, only the responses to requests sent with
+        ``use_response_cache=True``, or through the ``cached`` attribute of a client,
+        are cached. By default, the responses to all ``GET`` requests are cached
+        unless they are sent with ``use_response_cache=False``
+    :type opt_in: bool
+
+    **Examples**
+
+    Cache the responses to all calls of a client:
+
+    >>> cache = ResponseCache(maxsize=1024)
+    >>> tc = TransferClient(..., transport_params={"response_cache": cache})
+
+    or only to some calls:
+
+    >>> cache = ResponseCache(maxsize=1024, opt_in=True)
+    >>> tc = TransferClient(..., transport_params={"response_cache": cache})
+    >>> ep = tc.cached.get_endpoint(endpoint_id)
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        opt_in: bool = False,
+    ):
+        if maxsize < 1:
+            raise ValueError("cache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.opt_in = opt_in
+        self.stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+        self._size = 0
+        # ordered from least to most recently used
+        self._entries: "collections.OrderedDict[RequestKey, _CacheEntry]" = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: RequestKey) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def lookup(self, req: requests.Request) -> Optional[requests.Response]:
+        """
+        Get a fresh cached response for a request. If there is a cached response
+        which must be revalidated, conditional headers are added to the request.
+
+        A request which already has conditional headers must not use the cache, as
+        the cache would replace them, and answer a ``304`` with its own response.
+
+        :param req: The request, with its ``Authorization`` header set
+        :type req: requests.Request
+        """
+        key = request_key(req)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.is_fresh():
+                self.stats.hits += 1
+                log.debug("response cache hit for %s", req.url)
+                return clone_response(entry.response)
+            self.stats.misses += 1
+            conditional_headers = entry.conditional_headers()
+        log.debug("response cache revalidating %s", req.url)
+        req.headers.update(conditional_headers)
+        return None
+
+    def update(
+        self, req: requests.Request, response: requests.Response
+    ) -> Optional[requests.Response]:
+        """
+        Handle the response to a request which was not served from the cache, and
+        return the response to use. A ``304 Not Modified`` response is replaced with
+        the cached response, and cacheable responses are stored.
+
+        If the response is a ``304`` but the cached response was evicted after the
+        request was sent, ``None`` is returned. The request must then be sent again
+        without the conditional headers which were added by :meth:`lookup`.
+
+        :param req: The request which was sent
+        :type req: requests.Request
+        :param response: The response which was received
+        :type response: requests.Response
+        """
+        key = request_key(req)
+        directives = _parse_cache_control(response.headers.get("Cache-Control", ""))
+        max_age = _get_max_age(directives)
+        if max_age is not None:
+            try:
+                max_age -= float(response.headers.get("Age") or 0)
+            except ValueError:
+                pass
+        fresh_until = time.monotonic() + (
+            max_age if max_age is not None and "no-cache" not in directives else 0
+        )
+
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return None
+                self.stats.revalidations += 1
+                log.debug("response cache revalidated %s", req.url)
+                entry.response.headers.update(response.headers)
+                entry.fresh_until = fresh_until
+                return clone_response(entry.response)
+
+        cacheable = response.status_code == 200 and (
+            "no-store" not in directives
+            and (
+                max_age is not None
+                or "ETag" in response.headers
+                or "Last-Modified" in response.headers
+            )
+        )
+        # the body is read before taking the lock
+        size = len(response.content) if cacheable else 0
+        if size > self.max_bytes:
+            cacheable = False
+
+        # any cached response is replaced in the same step, so that concurrent
+        # updates for a key each count the size of the entry which they replace
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if not cacheable:
+                return response
+            self._entries[key] = _CacheEntry(response, fresh_until, size)
+            self._size += size
+            while len(self._entries) > self.maxsize or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return clone_response(response)
+
+    def invalidate_url(self, url: str) -> int:
+        """
+        Drop all cached responses for a URL. Returns the number dropped.
+
+        :param url: The URL of the requests, without a query string
+        :type url: str
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == url]
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses.
+        """
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._size = 0
@@ -30,6 +30,10 @@ class RetryContext:
     :param authorizer: The authorizer object from the client making the request
     :type authorizer: :class:`GlobusAuthorizer \
         <globus_sdk.authorizers.GlobusAuthorizer>`
+    :param url: The URL of the request
+    :type url: str
+    :param authorization: The ``Authorization`` header sent with the request
+    :type authorization: str
     """
 
     def __init__(
@@ -39,17 +43,27 @@ class RetryContext:
         authorizer: Optional[GlobusAuthorizer] = None,
         response: Optional[requests.Response] = None,
         exception: Optional[Exception] = None,
+        url: Optional[str] = None,
+        authorization: Optional[str] = None,
     ):
         # retry attempt number
         self.attempt = attempt
+        # the URL of the request, if known
+        self.url = url
         # if there is an authorizer for the request, it will be available in the context
         self.authorizer = authorizer
+        # the Authorization header which was sent, so that the authorizer can tell
+        # which token was rejected, whichever thread runs the retry checks
+        self.authorization = authorization
         # the response or exception from a request
         # we expect exactly one of these to be non-null
         self.response = response
         self.exception = exception
         # the retry delay or "backoff" before retrying
         self.backoff: Optional[float] = None
+        # set when the authorizer updated the authorization for the request, e.g. by
+        # refreshing an expired token, so that retrying it is expected to succeed
+        self.authorization_updated = False
 
 
 class RetryCheckResult(enum.Enum):
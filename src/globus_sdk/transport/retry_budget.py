@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+
+class RetryBudget:
+    """
+    A ``RetryBudget`` limits the number of retries sent by transports, in proportion
+    to the number of successful requests, so that retries cannot multiply the load on
+    services which are struggling.
+
+    The budget is a token bucket. Each successful request earns ``ratio`` tokens, and
+    each retry spends one token. When there are no tokens, requests are not retried,
+    and the last response or error is returned or raised as if the maximum number of
+    retries had been reached. So that clients which send few requests can still
+    retry, ``min_retries_per_second`` tokens are also earned each second. The bucket
+    holds at most ``max_tokens``, and starts full.
+
+    Retrying a request after its authorization was updated, e.g. after a ``401`` for
+    an expired token, does not spend a token.
+
+    Transports which are given the same ``RetryBudget`` share it, so a single budget
+    should be shared by all of the clients in a process.
+
+    :param ratio: The number of retries allowed per successful request
+    :type ratio: float
+    :param min_retries_per_second: The number of retries allowed per second,
+        regardless of the number of successful requests
+    :type min_retries_per_second: float
+    :param max_tokens: The maximum number of retries which may be saved up
+    :type max_tokens: float
+
+    **Examples**
+
+    Allow retries to add at most 10% to the number of requests, beyond a minimum of
+    one retry per second:
+
+    >>> budget = RetryBudget(ratio=0.1, min_retries_per_second=1)
+    >>> tc = TransferClient(..., transport_params={"retry_budget": budget})
+    >>> ac = AuthClient(..., transport_params={"retry_budget": budget})
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 20.0,
+    ) -> None:
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError("ratio and min_retries_per_second must not be negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        #: the number of retries which were allowed
+        self.retries_allowed = 0
+        #: the number of retries which were prevented
+        self.retries_denied = 0
+        self._lock = threading.Lock()
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+
+    def _deposit(self, amount: float) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._deposit(max(now - self._updated, 0.0) * self.min_retries_per_second)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """The number of retries which are currently allowed."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def record_success(self) -> None:
+        """
+        Record a successful request, earning ``ratio`` tokens.
+        """
+        with self._lock:
+            self._deposit(self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Spend a token for a retry. Returns False, and spends nothing, if there are no
+        tokens.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries_allowed += 1
+                return True
+            self.retries_denied += 1
+        log.warning("retry budget exhausted, request will not be retried")
+        return False
@@ -19,6 +19,7 @@ from typing import (
 )
 
 C = TypeVar("C", bound=Callable[..., Any])
+E = TypeVar("E", bound=BaseException)
 T = TypeVar("T")
 R = TypeVar("R")
 
@@ -37,6 +38,19 @@ def b64str(s: str) -> str:
     return b64encode(s.encode("utf-8")).decode("utf-8")
 
 
+def copy_error(error: E) -> E:
+    """
+    Copy an error, without calling its ``__init__``, so that each caller which is
+    handed a shared error raises its own error object, and their tracebacks are not
+    added to the same one.
+    """
+    copied = type(error).__new__(type(error))
+    copied.args = error.args
+    if hasattr(error, "__dict__"):
+        copied.__dict__.update(error.__dict__)
+    return copied
+
+
 def slash_join(a: str, b: Optional[str]) -> str:
     """
     Join a and b with a single slash, regardless of whether they already
@@ -3,6 +3,7 @@ from unittest import mock
 import pytest
 import responses
 
+from globus_sdk.services.auth import _oidc_cache
 from globus_sdk.transport import RequestsTransport
 
 
@@ -32,3 +33,14 @@ def mocked_responses():
 
     responses.stop()
     responses.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_oidc_cache():
+    """
+    The OIDC configuration and signing keys are cached for the whole process, so
+    clear them between tests which decode ID tokens.
+    """
+    _oidc_cache.clear()
+    yield
+    _oidc_cache.clear()
@@ -0,0 +1,260 @@
+import asyncio
+import concurrent.futures
+import pathlib
+import threading
+from unittest import mock
+
+import pytest
+
+import globus_sdk
+import globus_sdk.aio
+from globus_sdk._testing import RegisteredResponse, load_response
+from globus_sdk.aio import AsyncBaseClient, AsyncTransferClient, blocking_method
+from globus_sdk.aio._generate_services import generate_services
+from globus_sdk.transport import RetryCheckResult
+
+
+@pytest.fixture
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def asyncsleep():
+    async def fake_sleep(_seconds):
+        pass
+
+    with mock.patch("asyncio.sleep", side_effect=fake_sleep) as m:
+        yield m
+
+
+@pytest.fixture
+def client():
+    class CustomClient(globus_sdk.BaseClient):
+        service_name = "foo"
+
+    class AsyncCustomClient(AsyncBaseClient):
+        client_class = CustomClient
+
+    return AsyncCustomClient()
+
+
+def test_async_get(run, client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    res = run(client.get("/bar"))
+    assert isinstance(res, globus_sdk.GlobusHTTPResponse)
+    assert res.http_status == 200
+    assert res["baz"] == 1
+
+
+def test_async_error_raises_client_error_class(run, client):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", status=404, json={"code": "NotFound"}
+        )
+    )
+    with pytest.raises(globus_sdk.GlobusAPIError) as excinfo:
+        run(client.get("/bar"))
+    assert excinfo.value.http_status == 404
+    assert excinfo.value.code == "NotFound"
+
+
+def test_async_retry_uses_asyncio_sleep(run, client, mocksleep, asyncsleep):
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar", status=500, body="Uh-oh!"
+        )
+    )
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    res = run(client.get("/bar"))
+    assert res["baz"] == 1
+
+    # the retry slept on the event loop, not in a thread
+    asyncsleep.assert_called_once()
+    mocksleep.assert_not_called()
+
+
+def test_async_requests_run_concurrently(run, client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+
+    async def many():
+        return await asyncio.gather(*(client.get("/bar") for _ in range(10)))
+
+    results = run(many())
+    assert [r["baz"] for r in results] == [1] * 10
+
+
+def test_async_retry_checks_run_in_executor(run, client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    check_threads = []
+
+    def check(ctx):
+        check_threads.append(threading.current_thread())
+        return RetryCheckResult.no_decision
+
+    client.transport.retry_checks.append(check)
+    run(client.get("/bar"))
+    # a check may block, e.g. to refresh a token, so it does not run on the loop
+    assert check_threads
+    assert threading.main_thread() not in check_threads
+
+
+def test_async_authorizer_header_is_set(run, client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    client.client.authorizer = globus_sdk.AccessTokenAuthorizer("token")
+    res = run(client.get("/bar"))
+    assert res._raw_response.request.headers["Authorization"] == "Bearer token"
+
+
+def test_async_service_client_wraps_methods(run):
+    meta = load_response(AsyncTransferClient.client_class.get_endpoint).metadata
+    tc = AsyncTransferClient()
+
+    res = run(tc.get_endpoint(meta["endpoint_id"]))
+    assert isinstance(res, globus_sdk.GlobusHTTPResponse)
+    assert res["id"] == meta["endpoint_id"]
+
+    # attributes are read from the wrapped client
+    assert tc.base_url == tc.client.base_url
+    assert tc.transport is tc.client.transport
+
+
+def test_blocking_method_runs_the_wrapped_clients_method(run):
+    class CustomClient(globus_sdk.BaseClient):
+        service_name = "foo"
+
+        def get_bar(self, *, baz: int) -> globus_sdk.GlobusHTTPResponse:
+            return self.get("/bar", query_params={"baz": baz})
+
+    class AsyncCustomClient(AsyncBaseClient):
+        client_class = CustomClient
+
+        get_bar = blocking_method(CustomClient.get_bar)
+
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", json={"baz": 1})
+    )
+    client = AsyncCustomClient()
+    assert asyncio.iscoroutinefunction(client.get_bar)
+    assert client.get_bar.__doc__ == CustomClient.get_bar.__doc__
+    res = run(client.get_bar(baz=1))
+    assert res["baz"] == 1
+    assert res._raw_response.request.url.endswith("?baz=1")
+
+
+def test_generated_services_are_up_to_date():
+    services_path = pathlib.Path(globus_sdk.aio.__file__).parent / "services.py"
+    assert services_path.read_text(encoding="utf-8") == generate_services()
+
+
+def test_async_client_does_not_wrap_methods_without_io():
+    ac = globus_sdk.aio.AsyncConfidentialAppAuthClient("client_id", "secret")
+    assert asyncio.iscoroutinefunction(ac.oauth2_token)
+    assert asyncio.iscoroutinefunction(ac.get_jwk)
+    # building a URL sends no request, so it is not a coroutine
+    assert not asyncio.iscoroutinefunction(ac.oauth2_get_authorize_url)
+
+
+def test_async_client_sizes_thread_and_connection_pools():
+    tc = AsyncTransferClient(max_workers=16)
+    assert tc.async_transport.max_workers == 16
+    assert tc.transport.session.get_adapter("https://")._pool_maxsize == 16
+
+    # a session which is passed in is not changed
+    session = globus_sdk.transport.RequestsTransport.make_session(pool_maxsize=4)
+    tc = AsyncTransferClient(transport_params={"session": session})
+    assert tc.transport.session is session
+    assert session.get_adapter("https://")._pool_maxsize == 4
+
+
+def test_async_transport_executor_and_max_workers_are_exclusive():
+    with pytest.raises(globus_sdk.GlobusSDKUsageError):
+        AsyncTransferClient(
+            executor=concurrent.futures.ThreadPoolExecutor(), max_workers=2
+        )
+
+
+def test_async_paginated_method(run):
+    load_response(
+        RegisteredResponse(
+            service="transfer",
+            path="/task_list",
+            json={
+                "DATA": [{"task_id": "a"}, {"task_id": "b"}],
+                "offset": 0,
+                "limit": 1000,
+                "total": 2,
+            },
+        )
+    )
+    tc = AsyncTransferClient()
+
+    async def collect():
+        pages = [page async for page in tc.paginated.task_list()]
+        items = [item async for item in tc.paginated.task_list().items()]
+        return pages, items
+
+    pages, items = run(collect())
+    assert len(pages) == 1
+    assert isinstance(pages[0], globus_sdk.GlobusHTTPResponse)
+    assert [item["task_id"] for item in items] == ["a", "b"]
+
+
+def test_async_paginated_pages_are_fetched_in_executor(run):
+    fetch_threads = []
+
+    class CustomClient(globus_sdk.BaseClient):
+        service_name = "foo"
+
+        @globus_sdk.paging.has_paginator(
+            globus_sdk.paging.HasNextPaginator,
+            items_key="data",
+            get_page_size=lambda x: 1,
+            max_total_results=10,
+            page_size=1,
+        )
+        def get_bar(self, *, limit=None, offset=None):
+            fetch_threads.append(threading.current_thread())
+            return self.get("/bar", query_params={"offset": offset})
+
+    class AsyncCustomClient(AsyncBaseClient):
+        client_class = CustomClient
+
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar",
+            json={"data": [1], "has_next_page": True},
+        )
+    )
+    load_response(
+        RegisteredResponse(
+            path="https://foo.api.globus.org/bar",
+            json={"data": [2], "has_next_page": False},
+        )
+    )
+
+    async def collect():
+        return [item async for item in AsyncCustomClient().paginated.get_bar().items()]
+
+    assert run(collect()) == [1, 2]
+    assert len(fetch_threads) == 2
+    assert threading.main_thread() not in fetch_threads
+
+
+def test_async_paginated_rejects_methods_which_are_not_paginated():
+    tc = AsyncTransferClient()
+    with pytest.raises(AttributeError):
+        tc.paginated.get_endpoint
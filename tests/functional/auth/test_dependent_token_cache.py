@@ -0,0 +1,206 @@
+import json
+import threading
+import time
+import urllib.parse
+
+import pytest
+import responses
+
+import globus_sdk
+
+
+@pytest.fixture
+def client(no_retry_transport):
+    class CustomAuthClient(globus_sdk.ConfidentialAppAuthClient):
+        transport_class = no_retry_transport
+
+    return CustomAuthClient("client_id", "client_secret")
+
+
+def register_dependent_tokens(expires_in=3600, status=200, before_response=None):
+    def callback(request):
+        if before_response is not None:
+            before_response()
+        body = urllib.parse.parse_qs(request.body)
+        data = [
+            {
+                "access_token": f"transfer-token-for-{body['token'][0]}",
+                "expires_in": expires_in,
+                "resource_server": "transfer.api.globus.org",
+                "scope": "urn:globus:auth:scope:transfer.api.globus.org:all",
+                "token_type": "Bearer",
+                "access_type": body.get("access_type", ["online"])[0],
+            }
+        ]
+        return (status, {}, json.dumps(data))
+
+    responses.add_callback(
+        responses.POST,
+        "https://auth.globus.org/v2/oauth2/token",
+        callback=callback,
+        content_type="application/json",
+    )
+
+
+def test_dependent_tokens_are_cached(client):
+    register_dependent_tokens()
+    cache = globus_sdk.DependentTokenCache(client)
+    tokens = cache.get_dependent_tokens("token1")
+    assert tokens["transfer.api.globus.org"]["access_token"] == (
+        "transfer-token-for-token1"
+    )
+    assert cache.get_dependent_tokens("token1") == tokens
+    assert len(responses.calls) == 1
+
+    # a different token or different params is a separate exchange
+    cache.get_dependent_tokens("token2")
+    cache.get_dependent_tokens("token1", additional_params={"access_type": "offline"})
+    assert len(responses.calls) == 3
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+def test_callers_get_copies(client):
+    register_dependent_tokens()
+    cache = globus_sdk.DependentTokenCache(client)
+    tokens = cache.get_dependent_tokens("token1")
+    tokens["transfer.api.globus.org"]["access_token"] = "changed"
+    assert cache.get_dependent_tokens("token1")["transfer.api.globus.org"][
+        "access_token"
+    ] == ("transfer-token-for-token1")
+
+
+def test_tokens_near_expiration_are_not_reused(client):
+    # the tokens expire within the safety margin
+    register_dependent_tokens(expires_in=200)
+    cache = globus_sdk.DependentTokenCache(client, safety_margin=300)
+    cache.get_dependent_tokens("token1")
+    cache.get_dependent_tokens("token1")
+    assert len(responses.calls) == 2
+
+
+def test_invalidate_and_clear(client):
+    register_dependent_tokens()
+    cache = globus_sdk.DependentTokenCache(client)
+    cache.get_dependent_tokens("token1")
+    cache.get_dependent_tokens("token2")
+    assert cache.invalidate("token1") == 1
+    cache.get_dependent_tokens("token1")
+    cache.get_dependent_tokens("token2")
+    assert len(responses.calls) == 3
+    cache.clear()
+    cache.get_dependent_tokens("token2")
+    assert len(responses.calls) == 4
+
+
+def test_concurrent_exchanges_are_coalesced(client):
+    release = threading.Event()
+    register_dependent_tokens(before_response=lambda: release.wait(timeout=5))
+    cache = globus_sdk.DependentTokenCache(client)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_dependent_tokens("token1"))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    # wait until every thread has missed the cache, so that one is sending the
+    # request and the others are waiting for it
+    deadline = time.monotonic() + 5
+    while cache.stats.misses < 5:
+        assert time.monotonic() < deadline
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(results) == 5
+    assert all(result == results[0] for result in results)
+    assert len(responses.calls) == 1
+
+
+def test_errors_are_shared_and_not_cached(client):
+    register_dependent_tokens(status=400)
+    cache = globus_sdk.DependentTokenCache(client)
+    with pytest.raises(globus_sdk.AuthAPIError):
+        cache.get_dependent_tokens("token1")
+    with pytest.raises(globus_sdk.AuthAPIError):
+        cache.get_dependent_tokens("token1")
+    assert len(responses.calls) == 2
+    assert cache._in_flight == {}
+
+
+def test_concurrent_callers_get_their_own_errors(client):
+    release = threading.Event()
+    register_dependent_tokens(status=400, before_response=lambda: release.wait(5))
+    cache = globus_sdk.DependentTokenCache(client)
+
+    errors = []
+
+    def get():
+        try:
+            cache.get_dependent_tokens("token1")
+        except globus_sdk.AuthAPIError as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=get) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats.misses < 3:
+        assert time.monotonic() < deadline
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(errors) == 3
+    assert len({id(err) for err in errors}) == 3
+    assert all(err.http_status == 400 for err in errors)
+    assert len(responses.calls) == 1
+
+
+def test_waiting_callers_retry_when_the_exchange_is_interrupted(client):
+    register_dependent_tokens()
+    cache = globus_sdk.DependentTokenCache(client)
+    release = threading.Event()
+    get_dependent_tokens = client.oauth2_get_dependent_tokens
+
+    def interrupted_exchange(*args, **kwargs):
+        client.oauth2_get_dependent_tokens = get_dependent_tokens
+        release.wait(timeout=5)
+        raise KeyboardInterrupt
+
+    client.oauth2_get_dependent_tokens = interrupted_exchange
+
+    interrupts, results = [], []
+
+    def lead():
+        try:
+            cache.get_dependent_tokens("token1")
+        except KeyboardInterrupt as err:
+            interrupts.append(err)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    # a daemon, so that a follower which is never woken cannot hang the test run
+    follower = threading.Thread(
+        target=lambda: results.append(cache.get_dependent_tokens("token1")),
+        daemon=True,
+    )
+    follower.start()
+    deadline = time.monotonic() + 5
+    while cache.stats.misses < 2:
+        assert time.monotonic() < deadline
+    release.set()
+    leader.join(timeout=5)
+    follower.join(timeout=5)
+
+    assert not follower.is_alive()
+    assert len(interrupts) == 1
+    assert len(results) == 1
+    assert results[0]["transfer.api.globus.org"]["access_token"] == (
+        "transfer-token-for-token1"
+    )
+    assert len(responses.calls) == 1
+    assert cache._in_flight == {}
@@ -1,9 +1,15 @@
 import json
+import time
+import uuid
+from unittest import mock
 
 import jwt
 import pytest
+import responses
+from cryptography.hazmat.primitives.asymmetric import rsa
 
 import globus_sdk
+from globus_sdk.services.auth import _oidc_cache
 from tests.common import register_api_route
 
 OIDC_CONFIG = {
@@ -130,3 +136,116 @@ def test_decode_id_token_with_saved_oidc_config_and_jwk(token_response):
 def test_invalid_decode_id_token_usage(token_response):
     with pytest.raises(globus_sdk.exc.GlobusSDKUsageError):
         token_response.decode_id_token(jwk=JWK_PEM, jwt_params={"verify_exp": False})
+
+
+def _make_signing_key():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    kid = str(uuid.uuid4())
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS512", "use": "sig"})
+    return private_key, kid, jwk
+
+
+def _make_id_token_response(client, private_key, kid):
+    now = int(time.time())
+    claims = {
+        "sub": "c8aad43e-d274-11e5-bf98-8b02896cf782",
+        "preferred_username": "sirosen2@globusid.org",
+        "iss": "https://auth.globus.org",
+        "aud": client.client_id,
+        "iat": now,
+        "exp": now + 600,
+    }
+    id_token = jwt.encode(claims, private_key, algorithm="RS512", headers={"kid": kid})
+    payload = dict(TOKEN_PAYLOAD, id_token=id_token)
+    return globus_sdk.OAuthTokenResponse(
+        mock.Mock(json=mock.Mock(return_value=payload)), client=client
+    )
+
+
+def _count_calls(path):
+    return sum(1 for call in responses.calls if call.request.url.endswith(path))
+
+
+def test_decode_id_token_caches_oidc_config_and_jwk(client, token_response):
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route("auth", "/jwk.json", method="GET", body=json.dumps(JWK))
+
+    for _ in range(3):
+        decoded = token_response.decode_id_token(jwt_params={"verify_exp": False})
+        assert decoded["preferred_username"] == "sirosen2@globusid.org"
+
+    # a different client for the same environment shares the cache
+    other_client = globus_sdk.AuthClient(client_id=client.client_id)
+    other_client.oauth2_token({"grant_type": "authorization_code"}).decode_id_token(
+        jwt_params={"verify_exp": False}
+    )
+
+    assert _count_calls("/.well-known/openid-configuration") == 1
+    assert _count_calls("/jwk.json") == 1
+
+
+def test_decode_id_token_refetches_jwk_on_unknown_kid(client, monkeypatch):
+    old_key, old_kid, old_jwk = _make_signing_key()
+    new_key, new_kid, new_jwk = _make_signing_key()
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route(
+        "auth", "/jwk.json", method="GET", body=json.dumps({"keys": [old_jwk]})
+    )
+    register_api_route(
+        "auth",
+        "/jwk.json",
+        method="GET",
+        body=json.dumps({"keys": [old_jwk, new_jwk]}),
+    )
+
+    decoded = _make_id_token_response(client, old_key, old_kid).decode_id_token()
+    assert decoded["preferred_username"] == "sirosen2@globusid.org"
+    assert _count_calls("/jwk.json") == 1
+
+    # after the keys are rotated, a token signed with the new key causes a refetch
+    now = time.monotonic()
+    monkeypatch.setattr(
+        time,
+        "monotonic",
+        lambda: now + _oidc_cache.MIN_KEY_REFRESH_INTERVAL,
+    )
+    decoded = _make_id_token_response(client, new_key, new_kid).decode_id_token()
+    assert decoded["preferred_username"] == "sirosen2@globusid.org"
+    assert _count_calls("/jwk.json") == 2
+
+    # both keys are now cached
+    _make_id_token_response(client, old_key, old_kid).decode_id_token()
+    _make_id_token_response(client, new_key, new_kid).decode_id_token()
+    assert _count_calls("/jwk.json") == 2
+
+
+def test_decode_id_token_unknown_kid_refetch_is_rate_limited(client):
+    key, kid, jwk = _make_signing_key()
+    register_api_route(
+        "auth",
+        "/.well-known/openid-configuration",
+        method="GET",
+        body=json.dumps(OIDC_CONFIG),
+    )
+    register_api_route(
+        "auth", "/jwk.json", method="GET", body=json.dumps({"keys": [jwk]})
+    )
+
+    _make_id_token_response(client, key, kid).decode_id_token()
+
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidTokenError, match="no signing key"):
+            _make_id_token_response(client, key, "unknown-kid").decode_id_token()
+    # the keys were fetched recently, so an unknown kid does not refetch them
+    assert _count_calls("/jwk.json") == 1
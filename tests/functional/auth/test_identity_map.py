@@ -1,3 +1,7 @@
+import json
+import urllib.parse
+from unittest import mock
+
 import pytest
 import responses
 
@@ -254,3 +258,158 @@ def test_identity_map_batch_limit(client):
     last_req = get_last_request()
     assert "usernames" not in last_req.params
     assert last_req.params == {"ids": meta2["id"]}
+
+
+@pytest.fixture
+def clock():
+    # the current time, as seen by IdentityMap
+    now = [1000.0]
+    with mock.patch("time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_identity_map_keyerror_not_cached_by_default(client):
+    load_response(client.get_identities, case="sirosen")
+    idmap = globus_sdk.IdentityMap(client)
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            idmap["sirosen2@globus.org"]
+    assert len(responses.calls) == 2
+
+
+def test_identity_map_negative_cache(client, clock):
+    load_response(client.get_identities, case="sirosen")
+    idmap = globus_sdk.IdentityMap(client, negative_cache_ttl=60)
+    with pytest.raises(KeyError):
+        idmap["sirosen2@globus.org"]
+    assert len(responses.calls) == 1
+
+    # repeated lookups within the TTL do not call out to Auth
+    clock[0] += 30
+    with pytest.raises(KeyError):
+        idmap["sirosen2@globus.org"]
+    assert idmap.get("sirosen2@globus.org") is None
+    assert idmap.add("sirosen2@globus.org") is False
+    assert len(responses.calls) == 1
+
+    # after the TTL, the identity is looked up again
+    clock[0] += 30
+    with pytest.raises(KeyError):
+        idmap["sirosen2@globus.org"]
+    assert len(responses.calls) == 2
+
+
+def test_identity_map_negative_cache_del(client, clock):
+    load_response(client.get_identities, case="sirosen")
+    idmap = globus_sdk.IdentityMap(client, negative_cache_ttl=60)
+    with pytest.raises(KeyError):
+        idmap["sirosen2@globus.org"]
+    del idmap["sirosen2@globus.org"]
+    with pytest.raises(KeyError):
+        idmap["sirosen2@globus.org"]
+    assert len(responses.calls) == 2
+
+
+def test_identity_map_negative_cache_batch_misses(client, clock):
+    meta = load_response(client.get_identities, case="sirosen").metadata
+    idmap = globus_sdk.IdentityMap(
+        client, [meta["username"], "sirosen2@globus.org"], negative_cache_ttl=60
+    )
+    assert idmap[meta["username"]]["id"] == meta["id"]
+    assert len(responses.calls) == 1
+    # the other name in the batch was not found, and is remembered as such
+    with pytest.raises(KeyError):
+        idmap["sirosen2@globus.org"]
+    assert len(responses.calls) == 1
+
+
+def test_identity_map_cache_ttl(client, clock):
+    meta = load_response(client.get_identities, case="sirosen").metadata
+    idmap = globus_sdk.IdentityMap(client, cache_ttl=60)
+    assert idmap[meta["username"]]["id"] == meta["id"]
+    clock[0] += 59
+    assert idmap[meta["id"]]["username"] == meta["username"]
+    assert len(responses.calls) == 1
+
+    # the record has expired, so it is fetched again
+    clock[0] += 1
+    assert idmap[meta["id"]]["username"] == meta["username"]
+    assert len(responses.calls) == 2
+    last_req = get_last_request()
+    assert last_req.params == {"ids": meta["id"]}
+
+
+def test_identity_map_cache_ttl_shared_cache(client, clock):
+    meta = load_response(client.get_identities, case="sirosen").metadata
+    cache = {}
+    idmap1 = globus_sdk.IdentityMap(client, cache=cache)
+    idmap2 = globus_sdk.IdentityMap(client, cache=cache, cache_ttl=60)
+    assert idmap1[meta["username"]]["id"] == meta["id"]
+    # entries stored by another map expire based on when this map first saw them
+    clock[0] += 120
+    assert idmap2[meta["username"]]["id"] == meta["id"]
+    clock[0] += 59
+    assert idmap2[meta["username"]]["id"] == meta["id"]
+    assert len(responses.calls) == 1
+    clock[0] += 1
+    assert idmap2[meta["username"]]["id"] == meta["id"]
+    assert len(responses.calls) == 2
+
+
+def _register_identities_callback(identities, status=200):
+    # serve the requested identities out of a list of identity documents
+    def callback(request):
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        if "ids" in params:
+            field, wanted = "id", params["ids"][0].split(",")
+        else:
+            field, wanted = "username", params["usernames"][0].split(",")
+        found = [x for x in identities if x[field] in wanted]
+        return (status, {}, json.dumps({"identities": found}))
+
+    responses.add_callback(
+        responses.GET,
+        "https://auth.globus.org/v2/api/identities",
+        callback=callback,
+        content_type="application/json",
+    )
+
+
+def test_identity_map_resolve_all(client):
+    identities = IDENTITIES_MULTIPLE_RESPONSE["identities"]
+    _register_identities_callback(identities)
+    usernames = [x["username"] for x in identities]
+    ids = [x["id"] for x in identities]
+    idmap = globus_sdk.IdentityMap(
+        client, [usernames[0], ids[1], "nosuchuser@globus.org"], id_batch_size=1
+    )
+    idmap.resolve_all(max_workers=3)
+    # one call per batch
+    assert len(responses.calls) == 3
+    assert idmap.unresolved_ids == set()
+    assert idmap.unresolved_usernames == set()
+
+    # all lookups are now served from the cache
+    assert idmap[ids[0]]["username"] == usernames[0]
+    assert idmap[usernames[1]]["id"] == ids[1]
+    assert len(responses.calls) == 3
+
+
+def test_identity_map_resolve_all_skips_cached(client):
+    identities = IDENTITIES_MULTIPLE_RESPONSE["identities"]
+    _register_identities_callback(identities)
+    idmap = globus_sdk.IdentityMap(client, [identities[0]["username"]])
+    idmap.resolve_all()
+    assert len(responses.calls) == 1
+    idmap.add(identities[0]["id"])
+    idmap.resolve_all()
+    assert len(responses.calls) == 1
+
+
+def test_identity_map_resolve_all_error(client):
+    _register_identities_callback([], status=500)
+    idmap = globus_sdk.IdentityMap(client, ["foo@globus.org", "bar@globus.org"])
+    with pytest.raises(globus_sdk.AuthAPIError):
+        idmap.resolve_all()
+    # the values which failed to resolve are still tracked
+    assert idmap.unresolved_usernames == {"foo@globus.org", "bar@globus.org"}
@@ -0,0 +1,123 @@
+import json
+import time
+import urllib.parse
+
+import pytest
+import responses
+
+import globus_sdk
+
+
+@pytest.fixture
+def client(no_retry_transport):
+    class CustomAuthClient(globus_sdk.ConfidentialAppAuthClient):
+        transport_class = no_retry_transport
+
+    return CustomAuthClient("client_id", "client_secret")
+
+
+def register_introspect(exp=None, active=True):
+    def callback(request):
+        body = urllib.parse.parse_qs(request.body)
+        data = {"active": active, "sub": body["token"][0]}
+        if exp is not None:
+            data["exp"] = exp
+        return (200, {}, json.dumps(data))
+
+    responses.add_callback(
+        responses.POST,
+        "https://auth.globus.org/v2/oauth2/token/introspect",
+        callback=callback,
+        content_type="application/json",
+    )
+
+
+def test_introspection_is_cached(client):
+    register_introspect(exp=int(time.time()) + 3600)
+    cache = globus_sdk.TokenIntrospectionCache(client)
+
+    assert cache.introspect("token1")["sub"] == "token1"
+    assert cache.introspect("token1")["sub"] == "token1"
+    assert len(responses.calls) == 1
+    # a different token, or the same token with a different include, is a miss
+    assert cache.introspect("token2")["sub"] == "token2"
+    cache.introspect("token1", include="identity_set")
+    assert len(responses.calls) == 3
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+def test_cache_key_is_token_hash(client):
+    register_introspect()
+    cache = globus_sdk.TokenIntrospectionCache(client)
+    cache.introspect("secret_token")
+    assert all("secret_token" not in str(key) for key in cache._cache._data)
+
+
+def test_entries_expire_with_token(client):
+    # the token expires in less time than the TTL
+    register_introspect(exp=int(time.time()) + 10)
+    cache = globus_sdk.TokenIntrospectionCache(client, ttl=600)
+    cache.introspect("token1")
+    (expires_at, _) = next(iter(cache._cache._data.values()))
+    assert expires_at - time.monotonic() <= 10
+
+
+def test_expired_token_is_not_cached(client):
+    register_introspect(exp=int(time.time()) - 10)
+    cache = globus_sdk.TokenIntrospectionCache(client)
+    cache.introspect("token1")
+    cache.introspect("token1")
+    assert len(responses.calls) == 2
+
+
+def test_inactive_token_is_cached(client):
+    register_introspect(active=False)
+    cache = globus_sdk.TokenIntrospectionCache(client)
+    assert cache.introspect("token1")["active"] is False
+    assert cache.introspect("token1")["active"] is False
+    assert len(responses.calls) == 1
+
+
+def test_invalidate(client):
+    register_introspect()
+    cache = globus_sdk.TokenIntrospectionCache(client)
+    cache.introspect("token1")
+    cache.introspect("token1", include="identity_set")
+    cache.introspect("token2")
+    assert cache.invalidate("token1") == 2
+    assert cache.stats.invalidations == 2
+    cache.introspect("token1")
+    cache.introspect("token2")
+    assert len(responses.calls) == 4
+
+    cache.clear()
+    cache.introspect("token2")
+    assert len(responses.calls) == 5
+
+
+def test_lru_eviction(client):
+    register_introspect()
+    cache = globus_sdk.TokenIntrospectionCache(client, maxsize=2)
+    cache.introspect("token1")
+    cache.introspect("token2")
+    # use token1, so that token2 is the least recently used
+    cache.introspect("token1")
+    cache.introspect("token3")
+    assert cache.stats.evictions == 1
+    cache.introspect("token1")
+    assert len(responses.calls) == 3
+    cache.introspect("token2")
+    assert len(responses.calls) == 4
+
+
+def test_callers_get_copies(client):
+    register_introspect()
+    cache = globus_sdk.TokenIntrospectionCache(client)
+    first = cache.introspect("token1")
+    first.data["sub"] = "modified"
+    second = cache.introspect("token1")
+    assert second is not first
+    assert second["sub"] == "token1"
+    second.data["sub"] = "modified"
+    assert cache.introspect("token1")["sub"] == "token1"
+    assert len(responses.calls) == 1
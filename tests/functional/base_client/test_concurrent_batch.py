@@ -0,0 +1,81 @@
+import concurrent.futures
+import threading
+
+import pytest
+
+from globus_sdk import GlobusAPIError
+from globus_sdk._testing import RegisteredResponse, load_response
+
+
+def test_concurrent_batch_returns_futures(client):
+    for i in range(5):
+        load_response(
+            RegisteredResponse(
+                path=f"https://foo.api.globus.org/bar/{i}", json={"i": i}
+            )
+        )
+
+    with client.concurrent(max_workers=3) as batch:
+        futures = [batch.get(f"/bar/{i}") for i in range(5)]
+        assert all(isinstance(f, concurrent.futures.Future) for f in futures)
+
+    assert [f.result()["i"] for f in futures] == list(range(5))
+    # results() iterates in submission order
+    assert [r["i"] for r in batch.results()] == list(range(5))
+
+
+def test_concurrent_batch_runs_calls_in_parallel(client):
+    load_response(RegisteredResponse(path="https://foo.api.globus.org/bar", json={}))
+
+    # each call waits until all three are running at the same time
+    barrier = threading.Barrier(3, timeout=5)
+
+    def call():
+        barrier.wait()
+        return client.get("/bar")
+
+    with client.concurrent(max_workers=3) as batch:
+        for _ in range(3):
+            batch.submit(call)
+
+    assert len(list(batch.results())) == 3
+
+
+def test_concurrent_batch_results_raise_errors(client):
+    load_response(
+        RegisteredResponse(path="https://foo.api.globus.org/bar", status=404, json={})
+    )
+    with client.transport.tune(max_retries=0):
+        with client.concurrent() as batch:
+            future = batch.get("/bar")
+
+    with pytest.raises(GlobusAPIError):
+        future.result()
+    with pytest.raises(GlobusAPIError):
+        list(batch.results())
+
+
+def test_concurrent_batch_rejects_non_methods(client):
+    with client.concurrent() as batch:
+        with pytest.raises(AttributeError):
+            batch.base_url
+        with pytest.raises(AttributeError):
+            batch._resolve_url
+
+
+def test_concurrent_batch_defaults_to_connection_pool_size(client):
+    assert client.transport.pool_maxsize == 10
+    with client.concurrent() as batch:
+        assert batch.max_workers == 10
+
+
+def test_concurrent_batch_warns_when_larger_than_connection_pool(client, caplog):
+    with client.concurrent(max_workers=32):
+        pass
+    assert "exceeds the connection pool size (10)" in caplog.text
+
+    caplog.clear()
+    sized_client = type(client)(transport_params={"pool_maxsize": 32})
+    with sized_client.concurrent(max_workers=32):
+        pass
+    assert "exceeds the connection pool size" not in caplog.text
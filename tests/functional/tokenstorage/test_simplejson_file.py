@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 
 import pytest
 
@@ -75,3 +76,37 @@ def test_store_perms(filename, mock_response):
     # permissions given
     st_mode = os.stat(filename).st_mode & 0o777  # & 777 to remove extra bits
     assert st_mode | 0o600 == 0o600
+
+
+def test_lock_excludes_other_holders(filename):
+    adapter1 = SimpleJSONFileAdapter(filename)
+    adapter2 = SimpleJSONFileAdapter(filename)
+    held_by_1 = threading.Event()
+    release_1 = threading.Event()
+    order = []
+
+    def hold_lock_1():
+        with adapter1.lock():
+            held_by_1.set()
+            release_1.wait(timeout=5)
+            order.append("released by 1")
+
+    def hold_lock_2():
+        held_by_1.wait(timeout=5)
+        with adapter2.lock():
+            order.append("acquired by 2")
+
+    threads = [
+        threading.Thread(target=hold_lock_1),
+        threading.Thread(target=hold_lock_2),
+    ]
+    for thread in threads:
+        thread.start()
+    assert held_by_1.wait(timeout=5)
+    # give the second thread a chance to (incorrectly) get the lock
+    threads[1].join(timeout=0.1)
+    release_1.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == ["released by 1", "acquired by 2"]
+    assert os.path.exists(f"{filename}.lock")
@@ -1,7 +1,11 @@
 import os
+import threading
+import time
+from unittest import mock
 
 import pytest
 
+from globus_sdk.authorizers import RefreshTokenAuthorizer
 from globus_sdk.tokenstorage import SQLiteAdapter
 
 
@@ -179,3 +183,41 @@ def test_iter_namespaces(mock_response, db_filename):
             "bar",
             "baz",
         }
+
+
+@pytest.mark.parametrize("use_file", [True, False])
+def test_refresh_from_another_thread(
+    mock_response, mock_refresh_response, db_filename, use_file
+):
+    adapter = SQLiteAdapter(db_filename if use_file else MEMORY_DBNAME)
+    adapter.store(mock_response)
+    auth_client = mock.Mock()
+    auth_client.oauth2_refresh_token.return_value = mock_refresh_response
+    mock_refresh_response.by_resource_server["resource_server_2"][
+        "expires_at_seconds"
+    ] = (int(time.time()) + 3600)
+    authorizer = RefreshTokenAuthorizer(
+        "refresh_token_2",
+        auth_client,
+        access_token="access_token_2",
+        expires_at=int(time.time()) - 1,
+        token_storage=adapter,
+        resource_server="resource_server_2",
+    )
+
+    errors = []
+
+    def refresh():
+        try:
+            authorizer.ensure_valid_token()
+        except Exception as e:
+            errors.append(e)
+
+    # the adapter was created on this thread, and is used by the refresh on another
+    worker = threading.Thread(target=refresh)
+    worker.start()
+    worker.join(timeout=5)
+    assert errors == []
+    assert authorizer.access_token == "access_token_2_refreshed"
+    data = adapter.get_token_data("resource_server_2")
+    assert data["access_token"] == "access_token_2_refreshed"
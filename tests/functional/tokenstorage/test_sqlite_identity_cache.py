@@ -0,0 +1,159 @@
+import os
+import sqlite3
+import stat
+from unittest import mock
+
+import pytest
+import responses
+
+import globus_sdk
+from globus_sdk._testing import load_response
+from globus_sdk.tokenstorage import SQLiteIdentityCache
+
+IDENTITY1 = {
+    "id": "46bd0f56-e24f-11e5-a510-131bef46955c",
+    "username": "globus@globus.org",
+    "name": None,
+}
+IDENTITY2 = {
+    "id": "ae341a98-d274-11e5-b888-dbae3a8ba545",
+    "username": "sirosen@globus.org",
+    "name": "Stephen Rosen",
+}
+
+
+@pytest.fixture
+def db_filename(tempdir):
+    return os.path.join(tempdir, "identities.db")
+
+
+def test_lookup_by_id_and_username():
+    cache = SQLiteIdentityCache(":memory:")
+    cache[IDENTITY1["id"]] = IDENTITY1
+    assert cache[IDENTITY1["id"]] == IDENTITY1
+    assert cache[IDENTITY1["username"]] == IDENTITY1
+    assert IDENTITY1["username"] in cache
+    assert IDENTITY2["id"] not in cache
+    with pytest.raises(KeyError):
+        cache[IDENTITY2["username"]]
+
+
+def test_setitem_requires_matching_key():
+    cache = SQLiteIdentityCache(":memory:")
+    with pytest.raises(ValueError):
+        cache["foo@globus.org"] = IDENTITY1
+
+
+def test_bulk_get_and_put():
+    cache = SQLiteIdentityCache(":memory:")
+    cache.put_many([IDENTITY1, IDENTITY2])
+    assert len(cache) == 4
+    assert set(cache) == {
+        IDENTITY1["id"],
+        IDENTITY1["username"],
+        IDENTITY2["id"],
+        IDENTITY2["username"],
+    }
+    assert cache.get_many(
+        [IDENTITY1["id"], IDENTITY2["username"], "nobody@globus.org"]
+    ) == {IDENTITY1["id"]: IDENTITY1, IDENTITY2["username"]: IDENTITY2}
+
+
+def test_delete_removes_record():
+    cache = SQLiteIdentityCache(":memory:")
+    cache.put_many([IDENTITY1])
+    del cache[IDENTITY1["username"]]
+    assert IDENTITY1["id"] not in cache
+    with pytest.raises(KeyError):
+        del cache[IDENTITY1["id"]]
+
+
+def test_max_age():
+    cache = SQLiteIdentityCache(":memory:", max_age=60)
+    with mock.patch("time.time", return_value=1000.0):
+        cache.put_many([IDENTITY1])
+    with mock.patch("time.time", return_value=1030.0):
+        cache.put_many([IDENTITY2])
+
+    with mock.patch("time.time", return_value=1070.0):
+        assert IDENTITY1["id"] not in cache
+        assert cache[IDENTITY2["id"]] == IDENTITY2
+        assert cache.purge_expired() == 1
+    with mock.patch("time.time", return_value=1100.0):
+        assert len(cache) == 0
+
+
+def test_file_is_shared_and_uses_wal(db_filename):
+    cache1 = SQLiteIdentityCache(db_filename)
+    cache1.put_many([IDENTITY1])
+    assert stat.S_IMODE(os.stat(db_filename).st_mode) == 0o600
+
+    cache2 = SQLiteIdentityCache(db_filename)
+    assert cache2[IDENTITY1["username"]] == IDENTITY1
+    cache1.close()
+    cache2.close()
+
+    conn = sqlite3.connect(db_filename)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    conn.close()
+
+
+def test_use_as_identity_map_cache(db_filename):
+    meta = load_response(globus_sdk.AuthClient.get_identities).metadata
+    client = globus_sdk.AuthClient()
+    idmap = globus_sdk.IdentityMap(client, cache=SQLiteIdentityCache(db_filename))
+    assert idmap[meta["username"]]["id"] == meta["id"]
+    assert len(responses.calls) == 1
+
+    # a new map, as in a restarted process, does not need to call out to Auth
+    idmap = globus_sdk.IdentityMap(client, cache=SQLiteIdentityCache(db_filename))
+    assert idmap[meta["id"]]["username"] == meta["username"]
+    assert len(responses.calls) == 1
+
+
+def test_get_many_max_age():
+    cache = SQLiteIdentityCache(":memory:", max_age=60)
+    with mock.patch("time.time", return_value=1000.0):
+        cache.put_many([IDENTITY1])
+    with mock.patch("time.time", return_value=1030.0):
+        assert cache.get_many([IDENTITY1["id"]], max_age=10) == {}
+        assert cache.get_many([IDENTITY1["id"]], max_age=100) == {
+            IDENTITY1["id"]: IDENTITY1
+        }
+
+
+def test_identity_map_ttl_uses_stored_time(db_filename):
+    meta = load_response(globus_sdk.AuthClient.get_identities).metadata
+    client = globus_sdk.AuthClient()
+    with mock.patch("time.time", return_value=1000.0):
+        idmap = globus_sdk.IdentityMap(client, cache=SQLiteIdentityCache(db_filename))
+        assert idmap[meta["username"]]["id"] == meta["id"]
+    assert len(responses.calls) == 1
+
+    # a new map with a TTL does not treat the old record as fresh
+    with mock.patch("time.time", return_value=1100.0):
+        idmap = globus_sdk.IdentityMap(
+            client, cache=SQLiteIdentityCache(db_filename), cache_ttl=60
+        )
+        assert idmap[meta["username"]]["id"] == meta["id"]
+    assert len(responses.calls) == 2
+
+
+def test_identity_map_batches_use_bulk_lookups():
+    cache = SQLiteIdentityCache(":memory:")
+    cache.put_many([IDENTITY2])
+    load_response(globus_sdk.AuthClient.get_identities)
+    with mock.patch.object(cache, "get_many", wraps=cache.get_many) as get_many:
+        idmap = globus_sdk.IdentityMap(
+            globus_sdk.AuthClient(),
+            [IDENTITY1["id"], IDENTITY2["id"], "0ee0bd6e-3ef4-4a20-a4a4-5a4b4e0a6e3b"],
+            cache=cache,
+        )
+        idmap.get(IDENTITY1["id"])
+    # one lookup for the key, one for all of the other unresolved IDs, rather than
+    # one for each of them, and one to read the fetched record
+    assert get_many.call_count == 3
+    # the cached identity was not requested
+    requested = responses.calls[-1].request.params["ids"].split(",")
+    assert IDENTITY2["id"] not in requested
+    assert len(requested) == 2
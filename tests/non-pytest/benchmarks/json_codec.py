@@ -0,0 +1,106 @@
+"""
+Compare the JSON codecs available to the transport on large payloads: a transfer
+submission with many items, and a page of successful transfers.
+
+Run from the repo root with
+
+    python tests/non-pytest/benchmarks/json_codec.py
+
+Codecs which are not installed (e.g. orjson) are skipped.
+"""
+import timeit
+import uuid
+
+import requests
+
+from globus_sdk.transport import JSONCodec, get_json_codec
+
+NUMBER = 20
+
+
+def make_transfer_data(n: int) -> dict:
+    return {
+        "DATA_TYPE": "transfer",
+        "submission_id": str(uuid.uuid1()),
+        "source_endpoint": str(uuid.uuid1()),
+        "destination_endpoint": str(uuid.uuid1()),
+        "sync_level": 3,
+        "verify_checksum": True,
+        "DATA": [
+            {
+                "DATA_TYPE": "transfer_item",
+                "source_path": f"/~/source/dir{i % 100}/file-{i}.dat",
+                "destination_path": f"/~/dest/dir{i % 100}/file-{i}.dat",
+                "recursive": False,
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def make_successful_transfers_page(n: int) -> bytes:
+    codec = get_json_codec("stdlib")
+    return codec.dumps(
+        {
+            "DATA_TYPE": "successful_transfers",
+            "marker": 123456,
+            "next_marker": 123456 + n,
+            "DATA": [
+                {
+                    "DATA_TYPE": "successful_transfer",
+                    "source_path": f"/~/source/dir{i % 100}/file-{i}.dat",
+                    "destination_path": f"/~/dest/dir{i % 100}/file-{i}.dat",
+                    "size": i * 1024,
+                    "checksum": None,
+                }
+                for i in range(n)
+            ],
+        }
+    )
+
+
+def make_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    return response
+
+
+def bench(codec: JSONCodec, transfer_data: dict, page: bytes) -> tuple:
+    dump_time = timeit.timeit(lambda: codec.dumps(transfer_data), number=NUMBER)
+    load_time = timeit.timeit(
+        lambda: codec.load_response(make_response(page)), number=NUMBER
+    )
+    return (dump_time / NUMBER, load_time / NUMBER)
+
+
+def main() -> None:
+    transfer_data = make_transfer_data(100_000)
+    page = make_successful_transfers_page(100_000)
+    print(f"transfer submission: {len(transfer_data['DATA'])} items")
+    print(f"successful transfers page: {len(page) / 1e6:.1f} MB")
+    print()
+    print(f"{'codec':<8} {'dumps (ms)':>12} {'load_response (ms)':>20}")
+
+    baseline = None
+    for name in ("stdlib", "orjson"):
+        try:
+            codec = get_json_codec(name)
+        except ImportError:
+            print(f"{name:<8} {'(not installed)':>12}")
+            continue
+        dump_time, load_time = bench(codec, transfer_data, page)
+        line = f"{name:<8} {dump_time * 1000:>12.1f} {load_time * 1000:>20.1f}"
+        if baseline is None:
+            baseline = (dump_time, load_time)
+        else:
+            line += (
+                f"   ({baseline[0] / dump_time:.1f}x, "
+                f"{baseline[1] / load_time:.1f}x faster)"
+            )
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
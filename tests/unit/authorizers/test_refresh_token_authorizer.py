@@ -1,3 +1,4 @@
+import time
 from unittest import mock
 
 import pytest
@@ -79,3 +80,25 @@ def test_conditional_refresh_token_update(authorizer, response):
     else:  # otherwise, confirm no change
         assert authorizer.access_token == "access_token_2"
         assert authorizer.refresh_token == "refresh_token_1"
+
+
+def test_stored_refresh_token_is_used(client):
+    storage = mock.MagicMock()
+    storage.get_token_data.return_value = {
+        "access_token": "stored_access_token",
+        "refresh_token": "stored_refresh_token",
+        "expires_at_seconds": time.time() + 900,
+    }
+    authorizer = RefreshTokenAuthorizer(
+        REFRESH_TOKEN,
+        client,
+        access_token=ACCESS_TOKEN,
+        expires_at=EXPIRES_AT,
+        token_storage=storage,
+        resource_server="rs1",
+    )
+    authorizer.ensure_valid_token()
+    storage.get_token_data.assert_called_once_with("rs1")
+    client.oauth2_refresh_token.assert_not_called()
+    assert authorizer.access_token == "stored_access_token"
+    assert authorizer.refresh_token == "stored_refresh_token"
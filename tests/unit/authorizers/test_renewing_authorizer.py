@@ -1,10 +1,15 @@
+import contextlib
+import gc
+import threading
 import time
+import weakref
 from unittest import mock
 
 import pytest
 
 from globus_sdk import exc
 from globus_sdk.authorizers.renewing import EXPIRES_ADJUST_SECONDS, RenewingAuthorizer
+from globus_sdk.tokenstorage import StorageAdapter
 
 
 class MockRenewer(RenewingAuthorizer):
@@ -190,3 +195,249 @@ def test_handle_missing_authorization(authorizer):
     """
     assert authorizer.handle_missing_authorization()
     assert authorizer.expires_at is None
+
+
+def test_concurrent_refresh_is_single_flight(expired_authorizer, token_data):
+    """
+    When many threads find the token expired at once, only one gets a new token
+    """
+    refreshing = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_get_token_response():
+        calls.append(threading.current_thread().name)
+        refreshing.set()
+        release.wait(timeout=5)
+        return expired_authorizer.token_response
+
+    expired_authorizer._get_token_response = slow_get_token_response
+
+    headers = []
+    threads = [
+        threading.Thread(
+            target=lambda: headers.append(expired_authorizer.get_authorization_header())
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    assert refreshing.wait(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert headers == ["Bearer " + token_data["access_token"]] * 8
+
+
+def test_refresh_publishes_token_and_expiration_together(
+    expired_authorizer, token_data
+):
+    """
+    A reader never sees the new expiration time paired with the old token, or the
+    reverse, while a refresh is replacing them
+    """
+    old_pair = (expired_authorizer.access_token, expired_authorizer.expires_at)
+    new_pair = (token_data["access_token"], token_data["expires_at_seconds"])
+    seen = []
+
+    class ObservingRenewer(MockRenewer):
+        def __setattr__(self, name, value):
+            super().__setattr__(name, value)
+            if hasattr(self, "_token"):
+                seen.append((self.access_token, self.expires_at))
+
+    authorizer = ObservingRenewer(
+        token_data, access_token=old_pair[0], expires_at=old_pair[1]
+    )
+    seen.clear()
+    authorizer.ensure_valid_token()
+
+    assert seen
+    assert set(seen) <= {old_pair, new_pair}
+    assert seen[-1] == new_pair
+
+
+def test_handle_rejected_authorization_on_another_thread(authorizer, token_data):
+    """
+    A 401 is handled according to the rejected header, not the token last used by
+    the thread which handles it
+    """
+    header = authorizer.get_authorization_header()
+    # this thread last used another token, e.g. for an earlier request
+    authorizer._thread_local.access_token = "access_token_0"
+
+    # the current token was rejected, so it is invalidated
+    assert authorizer.handle_rejected_authorization(header)
+    assert authorizer.expires_at is None
+
+    authorizer.ensure_valid_token()
+    assert authorizer.access_token == token_data["access_token"]
+    # a 401 for the old token keeps the new one
+    assert authorizer.handle_rejected_authorization(header)
+    assert authorizer.expires_at == token_data["expires_at_seconds"]
+
+
+def test_handle_missing_authorization_for_replaced_token(authorizer, token_data):
+    """
+    A 401 for a token which has already been replaced does not invalidate the
+    current token
+    """
+    assert authorizer.get_authorization_header() == "Bearer " + ACCESS_TOKEN
+    # another thread gets a 401 and replaces the token
+    worker = threading.Thread(
+        target=lambda: (
+            authorizer.handle_missing_authorization(),
+            authorizer.ensure_valid_token(),
+        )
+    )
+    worker.start()
+    worker.join()
+    assert authorizer.access_token == token_data["access_token"]
+
+    # this thread's 401 for the old token keeps the new one
+    assert authorizer.handle_missing_authorization()
+    assert authorizer.expires_at == token_data["expires_at_seconds"]
+    assert authorizer.get_authorization_header() == (
+        "Bearer " + token_data["access_token"]
+    )
+
+
+def test_background_refresh(on_refresh, token_data):
+    refreshed = threading.Event()
+    on_refresh.side_effect = lambda res: refreshed.set()
+    # the token expires within the margin, so it is refreshed right away
+    authorizer = MockRenewer(
+        token_data,
+        access_token=ACCESS_TOKEN,
+        expires_at=int(time.time()) + 100,
+        on_refresh=on_refresh,
+        background_refresh_margin=300,
+    )
+    try:
+        assert refreshed.wait(timeout=5)
+        assert authorizer.access_token == token_data["access_token"]
+        # a refresh of the new token is scheduled in turn
+        assert authorizer._background_refresh_timer is not None
+    finally:
+        authorizer.cancel_background_refresh()
+    assert authorizer._background_refresh_timer is None
+
+
+def test_background_refresh_not_started_by_default(authorizer):
+    assert authorizer.background_refresh_margin is None
+    assert authorizer._background_refresh_timer is None
+
+
+def test_background_refresh_error_is_logged(token_data, caplog):
+    authorizer = MockRenewer(
+        token_data,
+        access_token=ACCESS_TOKEN,
+        expires_at=int(time.time()) + 100,
+        background_refresh_margin=10,
+    )
+    authorizer._get_token_response = mock.Mock(side_effect=ValueError("oh no"))
+    authorizer.expires_at = int(time.time())
+    authorizer._background_refresh()
+    assert "background refresh failed" in caplog.text
+    # the token is unchanged, and will be refreshed when next used
+    assert authorizer.access_token == ACCESS_TOKEN
+    authorizer.cancel_background_refresh()
+
+
+def test_background_refresh_cancelled_on_garbage_collection(token_data):
+    authorizer = MockRenewer(
+        token_data,
+        access_token=ACCESS_TOKEN,
+        expires_at=int(time.time()) + 1000,
+        background_refresh_margin=300,
+    )
+    timer = authorizer._background_refresh_timer
+    assert timer is not None and not timer.finished.is_set()
+
+    # the pending timer does not keep the authorizer alive
+    ref = weakref.ref(authorizer)
+    del authorizer
+    gc.collect()
+    assert ref() is None
+    assert timer.finished.is_set()
+    timer.join(timeout=5)
+    assert not timer.is_alive()
+
+
+class MemoryStorage(StorageAdapter):
+    """
+    A storage adapter which keeps token data in a dict, and records when its lock is
+    held
+    """
+
+    def __init__(self, token_data=None):
+        self.token_data = token_data
+        self.locked = False
+        self.lock_held_during_store = None
+
+    def store(self, token_response):
+        self.lock_held_during_store = self.locked
+        self.token_data = token_response.by_resource_server["rs"]
+
+    def get_token_data(self, resource_server):
+        assert resource_server == "rs"
+        return self.token_data
+
+    @contextlib.contextmanager
+    def lock(self):
+        self.locked = True
+        try:
+            yield
+        finally:
+            self.locked = False
+
+
+def test_token_storage_requires_resource_server(token_data):
+    with pytest.raises(exc.GlobusSDKUsageError):
+        MockRenewer(token_data, token_storage=MemoryStorage())
+
+
+def test_token_storage_newer_token_is_used(expired_authorizer, token_data):
+    stored = {"access_token": "stored_token", "expires_at_seconds": time.time() + 900}
+    expired_authorizer.token_storage = MemoryStorage(stored)
+    expired_authorizer.resource_server = "rs"
+    expired_authorizer._get_token_response = mock.Mock()
+
+    assert expired_authorizer.get_authorization_header() == "Bearer stored_token"
+    assert expired_authorizer.expires_at == stored["expires_at_seconds"]
+    expired_authorizer._get_token_response.assert_not_called()
+
+
+@pytest.mark.parametrize("stored_state", ["none", "same", "expired"])
+def test_token_storage_refresh_is_stored(
+    expired_authorizer, token_data, on_refresh, stored_state
+):
+    stored = {
+        "none": None,
+        "same": {
+            "access_token": ACCESS_TOKEN,
+            "expires_at_seconds": time.time() + 900,
+        },
+        "expired": {"access_token": "old", "expires_at_seconds": time.time() + 10},
+    }[stored_state]
+    storage = MemoryStorage(stored)
+    expired_authorizer.token_storage = storage
+    expired_authorizer.resource_server = "rs"
+    expired_authorizer.token_response.by_resource_server = {"rs": token_data}
+
+    expired_authorizer.ensure_valid_token()
+    assert expired_authorizer.access_token == token_data["access_token"]
+    # the new token was stored while holding the lock
+    assert storage.token_data == token_data
+    assert storage.lock_held_during_store is True
+    on_refresh.assert_called_once()
+
+
+def test_token_storage_used_on_init(token_data):
+    stored = {"access_token": "stored_token", "expires_at_seconds": time.time() + 900}
+    authorizer = MockRenewer(
+        token_data, token_storage=MemoryStorage(stored), resource_server="rs"
+    )
+    assert authorizer.access_token == "stored_token"
@@ -304,3 +304,42 @@ def test_http_headers_from_response():
 
     r3 = GlobusHTTPResponse(r2)  # wrap another response
     assert r3.headers["content-length"] == "5"
+
+
+def test_json_is_parsed_lazily_and_once():
+    raw = _response({"x": 1})
+    with mock.patch.object(raw, "json", wraps=raw.json) as json_spy:
+        res = GlobusHTTPResponse(raw, client=mock.Mock())
+        # only the status is used, so the body is never parsed
+        assert res.http_status == 200
+        assert json_spy.call_count == 0
+
+        assert res["x"] == 1
+        assert res.data == {"x": 1}
+        assert "x" in res
+        assert json_spy.call_count == 1
+
+
+def test_wrapping_response_does_not_parse_again():
+    raw = _response({"DATA_TYPE": "foo_list", "DATA": [{"x": 1}]})
+    with mock.patch.object(raw, "json", wraps=raw.json) as json_spy:
+        res = GlobusHTTPResponse(raw, client=mock.Mock())
+        assert res["DATA_TYPE"] == "foo_list"
+
+        class FooListResponse(IterableResponse):
+            default_iter_key = "DATA"
+
+        wrapped = FooListResponse(GlobusHTTPResponse(res))
+        assert list(wrapped) == [{"x": 1}]
+        assert json_spy.call_count == 1
+
+
+def test_invalid_json_warning_is_emitted_on_access(caplog):
+    res = GlobusHTTPResponse(
+        _response(b"{", headers={"Content-Type": "application/json"}),
+        client=mock.Mock(),
+    )
+    assert "did not parse as JSON" not in caplog.text
+    assert res.data is None
+    assert res.data is None
+    assert caplog.text.count("did not parse as JSON") == 1
@@ -0,0 +1,79 @@
+from unittest import mock
+
+import pytest
+
+from globus_sdk._cache import TTLCache
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with mock.patch("time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_ttl_expiry(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=10)
+    clock[0] += 10
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    clock[0] += 50
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 2
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+    assert len(cache) == 0
+
+
+def test_no_ttl(clock):
+    cache = TTLCache(maxsize=10)
+    cache.set("a", 1)
+    clock[0] += 10**6
+    assert cache.get("a") == 1
+
+
+def test_nonpositive_ttl_is_not_stored():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, ttl=0)
+    cache.set("b", 1, ttl=-5)
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+
+
+def test_invalidation():
+    cache = TTLCache(maxsize=10)
+    for key in ("a1", "a2", "b1"):
+        cache.set(key, 1)
+    assert cache.invalidate("b1") is True
+    assert cache.invalidate("b1") is False
+    assert cache.invalidate_matching(lambda key: key.startswith("a")) == 2
+    assert len(cache) == 0
+    assert cache.stats.invalidations == 3
+
+
+def test_hit_rate():
+    cache = TTLCache(maxsize=10)
+    assert cache.stats.hit_rate == 0.0
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats.hit_rate == 0.5
+    assert "hits=1" in repr(cache.stats)
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
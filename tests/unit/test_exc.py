@@ -1,6 +1,7 @@
 import itertools
 import json
 from collections import namedtuple
+from unittest import mock
 
 import pytest
 import requests
@@ -127,6 +128,63 @@ def test_raw_json_fail(text_response, malformed_response):
     assert err.raw_json is None
 
 
+def test_error_body_is_parsed_once(json_response):
+    with mock.patch.object(
+        json_response.r, "json", wraps=json_response.r.json
+    ) as json_spy:
+        err = exc.GlobusAPIError(json_response.r)
+        assert json_spy.call_count == 0
+        assert err.raw_json == json_response.data
+        assert err.code == "Json Error"
+        assert err.info.consent_required is not None
+        assert json_spy.call_count == 1
+
+
+def test_error_body_is_parsed_on_first_use_of_code(json_response):
+    err = TransferAPIError(json_response.r)
+    assert not err._did_parse_json
+    assert err.message == "json error message"
+    assert err._did_parse_json
+    assert err.request_id is None
+
+
+def test_error_body_is_parsed_with_the_configured_codec(monkeypatch, json_response):
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", "orjson")
+    with mock.patch.object(orjson, "loads", wraps=orjson.loads) as loads_spy:
+        err = exc.GlobusAPIError(json_response.r)
+        assert err.raw_json == json_response.data
+        assert loads_spy.call_count == 1
+
+
+def test_parsed_fields_of_service_errors_are_settable(transfer_response):
+    err = TransferAPIError(transfer_response.r)
+    err.request_id = "abc"
+    err.code = "Other Error"
+    # setting a field parses the body, so the value is not overwritten later
+    assert err.message == "transfer error message"
+    assert err.request_id == "abc"
+    assert err.code == "Other Error"
+
+
+def test_subclass_with_plain_attributes_is_parsed_when_created(transfer_response):
+    class CustomError(exc.GlobusAPIError):
+        def __init__(self, r):
+            self.request_id = None
+            super().__init__(r)
+
+        def _load_from_json(self, data):
+            super()._load_from_json(data)
+            self.request_id = data.get("request_id")
+
+    err = CustomError(transfer_response.r)
+    assert err._did_parse_json
+    assert err.request_id == 123
+    assert err.code == "Transfer Error"
+    # subclasses which do not parse more fields are still parsed lazily
+    assert not TransferAPIError(transfer_response.r)._did_parse_json
+
+
 def test_raw_text_works(json_response, text_response):
     err = exc.GlobusAPIError(json_response.r)
     assert err.raw_text == json.dumps(json_response.data)
@@ -1,12 +1,22 @@
+import io
 import json
+import threading
 from unittest import mock
 
 import pytest
 import requests
 
-from globus_sdk.paging import HasNextPaginator
+import globus_sdk
+import globus_sdk.paging._stream
+from globus_sdk.paging import (
+    HasNextPaginator,
+    LimitOffsetTotalPaginator,
+    MarkerPaginator,
+    Paginator,
+)
 from globus_sdk.response import GlobusHTTPResponse
 from globus_sdk.services.transfer.response import IterableTransferResponse
+from tests.common import register_api_route
 
 N = 25
 
@@ -18,7 +28,7 @@ class PagingSimulator:
     def simulate_get(self, *args, **params):
         """
         Simulates a paginated response from a Globus API get supporting limit,
-        offset, and has next page
+        offset, total, and has next page
         """
         offset = params.get("offset", 0)
         limit = params["limit"]
@@ -31,6 +41,7 @@ class PagingSimulator:
             data["DATA"].append({"value": i})
         # fill has_next_page field
         data["has_next_page"] = (offset + limit) < self.n
+        data["total"] = self.n
 
         # make the simulated response
         response = requests.Response()
@@ -64,3 +75,526 @@ def test_has_next_paginator(paging_simulator):
     # confirm results
     for item, expected in zip(all_items(), range(N)):
         assert item["value"] == expected
+
+
+def _make_has_next_paginator(method):
+    return HasNextPaginator(
+        method,
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=1000,
+        page_size=10,
+        client_args=[],
+        client_kwargs={},
+        items_key="DATA",
+    )
+
+
+def test_prefetch_produces_the_same_items(paging_simulator):
+    paginator = _make_has_next_paginator(paging_simulator.simulate_get).prefetch(2)
+    assert [item["value"] for item in paginator.items()] == list(range(N))
+
+
+def test_prefetch_fetches_ahead_of_consumer(paging_simulator):
+    fetched = []
+    third_page_fetched = threading.Event()
+
+    def get(*args, **kwargs):
+        fetched.append(kwargs["offset"] if "offset" in kwargs else 0)
+        if len(fetched) == 3:
+            third_page_fetched.set()
+        return paging_simulator.simulate_get(*args, **kwargs)
+
+    pages = _make_has_next_paginator(get).prefetch(depth=2).pages()
+    first = next(pages)
+    assert first["offset"] == 0
+    # while the first page is held by the consumer, later pages are fetched
+    assert third_page_fetched.wait(timeout=5)
+    assert [page["offset"] for page in pages] == [10, 20]
+
+
+def test_prefetch_reraises_errors():
+    def get(*args, **kwargs):
+        raise ValueError("oh no")
+
+    with pytest.raises(ValueError, match="oh no"):
+        list(_make_has_next_paginator(get).prefetch().pages())
+
+
+def test_prefetch_depth_must_be_positive(paging_simulator):
+    with pytest.raises(ValueError):
+        _make_has_next_paginator(paging_simulator.simulate_get).prefetch(depth=0)
+
+
+def _make_total_paginator(method, max_total_results=1000):
+    return LimitOffsetTotalPaginator(
+        method,
+        get_page_size=lambda x: len(x["DATA"]),
+        max_total_results=max_total_results,
+        page_size=10,
+        client_args=[],
+        client_kwargs={},
+        items_key="DATA",
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 8])
+def test_parallel_produces_the_same_items(paging_simulator, max_workers):
+    serial = _make_total_paginator(paging_simulator.simulate_get)
+    parallel = _make_total_paginator(paging_simulator.simulate_get).parallel(
+        max_workers
+    )
+    expected = [item["value"] for item in serial.items()]
+    assert expected == list(range(N))
+    assert [item["value"] for item in parallel.items()] == expected
+
+
+def test_parallel_fetches_remaining_pages_at_once():
+    simulator = PagingSimulator(40)
+    # the three pages after the first can only complete if all are in flight at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get(*args, **kwargs):
+        if kwargs.get("offset", 0) > 0:
+            barrier.wait()
+        return simulator.simulate_get(*args, **kwargs)
+
+    pages = list(_make_total_paginator(get).parallel(max_workers=3).pages())
+    assert [page["offset"] for page in pages] == [0, 10, 20, 30]
+    assert [page["limit"] for page in pages] == [10, 10, 10, 10]
+
+
+def test_parallel_respects_max_total_results(paging_simulator):
+    paginator = _make_total_paginator(
+        paging_simulator.simulate_get, max_total_results=15
+    ).parallel()
+    assert [item["value"] for item in paginator.items()] == list(range(15))
+
+
+def test_parallel_steps_by_size_of_first_page():
+    simulator = PagingSimulator(N)
+
+    def get(*args, **kwargs):
+        # a service which caps the page size below the requested limit
+        return simulator.simulate_get(*args, **{**kwargs, "limit": 4})
+
+    paginator = _make_total_paginator(get).parallel()
+    assert [item["value"] for item in paginator.items()] == list(range(N))
+
+
+def test_parallel_fetches_gap_after_short_page(paging_simulator):
+    calls = []
+
+    def get(*args, **kwargs):
+        calls.append((kwargs.get("offset", 0), kwargs["limit"]))
+        if kwargs.get("offset") == 10 and kwargs["limit"] == 10:
+            # a middle page which comes back short
+            kwargs["limit"] = 6
+        return paging_simulator.simulate_get(*args, **kwargs)
+
+    paginator = _make_total_paginator(get).parallel()
+    checkpoints = []
+    paginator.on_checkpoint(checkpoints.append)
+    pages = list(paginator.pages())
+
+    assert [item["value"] for page in pages for item in page] == list(range(N))
+    assert [page["offset"] for page in pages] == [0, 10, 16, 20]
+    assert (16, 4) in calls
+    # each checkpoint is the offset after the items produced so far
+    assert [json.loads(c)["cursor"]["offset"] for c in checkpoints] == [10, 16, 20, 25]
+
+
+def test_parallel_stops_at_empty_page(paging_simulator):
+    def get(*args, **kwargs):
+        if kwargs.get("offset", 0) >= 10:
+            kwargs["limit"] = 0
+        return paging_simulator.simulate_get(*args, **kwargs)
+
+    paginator = _make_total_paginator(get).parallel()
+    assert [item["value"] for item in paginator.items()] == list(range(10))
+    assert json.loads(paginator.checkpoint())["cursor"] == {"offset": 10}
+
+
+def test_parallel_reraises_errors(paging_simulator):
+    def get(*args, **kwargs):
+        if kwargs.get("offset", 0) == 10:
+            raise ValueError("oh no")
+        return paging_simulator.simulate_get(*args, **kwargs)
+
+    pages = _make_total_paginator(get).parallel().pages()
+    assert next(pages)["offset"] == 0
+    with pytest.raises(ValueError, match="oh no"):
+        list(pages)
+
+
+def test_parallel_max_workers_must_be_positive(paging_simulator):
+    with pytest.raises(ValueError):
+        _make_total_paginator(paging_simulator.simulate_get).parallel(max_workers=0)
+
+
+def _make_marker_paginator(method):
+    return MarkerPaginator(method, client_args=[], client_kwargs={}, items_key="DATA")
+
+
+class MarkerPagingSimulator:
+    def __init__(self, n, page_size=10):
+        self.n = n
+        self.page_size = page_size
+        self.calls = []
+
+    def simulate_get(self, *args, **params):
+        self.calls.append(params.get("marker"))
+        offset = int(params.get("marker") or 0)
+        end = min(self.n, offset + self.page_size)
+        data = {
+            "DATA": [{"value": i} for i in range(offset, end)],
+            "has_next_page": end < self.n,
+            "marker": str(end),
+        }
+        response = requests.Response()
+        response._content = json.dumps(data).encode()
+        response.headers["Content-Type"] = "application/json"
+        return IterableTransferResponse(GlobusHTTPResponse(response, mock.Mock()))
+
+
+def test_checkpoint_and_restore_marker_paginator():
+    simulator = MarkerPagingSimulator(N)
+    paginator = _make_marker_paginator(simulator.simulate_get)
+    pages = paginator.pages()
+    next(pages)
+    next(pages)
+    # the checkpoint is taken when the consumer has handled the second page
+    # but has not yet asked for the third
+    checkpoint = paginator.checkpoint()
+    assert json.loads(checkpoint)["cursor"] == {"marker": "10"}
+
+    simulator.calls.clear()
+    restored = _make_marker_paginator(simulator.simulate_get).restore(checkpoint)
+    assert [item["value"] for item in restored.items()] == list(range(10, N))
+    assert simulator.calls == ["10", "20"]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_checkpoint_and_restore_limit_offset_paginator(paging_simulator, parallel):
+    paginator = _make_total_paginator(paging_simulator.simulate_get)
+    if parallel:
+        paginator.parallel(max_workers=2)
+    pages = paginator.pages()
+    next(pages)
+    next(pages)
+    checkpoint = paginator.checkpoint()
+    assert json.loads(checkpoint)["cursor"] == {"offset": 10}
+
+    restored = _make_total_paginator(paging_simulator.simulate_get).restore(checkpoint)
+    assert [item["value"] for item in restored.items()] == list(range(10, N))
+
+
+def test_restore_from_final_checkpoint_yields_nothing(paging_simulator):
+    paginator = _make_has_next_paginator(paging_simulator.simulate_get)
+    list(paginator.pages())
+    checkpoint = paginator.checkpoint()
+    assert json.loads(checkpoint)["exhausted"] is True
+
+    get = mock.Mock()
+    restored = _make_has_next_paginator(get).restore(checkpoint)
+    assert list(restored.pages()) == []
+    get.assert_not_called()
+
+
+def test_on_checkpoint_callback(paging_simulator):
+    checkpoints = []
+    paginator = _make_has_next_paginator(paging_simulator.simulate_get)
+    paginator.on_checkpoint(checkpoints.append, every=2)
+    assert len(list(paginator.pages())) == 3
+    # one checkpoint after the second page, and one after the last page
+    assert [json.loads(c)["cursor"]["offset"] for c in checkpoints] == [20, 25]
+    assert [json.loads(c)["exhausted"] for c in checkpoints] == [False, True]
+
+
+def test_restore_rejects_bad_checkpoints(paging_simulator):
+    checkpoint = _make_has_next_paginator(paging_simulator.simulate_get).checkpoint()
+    paginator = _make_total_paginator(paging_simulator.simulate_get)
+    with pytest.raises(ValueError, match="from a checkpoint of a HasNextPaginator"):
+        paginator.restore(checkpoint)
+    with pytest.raises(ValueError, match="not valid JSON"):
+        paginator.restore("{")
+    with pytest.raises(ValueError, match="unrecognized"):
+        paginator.restore('{"version": 0}')
+
+
+def test_restore_rejects_checkpoint_without_cursor(paging_simulator):
+    paginator = _make_has_next_paginator(paging_simulator.simulate_get)
+    checkpoint = json.loads(paginator.checkpoint())
+    del checkpoint["cursor"]
+    with pytest.raises(ValueError, match="has no cursor"):
+        paginator.restore(json.dumps(checkpoint))
+    checkpoint["cursor"] = {}
+    with pytest.raises(ValueError, match="cursor is missing 'offset'"):
+        paginator.restore(json.dumps(checkpoint))
+
+
+def test_paginator_subclass_without_cursor_state(paging_simulator):
+    """
+    A paginator which only implements ``pages()`` still works, and only fails if
+    it is checkpointed or restored
+    """
+
+    class PagesOnlyPaginator(Paginator):
+        def pages(self):
+            yield self.method(
+                *self.client_args, offset=0, limit=N, **self.client_kwargs
+            )
+
+    paginator = PagesOnlyPaginator(
+        paging_simulator.simulate_get, client_args=[], client_kwargs={}
+    )
+    assert [item["value"] for page in paginator for item in page] == list(range(N))
+
+    with pytest.raises(NotImplementedError, match="does not support checkpointing"):
+        paginator.checkpoint()
+    checkpoint = json.dumps(
+        {"version": 1, "paginator": "PagesOnlyPaginator", "cursor": {}}
+    )
+    with pytest.raises(NotImplementedError, match="does not support restoring"):
+        paginator.restore(checkpoint)
+
+
+def test_prefetch_checkpoints_follow_the_consumer(paging_simulator):
+    fetched = threading.Semaphore(0)
+
+    def get(*args, **kwargs):
+        page = paging_simulator.simulate_get(*args, **kwargs)
+        fetched.release()
+        return page
+
+    checkpoints = []
+    paginator = (
+        _make_has_next_paginator(get).on_checkpoint(checkpoints.append).prefetch(2)
+    )
+    pages = paginator.pages()
+    assert next(pages)["offset"] == 0
+    # all of the pages are fetched while the consumer handles the first
+    for _ in range(3):
+        assert fetched.acquire(timeout=5)
+    assert checkpoints == []
+    assert json.loads(paginator.checkpoint())["cursor"] == {"offset": 0}
+
+    assert next(pages)["offset"] == 10
+    assert [json.loads(c)["cursor"]["offset"] for c in checkpoints] == [10]
+    assert json.loads(paginator.checkpoint())["cursor"] == {"offset": 10}
+    assert list(pages)
+    assert [json.loads(c)["cursor"]["offset"] for c in checkpoints] == [10, 20, 25]
+    assert json.loads(checkpoints[-1])["exhausted"] is True
+
+
+def test_prefetch_checkpoint_and_restore(paging_simulator):
+    paginator = _make_has_next_paginator(paging_simulator.simulate_get).prefetch()
+    pages = paginator.pages()
+    next(pages)
+    next(pages)
+    checkpoint = paginator.checkpoint()
+    pages.close()
+
+    # checkpoints can be restored with or without prefetching
+    restored = _make_has_next_paginator(paging_simulator.simulate_get).restore(
+        checkpoint
+    )
+    assert [item["value"] for item in restored.items()] == list(range(10, N))
+    restored = (
+        _make_has_next_paginator(paging_simulator.simulate_get)
+        .prefetch()
+        .restore(checkpoint)
+    )
+    assert [item["value"] for item in restored.items()] == list(range(10, N))
+
+
+@pytest.mark.parametrize(
+    "make_paginator",
+    [_make_has_next_paginator, _make_total_paginator, _make_marker_paginator],
+)
+def test_streaming_items_produces_the_same_items(make_paginator):
+    simulator = (
+        MarkerPagingSimulator(N)
+        if make_paginator is _make_marker_paginator
+        else PagingSimulator(N)
+    )
+    streamed = list(make_paginator(simulator.simulate_get).items(stream=True))
+    assert streamed == list(make_paginator(simulator.simulate_get).items())
+    assert [item["value"] for item in streamed] == list(range(N))
+
+
+def test_streaming_items_keeps_other_page_fields(paging_simulator):
+    paginator = _make_has_next_paginator(paging_simulator.simulate_get)
+    pages = []
+    original_get = paging_simulator.simulate_get
+
+    def get(*args, **kwargs):
+        page = original_get(*args, **kwargs)
+        pages.append(page)
+        return page
+
+    paginator.method = get
+    assert len(list(paginator.items(stream=True))) == N
+    # the items are not retained, but the fields used for paging are
+    assert [page["offset"] for page in pages] == [0, 10, 20]
+    assert [page["DATA"] for page in pages] == [[None] * 10, [None] * 10, [None] * 5]
+
+
+def test_streaming_items_with_parallel_pages(paging_simulator):
+    paginator = _make_total_paginator(paging_simulator.simulate_get).parallel(2)
+    assert [item["value"] for item in paginator.items(stream=True)] == list(range(N))
+
+
+class _CountingRaw(io.BytesIO):
+    """a response body which records how much of it has been read"""
+
+    def read(self, *args, **kwargs):
+        data = super().read(*args, **kwargs)
+        self.bytes_read = self.tell()
+        return data
+
+
+def _streamed_response(data):
+    response = requests.Response()
+    response.raw = _CountingRaw(json.dumps(data).encode())
+    response.raw.bytes_read = 0
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    return response
+
+
+def test_streaming_items_reads_the_body_incrementally(monkeypatch):
+    monkeypatch.setattr(globus_sdk.paging._stream, "_CHUNK_SIZE", 64)
+    data = {
+        "DATA": [{"value": i, "padding": "x" * 100} for i in range(100)],
+        "has_next_page": False,
+        "marker": None,
+    }
+    response = _streamed_response(data)
+    body_size = len(response.raw.getvalue())
+
+    def get(*args, **kwargs):
+        return IterableTransferResponse(GlobusHTTPResponse(response, mock.Mock()))
+
+    items = _make_marker_paginator(get).items(stream=True)
+    assert next(items)["value"] == 0
+    # only the start of the body has been read
+    assert response.raw.bytes_read < 1000
+    assert [item["value"] for item in items] == list(range(1, 100))
+    assert response.raw.bytes_read == body_size
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        {"DATA": []},
+        {},
+        {
+            "a": 1,
+            "DATA": [1, 22.5, -333, "é☃", None, True, [1, [2]], {"b": {}}],
+            "z": 0,
+        },
+        {"DATA": None},
+        {"DATA": {"not": "an array"}, "next": "abc"},
+        {"before": [{"DATA": [1]}], "DATA": [{"DATA": [2]}], "after": 12345678901},
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_json_stream_reader(doc, chunk_size):
+    body = json.dumps(doc, indent=2).encode("utf-8")
+    chunks = requests.utils.iter_slices(body, chunk_size)
+    reader = globus_sdk.paging._stream._JSONStreamReader(chunks, "utf-8")
+    fields = {}
+    items = reader.iter_object_items("DATA", fields)
+    if doc.get("DATA") is None and "DATA" in doc:
+        with pytest.raises(TypeError):
+            list(items)
+        return
+    assert list(items) == list(doc.get("DATA") or [])
+    expected_fields = dict(doc)
+    if isinstance(doc.get("DATA"), list):
+        expected_fields["DATA"] = [None] * len(doc["DATA"])
+    assert fields == expected_fields
+
+
+def test_json_stream_reader_decodes_large_items_in_linear_time():
+    # an item of 100,000 characters, read 10 characters at a time
+    item = {"padding": "x" * 100_000}
+    body = json.dumps({"DATA": [item, 1]}).encode("utf-8")
+    chunks = requests.utils.iter_slices(body, 10)
+    reader = globus_sdk.paging._stream._JSONStreamReader(chunks, "utf-8")
+    with mock.patch.object(
+        reader, "_json_decoder", wraps=reader._json_decoder
+    ) as json_decoder:
+        assert list(reader.iter_object_items("DATA", {})) == [item, 1]
+    # the amount of text buffered doubles between attempts to decode the item,
+    # rather than growing by one chunk at a time
+    assert json_decoder.raw_decode.call_count < 30
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b'{"DATA": [1, 2}', b'{"DATA": [1]} x'])
+def test_json_stream_reader_rejects_invalid_documents(body):
+    reader = globus_sdk.paging._stream._JSONStreamReader(iter([body]), "utf-8")
+    with pytest.raises(ValueError):
+        list(reader.iter_object_items("DATA", {}))
+
+
+@pytest.fixture
+def client_with_paginated_route():
+    client = globus_sdk.TransferClient()
+    pages = [
+        {"DATA": [{"source_path": "/a"}, {"source_path": "/b"}], "next_marker": "m"},
+        {"DATA": [{"source_path": "/c"}], "next_marker": None},
+    ]
+    for page in pages * 2:
+        register_api_route("transfer", "/task/TASK_ID/successful_transfers", json=page)
+    with mock.patch.object(
+        client.transport, "request", wraps=client.transport.request
+    ) as transport_request:
+        yield client, transport_request
+
+
+def test_client_streams_page_requests(client_with_paginated_route):
+    client, transport_request = client_with_paginated_route
+    items = list(
+        client.paginated.task_successful_transfers("TASK_ID").items(stream=True)
+    )
+    assert [item["source_path"] for item in items] == ["/a", "/b", "/c"]
+    assert [c.kwargs["stream"] for c in transport_request.call_args_list] == [
+        True,
+        True,
+    ]
+
+    list(client.paginated.task_successful_transfers("TASK_ID").items())
+    assert transport_request.call_args_list[-1].kwargs["stream"] is False
+
+
+def test_client_streams_only_page_requests(client_with_paginated_route):
+    client, transport_request = client_with_paginated_route
+    register_api_route("transfer", "/task/TASK_ID", json={"task_id": "TASK_ID"})
+
+    class RefreshingAuthorizer(globus_sdk.authorizers.GlobusAuthorizer):
+        # sends a request with the client when the first page is requested, like an
+        # authorizer which refreshes its token
+        refreshed = False
+
+        def get_authorization_header(self):
+            if not self.refreshed:
+                self.refreshed = True
+                client.get_task("TASK_ID")
+            return None
+
+    client.authorizer = RefreshingAuthorizer()
+    paginator = client.paginated.task_successful_transfers("TASK_ID")
+    method = paginator.method
+    for _ in paginator.items(stream=True):
+        # requests sent while the items are handled are not streamed
+        client.get_task("TASK_ID")
+    assert [c.kwargs["stream"] for c in transport_request.call_args_list] == [
+        True,
+        False,  # the request sent by the authorizer
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert paginator.method == method
@@ -0,0 +1,237 @@
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import (
+    CircuitBreaker,
+    CircuitState,
+    RateLimiter,
+    RetryCheckResult,
+    RetryContext,
+)
+from tests.common import register_api_route
+
+URL = "https://transfer.api.globus.org/v0.10/foo"
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+@pytest.fixture
+def state_changes():
+    return []
+
+
+@pytest.fixture
+def breaker(now, state_changes):
+    return CircuitBreaker(
+        failure_threshold=0.5,
+        min_requests=4,
+        window=10,
+        reset_timeout=30,
+        on_state_change=lambda *args: state_changes.append(args),
+    )
+
+
+@pytest.fixture
+def client(breaker):
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient(transport_params={"circuit_breaker": breaker})
+
+
+def open_circuit(breaker):
+    for _ in range(4):
+        breaker.record_result(URL, failed=True)
+    assert breaker.get_state(URL) is CircuitState.open
+
+
+def test_circuit_opens_at_failure_threshold(breaker, state_changes):
+    breaker.record_result(URL, failed=True)
+    breaker.record_result(URL, failed=False)
+    breaker.record_result(URL, failed=False)
+    assert breaker.get_state(URL) is CircuitState.closed
+    breaker.record_result(URL, failed=True)
+    assert breaker.get_state(URL) is CircuitState.open
+    assert state_changes == [
+        ("transfer.api.globus.org", CircuitState.closed, CircuitState.open)
+    ]
+
+
+def test_results_leave_the_window(breaker, now):
+    for _ in range(3):
+        breaker.record_result(URL, failed=True)
+    now.return_value += 10
+    breaker.record_result(URL, failed=True)
+    # only one failure is in the window
+    assert breaker.get_state(URL) is CircuitState.closed
+
+
+def test_hosts_are_tracked_separately(breaker):
+    open_circuit(breaker)
+    assert breaker.get_state("https://auth.globus.org/") is CircuitState.closed
+    breaker.check_request("https://auth.globus.org/v2/oauth2/token")
+
+
+def test_open_circuit_fails_fast(breaker, now):
+    open_circuit(breaker)
+    now.return_value += 20
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError) as excinfo:
+        breaker.check_request(URL)
+    assert excinfo.value.host == "transfer.api.globus.org"
+    assert excinfo.value.retry_after == 10
+
+
+def test_half_open_trial_success_closes(breaker, now, state_changes):
+    open_circuit(breaker)
+    now.return_value += 30
+    assert breaker.get_state(URL) is CircuitState.half_open
+    trial = breaker.check_request(URL)
+    assert trial is not None
+    # only one trial request at a time
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError):
+        breaker.check_request(URL)
+    breaker.record_result(URL, failed=False, trial=trial)
+    assert breaker.get_state(URL) is CircuitState.closed
+    breaker.check_request(URL)
+    assert [new for (_, _, new) in state_changes] == [
+        CircuitState.open,
+        CircuitState.closed,
+    ]
+
+
+def test_half_open_trial_failure_reopens(breaker, now):
+    open_circuit(breaker)
+    now.return_value += 30
+    trial = breaker.check_request(URL)
+    breaker.record_result(URL, failed=True, trial=trial)
+    assert breaker.get_state(URL) is CircuitState.open
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError) as excinfo:
+        breaker.check_request(URL)
+    assert excinfo.value.retry_after == 30
+
+
+def test_half_open_ignores_results_of_other_requests(breaker, now):
+    # a request which was sent before the circuit opened
+    assert breaker.check_request(URL) is None
+    open_circuit(breaker)
+    now.return_value += 30
+    trial = breaker.check_request(URL)
+
+    # its success does not close the circuit, and nor does a stale trial's
+    breaker.record_result(URL, failed=False)
+    breaker.record_result(URL, failed=False, trial=trial + 1)
+    assert breaker.get_state(URL) is CircuitState.half_open
+
+    breaker.record_result(URL, failed=False, trial=trial)
+    assert breaker.get_state(URL) is CircuitState.closed
+
+
+def test_abandoned_trial_is_forgotten(breaker, now):
+    open_circuit(breaker)
+    now.return_value += 30
+    breaker.check_request(URL)
+    now.return_value += 30
+    breaker.check_request(URL)
+
+
+@pytest.mark.parametrize(
+    "ctx_kwargs, is_failure",
+    [
+        ({"exception": requests.ConnectionError()}, True),
+        ({"response": mock.Mock(status_code=503)}, True),
+        ({"response": mock.Mock(status_code=429)}, False),
+        ({"response": mock.Mock(status_code=404)}, False),
+        ({"response": mock.Mock(status_code=200)}, False),
+    ],
+)
+def test_is_failure(breaker, ctx_kwargs, is_failure):
+    assert breaker.is_failure(RetryContext(0, **ctx_kwargs)) is is_failure
+
+
+def test_retry_check(breaker):
+    ctx = RetryContext(0, url=URL)
+    assert breaker(ctx) is RetryCheckResult.no_decision
+    open_circuit(breaker)
+    assert breaker(ctx) is RetryCheckResult.do_not_retry
+    # without a URL, no decision can be made
+    assert breaker(RetryContext(0)) is RetryCheckResult.no_decision
+
+
+def test_transport_stops_retrying_when_circuit_opens(client, breaker):
+    register_api_route("transfer", "/foo", status=503, json={})
+
+    with pytest.raises(globus_sdk.GlobusAPIError) as excinfo:
+        client.get("/foo")
+    assert excinfo.value.http_status == 503
+    # the fourth failure opened the circuit, so there was no fifth attempt
+    assert len(responses.calls) == 4
+    assert breaker.get_state(URL) is CircuitState.open
+
+    with pytest.raises(globus_sdk.GlobusCircuitOpenError):
+        client.get("/foo")
+    assert len(responses.calls) == 4
+
+
+def test_transport_sends_trial_request(client, breaker, now):
+    register_api_route("transfer", "/foo", json={"x": 1})
+    open_circuit(breaker)
+    now.return_value += 30
+    assert client.get("/foo")["x"] == 1
+    assert breaker.get_state(URL) is CircuitState.closed
+
+
+def test_tune_enables_circuit_breaker(client, breaker):
+    other = CircuitBreaker()
+    with client.transport.tune(circuit_breaker=other):
+        assert client.transport.circuit_breaker is other
+    assert client.transport.circuit_breaker is breaker
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"failure_threshold": 0}, {"min_requests": 0}, {"half_open_max_calls": 0}],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_transport_checks_circuit_after_rate_limit_wait(
+    client, breaker, now, mocksleep
+):
+    register_api_route("transfer", "/foo", json={"x": 1})
+    open_circuit(breaker)
+    # the circuit becomes half-open while the request waits for the rate limit
+    limiter = mock.Mock()
+    limiter.acquire.return_value = 30
+
+    def sleep(seconds):
+        now.return_value += seconds
+
+    mocksleep.side_effect = sleep
+    with client.transport.tune(rate_limiter=limiter):
+        assert client.get("/foo")["x"] == 1
+    assert breaker.get_state(URL) is CircuitState.closed
+
+
+def test_rate_limit_token_is_returned_when_circuit_is_open(client, breaker, mocksleep):
+    open_circuit(breaker)
+    limiter = RateLimiter(initial_rate=1, burst=2)
+    with client.transport.tune(rate_limiter=limiter):
+        for _ in range(3):
+            with pytest.raises(globus_sdk.GlobusCircuitOpenError):
+                client.get("/foo")
+    # no request was sent, so no token was spent
+    assert limiter.try_acquire(URL)
+    assert limiter.try_acquire(URL)
+    assert len(responses.calls) == 0
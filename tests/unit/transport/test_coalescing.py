@@ -0,0 +1,215 @@
+import threading
+import time
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import RequestCoalescer
+
+URL = "https://transfer.api.globus.org/v0.10/foo"
+
+
+@pytest.fixture
+def coalescer():
+    return RequestCoalescer()
+
+
+@pytest.fixture
+def client_class():
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient
+
+
+@pytest.fixture
+def client(client_class, coalescer):
+    return client_class(
+        transport_params={"request_coalescer": coalescer, "max_retries": 0}
+    )
+
+
+def register_blocking_route(release, method="GET", **kwargs):
+    def callback(request):
+        release.wait(timeout=5)
+        if "exception" in kwargs:
+            raise kwargs["exception"]
+        return (200, {"Content-Type": "application/json"}, '{"x": 1}')
+
+    responses.add_callback(method, URL, callback=callback)
+
+
+def run_in_threads(func, count):
+    results, errors = [], []
+
+    def run():
+        try:
+            results.append(func())
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+
+
+def join_all(threads):
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_concurrent_gets_are_coalesced(client, coalescer):
+    release = threading.Event()
+    register_blocking_route(release)
+
+    threads, results, errors = run_in_threads(lambda: client.get("/foo"), 5)
+    # wait until one thread is sending the request and the others wait for it
+    wait_for(lambda: coalescer.coalesced == 4)
+    release.set()
+    join_all(threads)
+
+    assert errors == []
+    assert len(results) == 5
+    assert all(res.data == {"x": 1} for res in results)
+    # each caller gets its own response
+    assert len({id(res._raw_response) for res in results}) == 5
+    assert len(responses.calls) == 1
+    assert len(coalescer) == 0
+
+
+def test_errors_are_shared(client, coalescer):
+    release = threading.Event()
+    register_blocking_route(release, exception=requests.ConnectionError("boom"))
+
+    threads, results, errors = run_in_threads(lambda: client.get("/foo"), 3)
+    wait_for(lambda: coalescer.coalesced == 2)
+    release.set()
+    join_all(threads)
+
+    assert results == []
+    assert len(errors) == 3
+    assert all(isinstance(err, globus_sdk.NetworkError) for err in errors)
+    assert len(responses.calls) == 1
+    assert len(coalescer) == 0
+    # each caller raises its own copy of the error
+    assert len({id(err) for err in errors}) == 3
+    assert len({str(err) for err in errors}) == 1
+
+
+def test_waiters_stop_at_their_deadline(client, coalescer):
+    release = threading.Event()
+    register_blocking_route(release)
+
+    threads, results, errors = run_in_threads(lambda: client.get("/foo"), 1)
+    wait_for(lambda: len(coalescer) == 1)
+    with pytest.raises(globus_sdk.GlobusDeadlineExceededError):
+        client.request("GET", "/foo", deadline=0.1)
+    release.set()
+    join_all(threads)
+
+    assert errors == []
+    assert results[0].data == {"x": 1}
+    assert len(responses.calls) == 1
+
+
+def test_sequential_gets_are_not_coalesced(client, coalescer):
+    release = threading.Event()
+    release.set()
+    register_blocking_route(release)
+    client.get("/foo")
+    client.get("/foo")
+    assert len(responses.calls) == 2
+    assert coalescer.coalesced == 0
+
+
+def test_only_identical_gets_are_coalesced(client, coalescer):
+    # a request for the same URL is in flight
+    flight, started = coalescer.join(
+        requests.Request(
+            "GET",
+            URL,
+            headers={"Accept": "application/json", "Authorization": "Bearer other"},
+        )
+    )
+    assert started
+    responses.add(responses.GET, URL, json={"x": 1})
+    responses.add(responses.POST, URL, json={})
+
+    client.get("/foo")
+    client.get("/foo", query_params={"a": "b"})
+    client.post("/foo", data={})
+    assert len(responses.calls) == 3
+    assert coalescer.coalesced == 0
+    coalescer.finish(flight)
+
+
+def test_plain_get_does_not_join_a_conditional_get(client, coalescer):
+    def callback(request):
+        if "If-None-Match" in request.headers:
+            started.set()
+            release.wait(timeout=5)
+            return (304, {"ETag": '"v1"'}, "")
+        return (200, {"Content-Type": "application/json"}, '{"x": 1}')
+
+    started, release = threading.Event(), threading.Event()
+    responses.add_callback("GET", URL, callback=callback)
+
+    threads, results, errors = run_in_threads(
+        lambda: client.get("/foo", headers={"If-None-Match": '"v1"'}), 1
+    )
+    # the conditional request is in flight
+    assert started.wait(timeout=5)
+    plain = client.get("/foo")
+    release.set()
+    join_all(threads)
+
+    assert errors == []
+    assert results[0].http_status == 304
+    assert plain.http_status == 200
+    assert plain.data == {"x": 1}
+    assert len(responses.calls) == 2
+    assert coalescer.coalesced == 0
+    assert len(coalescer) == 0
+
+
+def test_waiters_send_their_own_request_if_the_flight_is_abandoned(client, coalescer):
+    flight, started = coalescer.join(
+        requests.Request("GET", URL, headers={"Accept": "application/json"})
+    )
+    assert started
+    responses.add(responses.GET, URL, json={"x": 1})
+
+    threads, results, errors = run_in_threads(lambda: client.get("/foo"), 1)
+    wait_for(lambda: coalescer.coalesced == 1)
+    coalescer.finish(flight)
+    join_all(threads)
+
+    assert errors == []
+    assert results[0].data == {"x": 1}
+    assert len(responses.calls) == 1
+
+
+def test_closed_steps_abandon_the_flight(client, coalescer):
+    steps = client.transport._request_steps("GET", URL)
+    next(steps)  # set the Authorization header
+    steps.send(None)  # start the flight, stopping before sending
+    assert len(coalescer) == 1
+    steps.close()
+    assert len(coalescer) == 0
+
+
+def test_tune_enables_coalescing(client_class, coalescer):
+    client = client_class()
+    with client.transport.tune(request_coalescer=coalescer):
+        assert client.transport.request_coalescer is coalescer
+    assert client.transport.request_coalescer is None
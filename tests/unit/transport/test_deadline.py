@@ -0,0 +1,123 @@
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from tests.common import register_api_route
+
+URL = "https://transfer.api.globus.org/v0.10/foo"
+
+
+@pytest.fixture
+def now(mocksleep):
+    with mock.patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+
+        def sleep(seconds):
+            monotonic.return_value += seconds
+
+        mocksleep.side_effect = sleep
+        yield monotonic
+
+
+@pytest.fixture
+def client(now):
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    client = CustomClient(transport_params={"retry_backoff": lambda ctx: 4})
+    # record the timeout of each attempt
+    with mock.patch.object(
+        client.transport.session, "send", wraps=client.transport.session.send
+    ):
+        yield client
+
+
+def sent_timeouts(client):
+    return [call.kwargs["timeout"] for call in client.transport.session.send.mock_calls]
+
+
+def register_slow_route(now, seconds=1, status=200, exception=None):
+    def callback(request):
+        now.return_value += seconds
+        if exception is not None:
+            raise exception
+        return (status, {"Content-Type": "application/json"}, "{}")
+
+    responses.add_callback(responses.GET, URL, callback=callback)
+
+
+def test_no_deadline_by_default(client, now):
+    register_slow_route(now, status=503)
+    with pytest.raises(globus_sdk.GlobusAPIError):
+        client.get("/foo")
+    assert len(responses.calls) == 6
+    assert sent_timeouts(client) == [60] * 6
+
+
+def test_success_within_deadline(client, now):
+    register_api_route("transfer", "/foo", json={"x": 1})
+    with client.transport.tune(deadline=120):
+        assert client.get("/foo")["x"] == 1
+    # the attempt timeout is not shortened if the deadline is further away
+    assert sent_timeouts(client) == [60]
+
+
+def test_deadline_limits_retries_and_timeouts(client, now):
+    register_slow_route(now, status=503)
+    with client.transport.tune(deadline=10):
+        with pytest.raises(globus_sdk.GlobusDeadlineExceededError) as excinfo:
+            client.get("/foo")
+
+    # attempts at t=0 and t=5, each taking 1s; there is no time to sleep again
+    assert len(responses.calls) == 2
+    assert sent_timeouts(client) == [10, 5]
+    err = excinfo.value
+    assert isinstance(err, globus_sdk.GlobusTimeoutError)
+    assert err.last_response.status_code == 503
+    assert isinstance(err.underlying_exception, requests.Timeout)
+
+
+def test_shortened_timeout_raises_deadline_error(client, now):
+    timeout = requests.ReadTimeout("read timed out")
+    register_slow_route(now, seconds=10, exception=timeout)
+    with client.transport.tune(deadline=10):
+        with pytest.raises(globus_sdk.GlobusDeadlineExceededError) as excinfo:
+            client.get("/foo")
+    assert len(responses.calls) == 1
+    assert excinfo.value.underlying_exception is timeout
+    assert excinfo.value.last_response is None
+
+
+def test_timeout_of_full_attempt_is_retried(client, now):
+    # an attempt which times out on its own (not because of the deadline) is
+    # retried, as usual
+    register_slow_route(now, seconds=2, exception=requests.ReadTimeout())
+    register_api_route("transfer", "/foo", json={"x": 1})
+    client.transport.http_timeout = 2
+    assert client.request("GET", "/foo", deadline=10)["x"] == 1
+    assert sent_timeouts(client) == [2, 2]
+
+
+def test_per_call_deadline_overrides_transport(client, now):
+    register_slow_route(now, status=503)
+    client.transport.deadline = 1000
+    with pytest.raises(globus_sdk.GlobusDeadlineExceededError):
+        client.request("GET", "/foo", deadline=3)
+    assert len(responses.calls) == 1
+    assert sent_timeouts(client) == [3]
+
+
+def test_verb_helpers_accept_a_deadline(client, now):
+    register_slow_route(now, status=503)
+    with pytest.raises(globus_sdk.GlobusDeadlineExceededError):
+        client.get("/foo", deadline=3)
+    assert len(responses.calls) == 1
+    assert sent_timeouts(client) == [3]
+
+    responses.add(responses.DELETE, URL, json={})
+    client.delete("/foo", deadline=7)
+    assert sent_timeouts(client)[-1] == 7
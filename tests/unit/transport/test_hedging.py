@@ -0,0 +1,286 @@
+import threading
+import time
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import CircuitBreaker, HedgingPolicy, RateLimiter
+
+URL = "https://transfer.api.globus.org/v0.10/foo"
+
+
+@pytest.fixture
+def policy():
+    policy = HedgingPolicy(initial_delay=0.01, max_extra_load=1)
+    yield policy
+    policy.shutdown()
+
+
+@pytest.fixture
+def client(policy):
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient(
+        authorizer=globus_sdk.AccessTokenAuthorizer("token"),
+        transport_params={"hedging_policy": policy},
+    )
+
+
+def make_send(delays, error=None):
+    """
+    A send function whose calls take the given number of seconds, in order, and then
+    return a response with the number of the call, or raise ``error``.
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def send(prepared, **kwargs):
+        with lock:
+            number = len(calls)
+            calls.append(prepared)
+        threading.Event().wait(delays[number])
+        if error is not None:
+            raise error
+        response = requests.Response()
+        response.status_code = 200
+        response._content = str(number).encode()
+        response._content_consumed = True
+        return response
+
+    return send, calls
+
+
+def test_delay_is_percentile_of_samples():
+    policy = HedgingPolicy(percentile=95, min_samples=10, initial_delay=0.5)
+    assert policy.get_delay(URL) == 0.5
+    for seconds in range(1, 101):
+        policy.record_latency(URL, seconds)
+    assert policy.get_delay(URL) == 95
+    # samples are kept for each host
+    assert policy.get_delay("https://auth.globus.org/") == 0.5
+    assert HedgingPolicy().get_delay(URL) is None
+
+
+def test_unhedged_requests_record_latency():
+    policy = HedgingPolicy(min_samples=1)
+    send, calls = make_send([0])
+    prepared = requests.Request("GET", URL).prepare()
+    assert policy.send(send, prepared).content == b"0"
+    assert len(calls) == 1
+    assert policy.get_delay(URL) is not None
+
+
+def test_fast_response_is_not_hedged(policy):
+    send, calls = make_send([0])
+    policy.initial_delay = 5
+    policy.send(send, requests.Request("GET", URL).prepare())
+    assert len(calls) == 1
+    assert policy.hedges_sent == 0
+
+
+def test_slow_response_is_hedged(policy):
+    send, calls = make_send([5, 0])
+    prepared = requests.Request("GET", URL, headers={"Authorization": "x"}).prepare()
+    assert policy.send(send, prepared).content == b"1"
+    assert len(calls) == 2
+    # the copy is a separate request, with the same headers
+    assert calls[1] is not prepared
+    assert calls[1].headers["Authorization"] == "x"
+    assert (policy.hedges_sent, policy.hedges_won) == (1, 1)
+
+
+def test_original_response_can_win(policy):
+    send, calls = make_send([0.05, 5])
+    assert policy.send(send, requests.Request("GET", URL).prepare()).content == b"0"
+    assert (policy.hedges_sent, policy.hedges_won) == (1, 0)
+
+
+def test_extra_load_is_capped():
+    policy = HedgingPolicy(initial_delay=0.01, max_extra_load=0.5)
+    send, calls = make_send([0.05] * 10)
+    for _ in range(3):
+        policy.send(send, requests.Request("GET", URL).prepare())
+    policy.shutdown()
+    # the first and third requests are hedged
+    assert policy.requests_sent == 3
+    assert policy.hedges_sent == 2
+    assert len(calls) == 5
+
+
+def test_only_copies_use_the_thread_pool(policy):
+    threads = []
+
+    def send(prepared, **kwargs):
+        threads.append(threading.current_thread())
+        threading.Event().wait(0.05 if len(threads) == 1 else 0)
+        response = requests.Response()
+        response.status_code = 200
+        response._content_consumed = True
+        return response
+
+    policy.max_workers = 1
+    policy.send(send, requests.Request("GET", URL).prepare())
+    primary, hedge = threads
+    assert primary.name.startswith("globus-sdk-hedge-primary_")
+    assert hedge.name.startswith("globus-sdk-hedge_")
+
+    # without a hedge available, the request is sent on the calling thread
+    threads.clear()
+    policy.max_extra_load = 0.01
+    policy.send(send, requests.Request("GET", URL).prepare())
+    assert threads == [threading.current_thread()]
+    assert policy.hedges_sent == 1
+
+
+def test_original_requests_reuse_pooled_threads(policy):
+    threads = []
+
+    def send(prepared, **kwargs):
+        threads.append(threading.current_thread())
+        response = requests.Response()
+        response.status_code = 200
+        response._content_consumed = True
+        return response
+
+    policy.initial_delay = 5
+    policy.max_workers = 1
+    for _ in range(3):
+        policy.send(send, requests.Request("GET", URL).prepare())
+    assert len(set(threads)) == 1
+    assert threads[0].name.startswith("globus-sdk-hedge-primary_")
+
+
+def test_request_is_unhedged_when_primary_threads_are_busy(policy):
+    release = threading.Event()
+    threads = []
+
+    def send(prepared, **kwargs):
+        threads.append(threading.current_thread())
+        if len(threads) == 1:
+            release.wait(timeout=5)
+        response = requests.Response()
+        response.status_code = 200
+        response._content_consumed = True
+        return response
+
+    policy.initial_delay = 5
+    policy.max_workers = 1
+    blocked = threading.Thread(
+        target=policy.send, args=(send, requests.Request("GET", URL).prepare())
+    )
+    blocked.start()
+    while not threads:
+        threading.Event().wait(0.001)
+
+    policy.send(send, requests.Request("GET", URL).prepare())
+    assert threads[1] is threading.current_thread()
+    release.set()
+    blocked.join(timeout=5)
+    assert policy.hedges_sent == 0
+
+
+def test_error_before_delay_is_raised(policy):
+    send, calls = make_send([0], error=requests.ConnectionError("down"))
+    policy.initial_delay = 5
+    with pytest.raises(requests.ConnectionError):
+        policy.send(send, requests.Request("GET", URL).prepare())
+    assert len(calls) == 1
+
+
+def test_error_is_raised_if_both_copies_fail(policy):
+    send, calls = make_send([0.05, 0.05], error=requests.ConnectionError("down"))
+    with pytest.raises(requests.ConnectionError):
+        policy.send(send, requests.Request("GET", URL).prepare())
+    assert len(calls) == 2
+
+
+def test_copy_takes_a_rate_limit_token(policy):
+    limiter = RateLimiter(initial_rate=1, burst=2)
+    send, calls = make_send([0.05, 0.05, 0.05])
+    policy.send(send, requests.Request("GET", URL).prepare(), rate_limiter=limiter)
+    assert policy.hedges_sent == 1
+    # the transport took a token for the original, and there is none left
+    limiter.acquire(URL)
+    policy.send(send, requests.Request("GET", URL).prepare(), rate_limiter=limiter)
+    assert policy.hedges_sent == 1
+    assert len(calls) == 3
+
+
+def test_copy_is_not_sent_unless_circuit_is_closed(policy):
+    breaker = CircuitBreaker(min_requests=1, failure_threshold=0.5)
+    breaker.record_result(URL, True)
+    send, calls = make_send([0.05])
+    prepared = requests.Request("GET", URL).prepare()
+    policy.send(send, prepared, circuit_breaker=breaker)
+    assert len(calls) == 1
+    assert policy.hedges_sent == 0
+
+
+def test_unused_result_is_recorded_by_circuit_breaker(policy):
+    breaker = CircuitBreaker(min_requests=2, failure_threshold=0.5)
+    send, calls = make_send([0.2, 0])
+    prepared = requests.Request("GET", URL).prepare()
+    assert policy.send(send, prepared, circuit_breaker=breaker).content == b"1"
+    # the original request is recorded when it finishes, after the copy won
+    circuit = breaker._circuits[breaker._host(URL)]
+    deadline = time.monotonic() + 5
+    while not circuit.results:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert list(circuit.results)[0][1] is False
+
+
+def test_transport_hedges_gets(client, policy):
+    release = threading.Event()
+    bodies = iter(['{"copy": false}', '{"copy": true}'])
+    requests_seen = []
+
+    def callback(request):
+        requests_seen.append(request)
+        body = next(bodies)
+        if body == '{"copy": false}':
+            release.wait(timeout=5)
+        return (200, {"Content-Type": "application/json"}, body)
+
+    responses.add_callback(responses.GET, URL, callback=callback)
+    try:
+        res = client.get("/foo")
+    finally:
+        release.set()
+    assert res["copy"] is True
+    # the original request may still be finishing, so it is not in responses.calls
+    assert len(requests_seen) == 2
+    assert all(
+        request.headers["Authorization"] == "Bearer token" for request in requests_seen
+    )
+
+
+def test_transport_does_not_hedge_other_methods(client, policy):
+    responses.add(responses.POST, URL, json={})
+    client.post("/foo", data={})
+    assert policy.requests_sent == 0
+
+
+def test_tune_enables_hedging(client, policy):
+    other = HedgingPolicy()
+    with client.transport.tune(hedging_policy=other):
+        assert client.transport.hedging_policy is other
+    assert client.transport.hedging_policy is policy
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"percentile": 100},
+        {"min_samples": 0},
+        {"min_samples": 200, "sample_size": 100},
+        {"max_extra_load": 0},
+    ],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        HedgingPolicy(**kwargs)
@@ -0,0 +1,225 @@
+import threading
+import time
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import (
+    RequestCoalescer,
+    RequestHooks,
+    ResponseCache,
+    RetryBudget,
+    template_path,
+)
+from tests.common import register_api_route
+
+UUID = "ddb59aef-6d04-11e5-ba46-22000b92c6ec"
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def hooks(events):
+    hooks = RequestHooks()
+    for event in RequestHooks.EVENTS:
+        hooks.register(event, events.append)
+    return hooks
+
+
+@pytest.fixture
+def client(hooks):
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient(transport_params={"hooks": hooks})
+
+
+@pytest.mark.parametrize(
+    "url, expect",
+    [
+        ("https://transfer.api.globus.org/v0.10/task_list", "/v0.10/task_list"),
+        (f"https://x.org/endpoint/{UUID}/ls?path=/", "/endpoint/{uuid}/ls"),
+        (f"https://x.org/endpoint/{UUID.upper()}", "/endpoint/{uuid}"),
+        ("https://x.org/v2/groups/12/members", "/v2/groups/{id}/members"),
+        ("https://x.org/v0.10/", "/v0.10/"),
+    ],
+)
+def test_template_path(url, expect):
+    assert template_path(url) == expect
+
+
+def test_successful_request_events(client, events):
+    register_api_route("transfer", f"/endpoint/{UUID}", method="PUT", json={"x": 1})
+    client.put(f"/endpoint/{UUID}", data={"y": 2})
+
+    assert [e.name for e in events] == ["on_request_start", "on_attempt", "on_response"]
+    assert all(e.method == "PUT" for e in events)
+    assert all(e.path_template == "/v0.10/endpoint/{uuid}" for e in events)
+    response = events[-1]
+    assert response.attempt == 0
+    assert response.status_code == 200
+    assert response.bytes_sent == len(b'{"y": 2}')
+    assert response.bytes_received == len(b'{"x": 1}')
+    assert response.elapsed >= 0
+    assert response.retry is False
+
+
+def test_retried_request_events(client, events):
+    register_api_route("transfer", "/foo", status=503, json={})
+    register_api_route("transfer", "/foo", json={})
+    client.get("/foo")
+
+    assert [e.name for e in events] == [
+        "on_request_start",
+        "on_attempt",
+        "on_response",
+        "on_retry_sleep",
+        "on_attempt",
+        "on_response",
+    ]
+    assert [(e.status_code, e.retry) for e in events if e.name == "on_response"] == [
+        (503, True),
+        (200, False),
+    ]
+    assert events[3].attempt == 0
+    assert events[3].sleep > 0
+
+
+def test_error_events(client, events):
+    responses.add(
+        responses.GET,
+        "https://transfer.api.globus.org/v0.10/foo",
+        body=requests.ConnectionError("down"),
+    )
+    with client.transport.tune(max_retries=1):
+        with pytest.raises(globus_sdk.GlobusConnectionError):
+            client.get("/foo")
+
+    errors = [e for e in events if e.name == "on_error"]
+    assert [e.retry for e in errors] == [True, False]
+    assert all(isinstance(e.exception, requests.ConnectionError) for e in errors)
+
+
+def test_retry_prevented_by_budget_is_not_reported(client, events):
+    register_api_route("transfer", "/foo", status=503, json={})
+    budget = RetryBudget(min_retries_per_second=0, max_tokens=1)
+    budget.try_spend()
+    with client.transport.tune(retry_budget=budget):
+        with pytest.raises(globus_sdk.GlobusAPIError):
+            client.get("/foo")
+
+    assert [e.name for e in events] == ["on_request_start", "on_attempt", "on_response"]
+    assert events[-1].retry is False
+
+
+def test_retry_prevented_by_deadline_is_not_reported(client, events):
+    register_api_route(
+        "transfer", "/foo", status=503, json={}, adding_headers={"Retry-After": "5"}
+    )
+    with pytest.raises(globus_sdk.GlobusDeadlineExceededError):
+        client.request("GET", "/foo", deadline=1)
+
+    assert [e.name for e in events] == ["on_request_start", "on_attempt", "on_response"]
+    assert events[-1].retry is False
+
+
+def test_cached_response_events(client, events):
+    register_api_route(
+        "transfer",
+        "/foo",
+        json={"x": 1},
+        adding_headers={"Cache-Control": "max-age=60"},
+    )
+    with client.transport.tune(response_cache=ResponseCache()):
+        client.get("/foo")
+        events.clear()
+        client.get("/foo")
+
+    assert [e.name for e in events] == ["on_request_start", "on_response"]
+    assert events[-1].attempt is None
+    assert events[-1].status_code == 200
+    assert events[-1].bytes_received == len(b'{"x": 1}')
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_coalesced_request_events(client, events, fails):
+    coalescer = RequestCoalescer()
+    client.transport.request_coalescer = coalescer
+    url = "https://transfer.api.globus.org/v0.10/foo"
+    flight, _ = coalescer.join(
+        requests.Request("GET", url, headers={"Accept": "application/json"})
+    )
+
+    errors = []
+
+    def get():
+        try:
+            client.get("/foo")
+        except Exception as err:
+            errors.append(err)
+
+    follower = threading.Thread(target=get)
+    follower.start()
+    while not flight.waiters:
+        time.sleep(0.001)
+    if fails:
+        coalescer.finish(flight, error=ValueError("failed"))
+    else:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        coalescer.finish(flight, response=response)
+    follower.join(timeout=5)
+
+    assert len(errors) == int(fails)
+    assert [e.name for e in events] == [
+        "on_request_start",
+        "on_error" if fails else "on_response",
+    ]
+    assert events[-1].attempt is None
+    if fails:
+        assert isinstance(events[-1].exception, ValueError)
+
+
+def test_errors_in_hooks_are_logged(client, hooks, caplog):
+    def broken(event):
+        raise ValueError("oops")
+
+    hooks.register("on_response", broken)
+    register_api_route("transfer", "/foo", json={"x": 1})
+    assert client.get("/foo")["x"] == 1
+    assert "error in request hook for on_response" in caplog.text
+
+
+def test_hooks_can_be_registered_on_transport(events):
+    client = globus_sdk.TransferClient()
+    assert not client.transport.hooks
+    client.transport.hooks.register("on_response", events.append)
+    assert client.transport.hooks.has_hooks("on_response")
+    assert not client.transport.hooks.has_hooks("on_error")
+
+    register_api_route("transfer", "/foo", json={})
+    client.get("/foo")
+    assert [e.name for e in events] == ["on_response"]
+
+    client.transport.hooks.unregister("on_response", events.append)
+    client.get("/foo")
+    assert len(events) == 1
+
+
+def test_tune_sets_hooks(client, hooks):
+    other = RequestHooks()
+    with client.transport.tune(hooks=other):
+        assert client.transport.hooks is other
+    assert client.transport.hooks is hooks
+
+
+def test_unknown_event():
+    with pytest.raises(ValueError, match="Unknown request event"):
+        RequestHooks().register("on_something", print)
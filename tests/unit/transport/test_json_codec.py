@@ -0,0 +1,151 @@
+import json
+from unittest import mock
+
+import pytest
+
+import globus_sdk
+from globus_sdk._testing import get_last_request
+from globus_sdk.response import GlobusHTTPResponse
+from globus_sdk.transport import (
+    JSONCodec,
+    OrjsonJSONCodec,
+    RequestsTransport,
+    StdlibJSONCodec,
+    get_json_codec,
+)
+from tests.common import register_api_route
+
+
+class UpperKeysCodec(JSONCodec):
+    """a codec which uppercases the keys of parsed objects, to show it was used"""
+
+    name = "upper"
+
+    def dumps(self, data):
+        return json.dumps(data).encode("utf-8")
+
+    def loads(self, content):
+        return json.loads(
+            content, object_hook=lambda d: {k.upper(): v for k, v in d.items()}
+        )
+
+
+@pytest.fixture
+def client_class():
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient
+
+
+def test_codec_must_implement_dumps_and_loads():
+    class DumpsOnlyCodec(JSONCodec):
+        def dumps(self, data):
+            return b"{}"
+
+    with pytest.raises(TypeError):
+        DumpsOnlyCodec()
+
+
+def test_default_codec_is_stdlib(monkeypatch):
+    monkeypatch.delenv("GLOBUS_SDK_JSON_CODEC", raising=False)
+    assert isinstance(RequestsTransport().json_codec, StdlibJSONCodec)
+    assert isinstance(get_json_codec(), StdlibJSONCodec)
+
+
+def test_codec_from_env_var(monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setenv("GLOBUS_SDK_JSON_CODEC", "orjson")
+    assert isinstance(RequestsTransport().json_codec, OrjsonJSONCodec)
+    # an explicit value takes precedence
+    assert isinstance(
+        RequestsTransport(json_codec="stdlib").json_codec, StdlibJSONCodec
+    )
+
+
+def test_auto_codec_falls_back_to_stdlib():
+    with mock.patch.dict("sys.modules", {"orjson": None}):
+        assert isinstance(get_json_codec("auto"), StdlibJSONCodec)
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError, match="Unknown JSON codec 'simdjson'"):
+        RequestsTransport(json_codec="simdjson")
+
+
+def test_codec_object_is_used_as_is():
+    codec = UpperKeysCodec()
+    assert RequestsTransport(json_codec=codec).json_codec is codec
+
+
+def test_stdlib_codec_does_not_change_encoders():
+    assert RequestsTransport().encoders is RequestsTransport.encoders
+
+
+@pytest.mark.parametrize("codec_name", ["stdlib", "orjson"])
+def test_request_and_response_json_roundtrip(client_class, codec_name):
+    if codec_name == "orjson":
+        pytest.importorskip("orjson")
+    client = client_class(transport_params={"json_codec": codec_name})
+    register_api_route(
+        "transfer", "/foo", method="POST", json={"x": "y", "items": [1, 2, 3]}
+    )
+
+    data = {"DATA_TYPE": "foo", "names": ["a", "é"], "n": 1.5}
+    res = client.post("/foo", data=data)
+
+    req = get_last_request()
+    assert req.headers["Content-Type"] == "application/json"
+    assert json.loads(req.body) == data
+    assert res.data == {"x": "y", "items": [1, 2, 3]}
+
+
+def test_custom_codec_is_used_for_requests_and_responses(client_class):
+    client = client_class(transport_params={"json_codec": UpperKeysCodec()})
+    register_api_route("transfer", "/foo", method="PUT", json={"x": "y"})
+
+    res = client.put("/foo", data={"a": "b"})
+
+    assert get_last_request().body == b'{"a": "b"}'
+    assert res.data == {"X": "y"}
+    assert res["X"] == "y"
+
+
+def test_custom_codec_is_used_for_error_responses(client_class):
+    client = client_class(transport_params={"json_codec": UpperKeysCodec()})
+    register_api_route("transfer", "/foo", status=404, json={"code": "NotFound"})
+
+    with pytest.raises(globus_sdk.GlobusAPIError) as excinfo:
+        client.get("/foo")
+    assert excinfo.value.raw_json == {"CODE": "NotFound"}
+
+
+def test_request_without_data_has_no_body(client_class):
+    client = client_class(transport_params={"json_codec": UpperKeysCodec()})
+    register_api_route("transfer", "/foo", json={})
+
+    client.get("/foo")
+
+    req = get_last_request()
+    assert req.body is None
+    assert "Content-Type" not in req.headers
+
+
+def test_invalid_json_response_with_codec(client_class):
+    pytest.importorskip("orjson")
+    client = client_class(transport_params={"json_codec": "orjson"})
+    register_api_route("transfer", "/foo", body="not json")
+
+    res = client.get("/foo")
+    assert res.data is None
+    assert res.text == "not json"
+
+
+def test_response_without_transport_codec_uses_stdlib():
+    raw = mock.Mock()
+    raw.json.return_value = {"x": 1}
+    # clients which are mocks do not have a usable codec
+    res = GlobusHTTPResponse(raw, client=mock.Mock())
+    assert res.data == {"x": 1}
+    raw.json.assert_called_once_with()
@@ -0,0 +1,175 @@
+from unittest import mock
+
+import pytest
+import responses
+
+import globus_sdk
+from globus_sdk.transport import RateLimiter
+from tests.common import register_api_route
+
+URL = "https://transfer.api.globus.org/v0.10/foo"
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+@pytest.fixture
+def client_class():
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient
+
+
+def test_burst_then_rate(now):
+    limiter = RateLimiter(initial_rate=4, burst=2)
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == pytest.approx(0.25)
+    assert limiter.acquire(URL) == pytest.approx(0.5)
+
+    # the tokens are refilled over time, up to the burst size
+    now.return_value += 10
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == pytest.approx(0.25)
+
+
+def test_hosts_are_limited_separately(now):
+    limiter = RateLimiter(initial_rate=1, burst=1)
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire("https://auth.globus.org/v2/oauth2/token") == 0
+    assert limiter.acquire("https://transfer.api.globus.org/v0.10/bar") == 1
+
+
+def test_429_decreases_rate_once_per_cooldown(now):
+    limiter = RateLimiter(initial_rate=8, min_rate=1.5)
+    limiter.record_response(URL, 429)
+    assert limiter.get_rate(URL) == 4
+    # a 429 to a request which was already in flight
+    limiter.record_response(URL, 429)
+    assert limiter.get_rate(URL) == 4
+
+    now.return_value += RateLimiter.DECREASE_COOLDOWN
+    limiter.record_response(URL, 429)
+    assert limiter.get_rate(URL) == 2
+    now.return_value += RateLimiter.DECREASE_COOLDOWN
+    limiter.record_response(URL, 429)
+    assert limiter.get_rate(URL) == 1.5
+
+
+def test_success_increases_rate(now):
+    limiter = RateLimiter(initial_rate=2, max_rate=3, additive_increase=1)
+    limiter.record_response(URL, 200)
+    assert limiter.get_rate(URL) == 2.5
+    limiter.record_response(URL, 200)
+    limiter.record_response(URL, 200)
+    assert limiter.get_rate(URL) == 3
+    # other errors do not change the rate
+    limiter.record_response(URL, 500)
+    assert limiter.get_rate(URL) == 3
+
+
+def test_retry_after_blocks_the_host(now):
+    limiter = RateLimiter(burst=5)
+    limiter.record_response(URL, 503, retry_after=7)
+    assert limiter.get_rate(URL) == limiter.initial_rate
+    assert limiter.acquire(URL) == 7
+    now.return_value += 7
+    # the waiting requests are not sent in a burst after the block
+    assert limiter.acquire(URL) == pytest.approx(0.1)
+    assert limiter.acquire(URL) == pytest.approx(0.2)
+
+
+def test_requests_waiting_for_a_block_are_spaced_out(now):
+    limiter = RateLimiter(initial_rate=1)
+    limiter.record_response(URL, 429, retry_after=10)
+    assert limiter.get_rate(URL) == 0.5
+    delays = [limiter.acquire(URL) for _ in range(5)]
+    assert delays == [pytest.approx(d) for d in (10, 12, 14, 16, 18)]
+
+
+def test_release_returns_a_token(now):
+    limiter = RateLimiter(initial_rate=1, burst=1)
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == 1
+    limiter.release(URL)
+    assert limiter.acquire(URL) == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_rate": 0},
+        {"initial_rate": 5, "max_rate": 2},
+        {"initial_rate": 0.01},
+        {"burst": 0},
+        {"multiplicative_decrease": 1},
+    ],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
+
+
+def test_transport_waits_for_rate_limit(client_class, now, mocksleep):
+    limiter = RateLimiter(initial_rate=2, burst=1, additive_increase=0)
+    client = client_class(transport_params={"rate_limiter": limiter})
+    register_api_route("transfer", "/foo", json={})
+
+    client.get("/foo")
+    mocksleep.assert_not_called()
+    client.get("/foo")
+    mocksleep.assert_called_once_with(0.5)
+
+
+def test_transport_adapts_to_429(client_class, now, mocksleep):
+    def sleep(seconds):
+        now.return_value += seconds
+
+    mocksleep.side_effect = sleep
+    limiter = RateLimiter(initial_rate=4)
+    client = client_class(transport_params={"rate_limiter": limiter, "max_sleep": 30})
+    register_api_route(
+        "transfer",
+        "/foo",
+        status=429,
+        json={},
+        adding_headers={"Retry-After": "60"},
+    )
+    register_api_route("transfer", "/foo", json={})
+
+    client.get("/foo")
+    assert len(responses.calls) == 2
+    # the rate was halved, then increased by the success
+    assert limiter.get_rate(URL) == pytest.approx(2.5)
+    # the retry waits for Retry-After (limited to max_sleep), and is then the first
+    # request sent after the block, so the limiter does not delay it further
+    assert mocksleep.call_args_list == [mock.call(30)]
+    assert limiter.acquire(URL) == pytest.approx(0.4)
+
+
+def test_tune_enables_rate_limiter(client_class):
+    limiter = RateLimiter()
+    client = client_class()
+    with client.transport.tune(rate_limiter=limiter):
+        assert client.transport.rate_limiter is limiter
+    assert client.transport.rate_limiter is None
+
+
+def test_transport_releases_token_when_deadline_would_pass(client_class, now):
+    limiter = RateLimiter(initial_rate=1, burst=1, additive_increase=0)
+    client = client_class(transport_params={"rate_limiter": limiter})
+    register_api_route("transfer", "/foo", json={})
+
+    client.get("/foo")
+    with pytest.raises(globus_sdk.GlobusDeadlineExceededError):
+        client.request("GET", "/foo", deadline=0.5)
+    assert len(responses.calls) == 1
+    # the abandoned request did not keep its place in line
+    assert limiter.acquire(URL) == 1
@@ -0,0 +1,356 @@
+import threading
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk._testing import get_last_request
+from globus_sdk.transport import ResponseCache
+from tests.common import register_api_route
+
+
+def register_route(path, headers=None, **kwargs):
+    adding_headers = {"Content-Type": "application/json"}
+    adding_headers.update(headers or {})
+    register_api_route("transfer", path, adding_headers=adding_headers, **kwargs)
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache()
+
+
+@pytest.fixture
+def client_class():
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient
+
+
+@pytest.fixture
+def client(client_class, cache):
+    return client_class(transport_params={"response_cache": cache})
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+def test_no_cache_by_default(client_class):
+    client = client_class()
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    client.get("/foo")
+    client.get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_max_age_response_is_reused(client, cache, now):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+
+    first = client.get("/foo")
+    second = client.get("/foo")
+    assert len(responses.calls) == 1
+    assert first.data == second.data == {"x": 1}
+    assert first.http_status == second.http_status == 200
+    # each response is a separate object
+    assert first._raw_response is not second._raw_response
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    now.return_value += 61
+    client.get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_age_header_reduces_freshness(client, now):
+    register_route(
+        "/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60", "Age": "50"}
+    )
+    client.get("/foo")
+    now.return_value += 11
+    client.get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_query_params_are_part_of_the_key(client):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    client.get("/foo", query_params={"a": "1"})
+    client.get("/foo", query_params={"a": "2"})
+    client.get("/foo", query_params={"a": "1"})
+    assert len(responses.calls) == 2
+
+
+def test_authorization_is_part_of_the_key(client_class, cache):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    for token in ("token1", "token2", "token1"):
+        client_class(
+            authorizer=globus_sdk.AccessTokenAuthorizer(token),
+            transport_params={"response_cache": cache},
+        ).get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_content_negotiation_headers_are_part_of_the_key(client):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    client.get("/foo")
+    client.get("/foo", headers={"Accept": "text/csv"})
+    client.get("/foo", headers={"X-Request-Id": "1"})
+    assert len(responses.calls) == 2
+
+
+def test_callers_conditional_request_is_not_answered_from_cache(client, cache):
+    register_route("/foo", json={"x": 1}, headers={"ETag": "v1"})
+    register_route("/foo", body="", status=304)
+
+    client.get("/foo")
+    res = client.get("/foo", headers={"If-None-Match": "v0"})
+    assert get_last_request().headers["If-None-Match"] == "v0"
+    assert res.http_status == 304
+    assert cache.stats.revalidations == 0
+    # the cached response is kept
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize(
+    "validator_header, conditional_header",
+    [("ETag", "If-None-Match"), ("Last-Modified", "If-Modified-Since")],
+)
+def test_revalidation_with_304(client, cache, validator_header, conditional_header):
+    register_route("/foo", json={"x": 1}, headers={validator_header: "v1"})
+    register_route("/foo", body="", status=304)
+
+    assert conditional_header not in client.get("/foo")._raw_response.request.headers
+    res = client.get("/foo")
+    assert get_last_request().headers[conditional_header] == "v1"
+    assert res.http_status == 200
+    assert res.data == {"x": 1}
+    assert cache.stats.revalidations == 1
+
+
+def test_revalidation_with_new_response(client):
+    register_route("/foo", json={"x": 1}, headers={"ETag": "v1"})
+    register_route("/foo", json={"x": 2}, headers={"ETag": "v2"})
+    register_route("/foo", body="", status=304)
+
+    assert client.get("/foo")["x"] == 1
+    assert client.get("/foo")["x"] == 2
+    assert client.get("/foo")["x"] == 2
+    assert get_last_request().headers["If-None-Match"] == "v2"
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Cache-Control": "no-store, max-age=60"},
+        {"Cache-Control": "no-store", "ETag": "v1"},
+    ],
+)
+def test_uncacheable_responses(client, cache, headers):
+    register_route("/foo", json={"x": 1}, headers=headers)
+    client.get("/foo")
+    client.get("/foo")
+    assert len(responses.calls) == 2
+    assert len(cache) == 0
+
+
+def test_error_responses_are_not_cached(client_class, cache):
+    client = client_class(transport_params={"response_cache": cache, "max_retries": 0})
+    register_route(
+        "/foo",
+        json={"code": "NotFound"},
+        status=404,
+        headers={"Cache-Control": "max-age=60"},
+    )
+    for _ in range(2):
+        with pytest.raises(globus_sdk.GlobusAPIError):
+            client.get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_other_methods_invalidate_the_url(client, cache):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    register_route("/foo", method="PUT", json={})
+    client.get("/foo")
+    client.put("/foo", data={"x": 2})
+    assert len(cache) == 0
+    client.get("/foo")
+    assert len(responses.calls) == 3
+
+
+def test_eviction_by_count(client_class, now):
+    cache = ResponseCache(maxsize=2)
+    client = client_class(transport_params={"response_cache": cache})
+    for path in ("/a", "/b", "/c"):
+        register_route(path, json={}, headers={"Cache-Control": "max-age=60"})
+
+    client.get("/a")
+    client.get("/b")
+    client.get("/a")  # /b is now the least recently used
+    client.get("/c")
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    client.get("/a")
+    client.get("/b")
+    assert len(responses.calls) == 4
+
+
+def test_eviction_by_size(client_class):
+    cache = ResponseCache(max_bytes=25)
+    client = client_class(transport_params={"response_cache": cache})
+    register_route("/a", body="a" * 10, headers={"Cache-Control": "max-age=60"})
+    register_route("/b", body="b" * 20, headers={"Cache-Control": "max-age=60"})
+    register_route("/c", body="c" * 30, headers={"Cache-Control": "max-age=60"})
+
+    client.get("/a")
+    client.get("/b")
+    assert len(cache) == 1
+    # a body larger than the limit is not cached at all
+    client.get("/c")
+    assert len(cache) == 1
+    client.get("/b")
+    assert len(responses.calls) == 3
+
+
+def test_concurrent_updates_replace_the_entry(cache):
+    req = requests.Request("GET", "https://example.org/foo")
+    # both updates read their bodies at once, as if they were in flight together
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowResponse(requests.Response):
+        @property
+        def content(self):
+            barrier.wait()
+            return b"x" * 10
+
+    def make_response(response_class):
+        response = response_class()
+        response.status_code = 200
+        response.headers["Cache-Control"] = "max-age=60"
+        response._content = b"x" * 10
+        return response
+
+    # a response is already cached for the key
+    cache.update(req, make_response(requests.Response))
+    threads = [
+        threading.Thread(target=cache.update, args=(req, make_response(SlowResponse)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 1
+    assert cache._size == 10
+
+
+def test_tune_enables_cache(client_class, cache):
+    client = client_class()
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    with client.transport.tune(response_cache=cache):
+        client.get("/foo")
+        client.get("/foo")
+    assert client.transport.response_cache is None
+    client.get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_writes_after_tune_invalidate_the_url(client_class, cache):
+    client = client_class()
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    register_route("/foo", method="PUT", json={})
+    with client.transport.tune(response_cache=cache):
+        client.get("/foo")
+    client.put("/foo", data={"x": 2})
+    assert len(cache) == 0
+
+
+def test_opt_in_cache(client_class):
+    cache = ResponseCache(opt_in=True)
+    client = client_class(transport_params={"response_cache": cache})
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+
+    client.get("/foo")
+    assert len(cache) == 0
+    client.get("/foo", use_response_cache=True)
+    client.get("/foo", use_response_cache=True)
+    assert len(responses.calls) == 2
+
+
+def test_cached_methods_use_opt_in_cache(client_class):
+    class FooClient(client_class):
+        def get_foo(self):
+            return self.get("/foo")
+
+    cache = ResponseCache(opt_in=True)
+    client = FooClient(transport_params={"response_cache": cache})
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+
+    # calls of the client itself are not cached
+    client.get_foo()
+    assert len(cache) == 0
+    first = client.cached.get_foo()
+    second = client.cached.get_foo()
+    assert first["x"] == second["x"] == 1
+    assert len(responses.calls) == 2
+    assert cache.stats.hits == 1
+    # an explicit choice is kept
+    client.cached.get("/foo", use_response_cache=False)
+    assert len(responses.calls) == 3
+    client.get_foo()
+    assert len(responses.calls) == 4
+
+    # the copy shares the transport and the authorizer of the client
+    assert client.cached.transport is client.transport
+    assert client.cached.paginated._client is not client
+
+
+def test_use_response_cache_false(client, cache):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    client.get("/foo")
+    client.get("/foo", use_response_cache=False)
+    assert len(responses.calls) == 2
+    assert cache.stats.hits == 0
+
+
+def test_revalidated_response_evicted_in_flight(client, cache):
+    register_route("/foo", json={"x": 1}, headers={"ETag": "v1"})
+    client.get("/foo")
+
+    def not_modified(request):
+        # the cached response is evicted while the request is in flight
+        cache.clear()
+        return (304, {}, "")
+
+    responses.add_callback(
+        responses.GET, "https://transfer.api.globus.org/v0.10/foo", not_modified
+    )
+    register_route("/foo", json={"x": 2}, headers={"ETag": "v2"})
+
+    res = client.get("/foo")
+    assert res.http_status == 200
+    assert res["x"] == 2
+    assert len(responses.calls) == 3
+    assert responses.calls[1].request.headers["If-None-Match"] == "v1"
+    assert "If-None-Match" not in responses.calls[2].request.headers
+
+
+def test_clear(client, cache):
+    register_route("/foo", json={"x": 1}, headers={"Cache-Control": "max-age=60"})
+    client.get("/foo")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats.invalidations == 1
+    client.get("/foo")
+    assert len(responses.calls) == 2
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        ResponseCache(maxsize=0)
@@ -0,0 +1,131 @@
+from unittest import mock
+
+import pytest
+import requests
+import responses
+
+import globus_sdk
+from globus_sdk.transport import RetryBudget
+from tests.common import register_api_route
+
+
+@pytest.fixture
+def now():
+    with mock.patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+@pytest.fixture
+def client_class():
+    class CustomClient(globus_sdk.BaseClient):
+        base_path = "/v0.10/"
+        service_name = "transfer"
+
+    return CustomClient
+
+
+def test_spending_and_earning_tokens(now):
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=2)
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    budget.record_success()
+    assert not budget.try_spend()
+    budget.record_success()
+    assert budget.try_spend()
+    assert (budget.retries_allowed, budget.retries_denied) == (3, 2)
+
+    # the tokens are capped
+    for _ in range(10):
+        budget.record_success()
+    assert budget.tokens == 2
+
+
+def test_min_retries_per_second(now):
+    budget = RetryBudget(ratio=0, min_retries_per_second=0.5, max_tokens=1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    now.return_value += 1
+    assert not budget.try_spend()
+    now.return_value += 1
+    assert budget.try_spend()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"ratio": -1}, {"min_retries_per_second": -1}, {"max_tokens": 0.5}]
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        RetryBudget(**kwargs)
+
+
+def test_transport_stops_retrying_when_budget_is_spent(client_class, now):
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=1)
+    client = client_class(transport_params={"retry_budget": budget})
+    register_api_route("transfer", "/foo", status=503, json={})
+
+    with pytest.raises(globus_sdk.GlobusAPIError):
+        client.get("/foo")
+    assert len(responses.calls) == 2
+
+    # the budget is shared by other transports
+    other_client = client_class(transport_params={"retry_budget": budget})
+    with pytest.raises(globus_sdk.GlobusAPIError):
+        other_client.get("/foo")
+    assert len(responses.calls) == 3
+
+
+def test_transport_raises_error_when_budget_is_spent(client_class, now):
+    budget = RetryBudget(min_retries_per_second=0, max_tokens=1)
+    budget.try_spend()
+    client = client_class(transport_params={"retry_budget": budget})
+    responses.add(
+        responses.GET,
+        "https://transfer.api.globus.org/v0.10/foo",
+        body=requests.ConnectionError("down"),
+    )
+    with pytest.raises(globus_sdk.GlobusConnectionError):
+        client.get("/foo")
+    assert len(responses.calls) == 1
+
+
+def test_authorization_retry_does_not_spend_budget(client_class, now):
+    budget = RetryBudget(min_retries_per_second=0, max_tokens=1)
+    budget.try_spend()
+    authorizer = mock.Mock()
+    authorizer.get_authorization_header.return_value = "Bearer token"
+    authorizer.handle_missing_authorization.return_value = True
+    client = client_class(
+        authorizer=authorizer, transport_params={"retry_budget": budget}
+    )
+    register_api_route("transfer", "/foo", status=401, json={})
+    register_api_route("transfer", "/foo", json={"x": 1})
+
+    assert client.get("/foo")["x"] == 1
+    assert len(responses.calls) == 2
+    # only the retry spent above
+    assert (budget.retries_allowed, budget.retries_denied) == (1, 0)
+
+
+def test_successful_requests_earn_retries(client_class, now):
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=1)
+    budget.try_spend()
+    client = client_class(transport_params={"retry_budget": budget})
+    register_api_route("transfer", "/ok", json={})
+    register_api_route("transfer", "/foo", status=503, json={})
+    register_api_route("transfer", "/foo", json={"x": 1})
+
+    client.get("/ok")
+    client.get("/ok")
+    assert client.get("/foo")["x"] == 1
+    assert budget.retries_allowed == 2
+
+
+def test_tune_enables_retry_budget(client_class):
+    budget = RetryBudget()
+    client = client_class()
+    with client.transport.tune(retry_budget=budget):
+        assert client.transport.retry_budget is budget
+    assert client.transport.retry_budget is None
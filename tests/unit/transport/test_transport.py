@@ -1,5 +1,7 @@
 import pytest
+import requests
 
+import globus_sdk
 from globus_sdk.transport import RequestsTransport, RetryContext
 from globus_sdk.transport.requests import _exponential_backoff
 
@@ -34,3 +36,43 @@ def test_transport_tuning(param_name, init_value, tune_value):
         assert getattr(transport, param_name) == tune_value
 
     assert getattr(transport, param_name) == init_value
+
+
+def _https_adapter(transport):
+    return transport.session.get_adapter("https://transfer.api.globus.org/")
+
+
+def test_transport_default_pool_settings():
+    adapter = _https_adapter(RequestsTransport())
+    assert adapter._pool_connections == requests.adapters.DEFAULT_POOLSIZE
+    assert adapter._pool_maxsize == requests.adapters.DEFAULT_POOLSIZE
+    assert adapter._pool_block == requests.adapters.DEFAULT_POOLBLOCK
+
+
+def test_transport_pool_settings():
+    transport = RequestsTransport(pool_connections=4, pool_maxsize=32, pool_block=True)
+    for url in ("https://transfer.api.globus.org/", "http://localhost/"):
+        adapter = transport.session.get_adapter(url)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+
+def test_transports_can_share_a_session():
+    session = RequestsTransport.make_session(pool_maxsize=32)
+    first = RequestsTransport(session=session)
+    second = RequestsTransport(session=session)
+    assert first.session is second.session is session
+    assert _https_adapter(first)._pool_maxsize == 32
+
+
+def test_clients_can_share_a_session():
+    session = RequestsTransport.make_session()
+    tc = globus_sdk.TransferClient(transport_params={"session": session})
+    ac = globus_sdk.AuthClient(transport_params={"session": session})
+    assert tc.transport.session is ac.transport.session is session
+
+
+def test_transport_rejects_session_with_pool_settings():
+    with pytest.raises(globus_sdk.GlobusSDKUsageError, match="both a session"):
+        RequestsTransport(session=requests.Session(), pool_maxsize=32)
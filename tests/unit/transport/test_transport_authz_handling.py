@@ -1,7 +1,7 @@
 from unittest import mock
 
-from globus_sdk.authorizers import NullAuthorizer
-from globus_sdk.transport import RequestsTransport
+from globus_sdk.authorizers import AccessTokenAuthorizer, NullAuthorizer
+from globus_sdk.transport import RequestsTransport, RetryCheckResult, RetryContext
 
 
 def test_will_not_modify_authz_header_without_authorizer():
@@ -28,3 +28,18 @@ def test_will_null_authz_header_with_null_authorizer():
     request.headers["Authorization"] = "foo bar"
     transport._set_authz_header(NullAuthorizer(), request)
     assert request.headers == {}
+
+
+def test_expired_authorization_check_uses_the_rejected_header():
+    authorizer = AccessTokenAuthorizer("token")
+    authorizer.handle_rejected_authorization = mock.Mock(return_value=True)
+    response = mock.Mock(status_code=401)
+    ctx = RetryContext(
+        0, authorizer=authorizer, response=response, authorization="Bearer token"
+    )
+
+    transport = RequestsTransport()
+    result = transport.default_check_expired_authorization(ctx)
+    assert result is RetryCheckResult.do_retry
+    assert ctx.authorization_updated
+    authorizer.handle_rejected_authorization.assert_called_once_with("Bearer token")